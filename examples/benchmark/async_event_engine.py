@@ -0,0 +1,104 @@
+"""
+Benchmark of tick fan-out between threaded EventEngine and
+AsyncEventEngine.
+"""
+
+import asyncio
+from datetime import datetime
+from threading import Thread
+from time import perf_counter, sleep
+
+from vnpy.event import Event, EventEngine, AsyncEventEngine
+from vnpy.trader.constant import Exchange
+from vnpy.trader.event import EVENT_TICK
+from vnpy.trader.object import TickData
+
+
+COUNT = 100_000
+HANDLERS = 10
+
+
+def create_tick() -> TickData:
+    """"""
+    return TickData(
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        datetime=datetime.now(),
+        gateway_name="BENCH"
+    )
+
+
+def print_result(name: str, cost: float) -> None:
+    """"""
+    print(f"{name:<24} ticks/sec: {COUNT / cost:>12,.0f}    handler calls/sec: {COUNT * HANDLERS / cost:>12,.0f}")
+
+
+def run_threaded() -> None:
+    """"""
+    counter: list[int] = [0]
+    tick: TickData = create_tick()
+
+    def process_tick_event(event: Event) -> None:
+        counter[0] += 1
+
+    event_engine: EventEngine = EventEngine()
+    for _ in range(HANDLERS):
+        event_engine.register(EVENT_TICK, lambda event: process_tick_event(event))
+    event_engine.start()
+
+    start: float = perf_counter()
+    for _ in range(COUNT):
+        event_engine.put(Event(EVENT_TICK, tick, tick.vt_symbol))
+
+    while counter[0] < COUNT * HANDLERS:
+        sleep(0.001)
+
+    print_result("threaded", perf_counter() - start)
+    event_engine.stop()
+
+
+async def run_async(threadsafe: bool) -> None:
+    """"""
+    counter: list[int] = [0]
+    tick: TickData = create_tick()
+    finished: asyncio.Event = asyncio.Event()
+
+    def process_tick_event(event: Event) -> None:
+        counter[0] += 1
+
+        if counter[0] == COUNT * HANDLERS:
+            finished.set()
+
+    async def process_tick_event_async(event: Event) -> None:
+        process_tick_event(event)
+
+    event_engine: AsyncEventEngine = AsyncEventEngine()
+    for i in range(HANDLERS):
+        if i % 2:
+            event_engine.register(EVENT_TICK, lambda event: process_tick_event(event))
+        else:
+            event_engine.register(EVENT_TICK, lambda event: process_tick_event_async(event))
+    event_engine.start()
+
+    def produce() -> None:
+        for _ in range(COUNT):
+            event_engine.put(Event(EVENT_TICK, tick, tick.vt_symbol))
+
+    start: float = perf_counter()
+
+    if threadsafe:
+        Thread(target=produce).start()
+    else:
+        produce()
+
+    await finished.wait()
+
+    name: str = "async (thread producer)" if threadsafe else "async (loop producer)"
+    print_result(name, perf_counter() - start)
+    event_engine.stop()
+
+
+if __name__ == "__main__":
+    run_threaded()
+    asyncio.run(run_async(threadsafe=False))
+    asyncio.run(run_async(threadsafe=True))
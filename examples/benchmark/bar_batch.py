@@ -0,0 +1,100 @@
+"""
+Benchmark of loading bars as columnar BarBatch compared with a list of
+BarData objects, from arrays (as read from database or parquet) to
+arrays used in calculation.
+"""
+
+from datetime import datetime, timedelta
+from time import perf_counter
+
+import numpy as np
+
+from vnpy.trader.constant import Exchange, Interval
+from vnpy.trader.object import BarBatch, BarData
+
+
+COUNT = 500_000
+
+
+def load_list(data: dict[str, np.ndarray]) -> list[BarData]:
+    """"""
+    datetimes: list[datetime] = data["datetime"].tolist()
+    opens: list[float] = data["open_price"].tolist()
+    highs: list[float] = data["high_price"].tolist()
+    lows: list[float] = data["low_price"].tolist()
+    closes: list[float] = data["close_price"].tolist()
+    volumes: list[float] = data["volume"].tolist()
+
+    return [
+        BarData(
+            symbol="rb2510",
+            exchange=Exchange.SHFE,
+            datetime=datetimes[i],
+            interval=Interval.MINUTE,
+            open_price=opens[i],
+            high_price=highs[i],
+            low_price=lows[i],
+            close_price=closes[i],
+            volume=volumes[i],
+            gateway_name="DB"
+        )
+        for i in range(len(datetimes))
+    ]
+
+
+def load_batch(data: dict[str, np.ndarray]) -> BarBatch:
+    """"""
+    return BarBatch(
+        data,
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        interval=Interval.MINUTE,
+        gateway_name="DB"
+    )
+
+
+if __name__ == "__main__":
+    start_dt: datetime = datetime(2020, 1, 1)
+    close: np.ndarray = 3000 + np.cumsum(np.random.normal(size=COUNT))
+
+    data: dict[str, np.ndarray] = {
+        "datetime": np.array([start_dt + timedelta(minutes=i) for i in range(COUNT)], dtype="datetime64[us]"),
+        "open_price": close - 1,
+        "high_price": close + 2,
+        "low_price": close - 2,
+        "close_price": close,
+        "volume": np.random.randint(1, 1000, COUNT).astype(float),
+    }
+
+    start: float = perf_counter()
+    bars: list[BarData] = load_list(data)
+    closes: np.ndarray = np.array([bar.close_price for bar in bars])
+    list_cost: float = perf_counter() - start
+
+    start = perf_counter()
+    batch: BarBatch = load_batch(data)
+    batch_closes: np.ndarray = batch.close_price
+    batch_cost: float = perf_counter() - start
+
+    assert np.array_equal(closes, batch_closes)
+
+    start = perf_counter()
+    list_sum: float = sum(bar.close_price for bar in bars)
+    list_iter_cost: float = perf_counter() - start
+
+    start = perf_counter()
+    view_sum: float = sum(bar.close_price for bar in batch)
+    view_iter_cost: float = perf_counter() - start
+
+    assert abs(list_sum - view_sum) < 1e-6 * abs(list_sum)
+
+    start = perf_counter()
+    window: BarBatch = batch[-1000:]
+    slice_cost: float = perf_counter() - start
+
+    print(f"bars: {COUNT:,}    window: {len(window)}")
+    print(f"load list + column:  {list_cost * 1000:>10.2f} ms")
+    print(f"load batch + column: {batch_cost * 1000:>10.2f} ms")
+    print(f"iterate list:        {list_iter_cost * 1000:>10.2f} ms")
+    print(f"iterate views:       {view_iter_cost * 1000:>10.2f} ms")
+    print(f"slice batch:         {slice_cost * 1000:>10.3f} ms")
@@ -0,0 +1,98 @@
+"""
+Microbenchmark of EventEngine dispatch loop.
+
+Compare events/sec and put-to-handler latency between the default
+Queue based loop and the batch drain mode, both at saturation and at
+a fixed rate well below it, where latency is not dominated by the
+backlog of queued events.
+"""
+
+from collections.abc import Callable
+from threading import Thread
+from time import perf_counter, sleep
+
+from vnpy.event import Event, EventEngine
+
+
+EVENT_BENCH = "eBench"
+COUNT = 200_000
+PRODUCERS = 2
+
+# Total events/sec of paced run and its duration in seconds
+RATE = 20_000
+DURATION = 3
+
+
+def percentile(data: list[float], q: float) -> float:
+    """"""
+    data = sorted(data)
+    ix: int = min(len(data) - 1, int(len(data) * q))
+    return data[ix]
+
+
+def run_benchmark(batch: bool, rate: int = 0) -> None:
+    """
+    Put events as fast as possible if rate is zero, otherwise put
+    events at the rate of events/sec shared by producers.
+    """
+    latencies: list[float] = []
+
+    if rate:
+        count: int = rate * DURATION // PRODUCERS
+    else:
+        count = COUNT
+    total: int = count * PRODUCERS
+
+    def process_event(event: Event) -> None:
+        latencies.append(perf_counter() - event.data)
+
+    def produce() -> None:
+        put = event_engine.put
+        for _ in range(count):
+            put(Event(EVENT_BENCH, perf_counter()))
+
+    def produce_paced() -> None:
+        put = event_engine.put
+        interval: float = PRODUCERS / rate
+        produce_start: float = perf_counter()
+
+        for i in range(count):
+            # Sleep until scheduled time, events late due to coarse
+            # sleep are put at once to keep the average rate
+            delay: float = produce_start + i * interval - perf_counter()
+            if delay > 0:
+                sleep(delay)
+            put(Event(EVENT_BENCH, perf_counter()))
+
+    event_engine: EventEngine = EventEngine(batch=batch)
+    event_engine.register(EVENT_BENCH, process_event)
+    event_engine.start()
+
+    target: Callable = produce_paced if rate else produce
+    producers: list[Thread] = [Thread(target=target) for _ in range(PRODUCERS)]
+
+    start: float = perf_counter()
+    for producer in producers:
+        producer.start()
+
+    while len(latencies) < total:
+        sleep(0.001)
+    cost: float = perf_counter() - start
+
+    for producer in producers:
+        producer.join()
+    event_engine.stop()
+
+    mode: str = "batch" if batch else "queue"
+    pacing: str = f"{rate:,}/sec" if rate else "unpaced"
+    print(
+        f"{mode:<6} {pacing:<12} events/sec: {total / cost:>12,.0f}    "
+        f"p50: {percentile(latencies, 0.50) * 1e6:>10,.1f}us    "
+        f"p99: {percentile(latencies, 0.99) * 1e6:>10,.1f}us"
+    )
+
+
+if __name__ == "__main__":
+    for rate in [0, RATE]:
+        run_benchmark(batch=False, rate=rate)
+        run_benchmark(batch=True, rate=rate)
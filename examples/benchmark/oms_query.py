@@ -0,0 +1,109 @@
+"""
+Benchmark of OmsEngine queries with 100k historical orders, comparing
+indexed queries by vt_symbol/gateway_name/direction with full scans.
+"""
+
+from collections.abc import Callable
+from random import choice, random
+from time import perf_counter
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Direction, Exchange, Status
+from vnpy.trader.engine import MainEngine, OmsEngine
+from vnpy.trader.event import EVENT_ORDER, EVENT_POSITION
+from vnpy.trader.object import OrderData, PositionData
+
+
+ORDERS = 100_000
+SYMBOLS = 500
+GATEWAYS = ["CTP", "CTP2"]
+QUERIES = 10_000
+
+
+def run_query(name: str, func: Callable, check: Callable) -> None:
+    """"""
+    vt_symbols: list[str] = [f"rb{i}.SHFE" for i in range(SYMBOLS)]
+
+    assert sorted(id(d) for d in func(vt_symbols[0])) == sorted(id(d) for d in check(vt_symbols[0]))
+
+    start: float = perf_counter()
+    for i in range(QUERIES):
+        func(vt_symbols[i % SYMBOLS])
+    cost: float = perf_counter() - start
+
+    print(f"{name:<44}us/query: {cost / QUERIES * 1e6:>10,.1f}")
+
+
+if __name__ == "__main__":
+    main_engine: MainEngine = MainEngine(EventEngine())
+    oms_engine: OmsEngine = main_engine.get_engine("oms")      # type: ignore
+
+    start: float = perf_counter()
+
+    for i in range(ORDERS):
+        order: OrderData = OrderData(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=choice([Direction.LONG, Direction.SHORT]),
+            price=3100,
+            volume=1,
+            status=Status.NOTTRADED,
+            gateway_name=choice(GATEWAYS)
+        )
+        oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+        # Most orders are finished later
+        if random() < 0.98:
+            order.status = Status.ALLTRADED
+            oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+    for gateway_name in GATEWAYS:
+        for i in range(SYMBOLS):
+            for direction in [Direction.LONG, Direction.SHORT]:
+                position: PositionData = PositionData(
+                    symbol=f"rb{i}",
+                    exchange=Exchange.SHFE,
+                    direction=direction,
+                    volume=1,
+                    gateway_name=gateway_name
+                )
+                oms_engine.process_position_event(Event(EVENT_POSITION, position))
+
+    print(f"process events: {perf_counter() - start:.2f}s    active orders: {len(oms_engine.active_orders)}")
+
+    for name, func, check in [
+        (
+            "active orders of vt_symbol (scan)",
+            lambda s: [o for o in oms_engine.get_all_active_orders() if o.vt_symbol == s],
+            lambda s: oms_engine.get_all_active_orders(vt_symbol=s),
+        ),
+        (
+            "active orders of vt_symbol (index)",
+            lambda s: oms_engine.get_all_active_orders(vt_symbol=s),
+            lambda s: [o for o in oms_engine.get_all_active_orders() if o.vt_symbol == s],
+        ),
+        (
+            "orders of vt_symbol + direction (scan)",
+            lambda s: [o for o in oms_engine.get_all_orders() if o.vt_symbol == s and o.direction == Direction.LONG],
+            lambda s: oms_engine.get_all_orders(vt_symbol=s, direction=Direction.LONG),
+        ),
+        (
+            "orders of vt_symbol + direction (index)",
+            lambda s: oms_engine.get_all_orders(vt_symbol=s, direction=Direction.LONG),
+            lambda s: [o for o in oms_engine.get_all_orders() if o.vt_symbol == s and o.direction == Direction.LONG],
+        ),
+        (
+            "positions of gateway + vt_symbol (scan)",
+            lambda s: [p for p in oms_engine.get_all_positions() if p.gateway_name == "CTP" and p.vt_symbol == s],
+            lambda s: oms_engine.get_all_positions(vt_symbol=s, gateway_name="CTP"),
+        ),
+        (
+            "positions of gateway + vt_symbol (index)",
+            lambda s: oms_engine.get_all_positions(vt_symbol=s, gateway_name="CTP"),
+            lambda s: [p for p in oms_engine.get_all_positions() if p.gateway_name == "CTP" and p.vt_symbol == s],
+        ),
+    ]:
+        run_query(name, func, check)
+
+    main_engine.close()
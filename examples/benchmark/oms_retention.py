@@ -0,0 +1,93 @@
+"""
+Benchmark of OmsEngine memory with retention of finished orders and
+trades, compared with keeping everything in memory.
+"""
+
+import tracemalloc
+from time import perf_counter
+
+from vnpy.event import Event, EventEngine
+from vnpy.trader.constant import Direction, Exchange, Status
+from vnpy.trader.engine import MainEngine, OmsEngine
+from vnpy.trader.event import EVENT_ORDER, EVENT_TRADE
+from vnpy.trader.object import OrderData, TradeData
+
+
+COUNT = 200_000
+SYMBOLS = 100
+
+
+def run_benchmark(name: str, count: int, seconds: float, archive: str) -> None:
+    """"""
+    main_engine: MainEngine = MainEngine(EventEngine())
+    oms_engine: OmsEngine = main_engine.get_engine("oms")      # type: ignore
+    oms_engine.set_retention(count, seconds, archive)
+
+    tracemalloc.start()
+    start: float = perf_counter()
+
+    for i in range(COUNT):
+        order: OrderData = OrderData(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=Direction.LONG,
+            price=3100,
+            volume=1,
+            status=Status.NOTTRADED,
+            gateway_name="CTP"
+        )
+        oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+        trade: TradeData = TradeData(
+            symbol=order.symbol,
+            exchange=order.exchange,
+            orderid=order.orderid,
+            tradeid=str(i),
+            direction=order.direction,
+            price=order.price,
+            volume=order.volume,
+            gateway_name=order.gateway_name
+        )
+        oms_engine.process_trade_event(Event(EVENT_TRADE, trade))
+
+        order = OrderData(
+            symbol=order.symbol,
+            exchange=order.exchange,
+            orderid=order.orderid,
+            direction=order.direction,
+            price=order.price,
+            volume=order.volume,
+            traded=order.volume,
+            status=Status.ALLTRADED,
+            gateway_name=order.gateway_name
+        )
+        oms_engine.process_order_event(Event(EVENT_ORDER, order))
+
+    cost: float = perf_counter() - start
+    memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{name:<24}events/sec: {COUNT * 3 / cost:>10,.0f}    "
+        f"memory: {memory / 1024 / 1024:>8.1f} MB    "
+        f"orders: {len(oms_engine.orders):>8,}    "
+        f"trades: {len(oms_engine.trades):>8,}"
+    )
+
+    if oms_engine.archive:
+        start = perf_counter()
+        orders: list[OrderData] = oms_engine.query_archived_orders(vt_symbol="rb1.SHFE")
+        cost = perf_counter() - start
+
+        print(f"{'':<24}archived orders of rb1.SHFE: {len(orders):,} in {cost:.2f}s")
+
+        oms_engine.archive.path.unlink()
+
+    main_engine.close()
+
+
+if __name__ == "__main__":
+    run_benchmark("keep all", 0, 0, "")
+    run_benchmark("last 10000", 10_000, 0, "")
+    run_benchmark("last 10000 + archive", 10_000, 0, "benchmark_oms_archive.vnj")
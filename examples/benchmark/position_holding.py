@@ -0,0 +1,274 @@
+"""
+Benchmark of frozen volume accounting in PositionHolding, comparing
+incremental update by order change with summing all active orders on
+every update, after a randomized check that both give the same result.
+"""
+
+from copy import copy
+from math import isclose
+from random import Random
+from time import perf_counter
+
+from vnpy.trader.constant import Direction, Exchange, Offset, OrderType, Product, Status
+from vnpy.trader.converter import PositionHolding
+from vnpy.trader.object import ContractData, OrderData, OrderRequest, PositionData, TradeData
+
+
+CHECK_STEPS = 20_000
+RESTING_ORDERS = [10, 100, 1_000, 5_000]
+# Volume steps checked, non-integer ones for products like crypto
+LOTS = [1, 0.1, 0.01]
+UPDATES = 5_000
+
+
+class ScanPositionHolding(PositionHolding):
+    """
+    Position holding calculating frozen volume by summing all active
+    orders on every update, as reference for checking.
+    """
+
+    def update_order(self, order: OrderData) -> None:
+        """"""
+        if order.is_active():
+            self.active_orders[order.vt_orderid] = order
+        else:
+            if order.vt_orderid in self.active_orders:
+                self.active_orders.pop(order.vt_orderid)
+
+        self.calculate_frozen()
+
+    def calculate_frozen(self) -> None:
+        """"""
+        self.long_pos_frozen = 0
+        self.long_yd_frozen = 0
+        self.long_td_frozen = 0
+
+        self.short_pos_frozen = 0
+        self.short_yd_frozen = 0
+        self.short_td_frozen = 0
+
+        for order in self.active_orders.values():
+            if order.offset == Offset.OPEN:
+                continue
+
+            frozen: float = order.volume - order.traded
+
+            if order.direction == Direction.LONG:
+                if order.offset == Offset.CLOSETODAY:
+                    self.short_td_frozen += frozen
+                elif order.offset == Offset.CLOSEYESTERDAY:
+                    self.short_yd_frozen += frozen
+                elif order.offset == Offset.CLOSE:
+                    self.short_td_frozen += frozen
+
+                    if self.short_td_frozen > self.short_td:
+                        self.short_yd_frozen += self.short_td_frozen - self.short_td
+                        self.short_td_frozen = self.short_td
+            elif order.direction == Direction.SHORT:
+                if order.offset == Offset.CLOSETODAY:
+                    self.long_td_frozen += frozen
+                elif order.offset == Offset.CLOSEYESTERDAY:
+                    self.long_yd_frozen += frozen
+                elif order.offset == Offset.CLOSE:
+                    self.long_td_frozen += frozen
+
+                    if self.long_td_frozen > self.long_td:
+                        self.long_yd_frozen += self.long_td_frozen - self.long_td
+                        self.long_td_frozen = self.long_td
+
+        self.sum_pos_frozen()
+
+
+def create_contract() -> ContractData:
+    """"""
+    return ContractData(
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        name="rb2510",
+        product=Product.FUTURES,
+        size=10,
+        pricetick=1,
+        gateway_name="CTP"
+    )
+
+
+def get_frozen(holding: PositionHolding) -> tuple:
+    """"""
+    return (
+        holding.long_pos_frozen,
+        holding.long_td_frozen,
+        holding.long_yd_frozen,
+        holding.short_pos_frozen,
+        holding.short_td_frozen,
+        holding.short_yd_frozen,
+    )
+
+
+def check_equivalence(seed: int, lot: float) -> None:
+    """
+    Apply the same random orders, trades and positions to both holdings
+    and check frozen volume after every order update.
+
+    Volumes are multiples of lot, and frozen volumes are compared with
+    tolerance since floats are summed in different order. Sums of frozen
+    volume must be exactly 0 without active orders.
+    """
+    rng: Random = Random(seed)
+    contract: ContractData = create_contract()
+
+    holding: PositionHolding = PositionHolding(contract)
+    reference: ScanPositionHolding = ScanPositionHolding(contract)
+
+    orders: dict[str, OrderData] = {}
+    offsets: list[Offset] = [Offset.OPEN, Offset.CLOSE, Offset.CLOSETODAY, Offset.CLOSEYESTERDAY]
+
+    for step in range(CHECK_STEPS):
+        action: float = rng.random()
+
+        # Send new order request
+        if action < 0.3 or not orders:
+            req: OrderRequest = OrderRequest(
+                symbol=contract.symbol,
+                exchange=contract.exchange,
+                direction=rng.choice([Direction.LONG, Direction.SHORT]),
+                type=rng.choice(list(OrderType)),
+                volume=rng.randint(1, 10) * lot,
+                price=3100,
+                offset=rng.choice(offsets)
+            )
+            vt_orderid: str = f"CTP.{step}"
+
+            holding.update_order_request(req, vt_orderid)
+            reference.update_order_request(req, vt_orderid)
+
+            orders[vt_orderid] = req.create_order_data(str(step), "CTP")
+        # Update order status
+        elif action < 0.85:
+            vt_orderid = rng.choice(list(orders))
+            order: OrderData = copy(orders[vt_orderid])
+
+            status_action: float = rng.random()
+            if status_action < 0.4 and order.traded < order.volume:
+                left: int = round((order.volume - order.traded) / lot)
+                filled: int = rng.randint(1, left)
+
+                if filled == left:
+                    order.traded = order.volume
+                else:
+                    order.traded += filled * lot
+                order.status = Status.ALLTRADED if order.traded == order.volume else Status.PARTTRADED
+            elif status_action < 0.6:
+                order.status = Status.NOTTRADED
+            elif status_action < 0.8:
+                order.status = Status.CANCELLED
+            elif status_action < 0.9:
+                order.status = Status.REJECTED
+            else:
+                # Late event of order already finished
+                order.status = Status.NOTTRADED
+
+            holding.update_order(order)
+            reference.update_order(order)
+
+            if order.is_active() or rng.random() < 0.5:
+                orders[vt_orderid] = order
+            else:
+                orders.pop(vt_orderid)
+        # Update trade or position, which changes today position
+        elif action < 0.95:
+            trade: TradeData = TradeData(
+                symbol=contract.symbol,
+                exchange=contract.exchange,
+                orderid="",
+                tradeid=str(step),
+                direction=rng.choice([Direction.LONG, Direction.SHORT]),
+                offset=rng.choice(offsets),
+                volume=rng.randint(1, 5) * lot,
+                gateway_name="CTP"
+            )
+            holding.update_trade(trade)
+            reference.update_trade(trade)
+        else:
+            position: PositionData = PositionData(
+                symbol=contract.symbol,
+                exchange=contract.exchange,
+                direction=rng.choice([Direction.LONG, Direction.SHORT]),
+                volume=rng.randint(0, 50) * lot,
+                yd_volume=rng.randint(0, 20) * lot,
+                gateway_name="CTP"
+            )
+            holding.update_position(position)
+            reference.update_position(position)
+
+        result: tuple = get_frozen(holding)
+        expected: tuple = get_frozen(reference)
+        assert all(isclose(a, b, abs_tol=1e-9) for a, b in zip(result, expected, strict=True)), f"seed {seed} lot {lot} step {step}"
+
+        if not holding.active_orders:
+            for frozen in [holding.long_frozen, holding.short_frozen]:
+                sums: tuple = (frozen.today, frozen.yesterday, frozen.close, frozen.today_tail)
+                assert not any(sums), f"seed {seed} lot {lot} step {step}"
+
+    print(f"seed {seed} lot {lot}: {CHECK_STEPS:,} steps equivalent")
+
+
+def run_benchmark(holding_class: type, resting: int) -> float:
+    """
+    Update one order repeatedly with many resting close orders, and
+    return updates per second.
+    """
+    holding: PositionHolding = holding_class(create_contract())
+    holding.update_position(PositionData("CTP", "rb2510", Exchange.SHFE, Direction.LONG, volume=resting * 2, yd_volume=resting))
+
+    for i in range(resting):
+        order: OrderData = OrderData(
+            symbol="rb2510",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=Direction.SHORT,
+            offset=Offset.CLOSE,
+            price=3100,
+            volume=1,
+            status=Status.NOTTRADED,
+            gateway_name="CTP"
+        )
+        holding.update_order(order)
+
+    order = OrderData(
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        orderid="updated",
+        direction=Direction.SHORT,
+        offset=Offset.CLOSETODAY,
+        price=3100,
+        volume=UPDATES,
+        status=Status.NOTTRADED,
+        gateway_name="CTP"
+    )
+    holding.update_order(order)
+
+    start: float = perf_counter()
+
+    for i in range(UPDATES):
+        order = copy(order)
+        order.traded = i
+        order.status = Status.PARTTRADED
+        holding.update_order(order)
+
+    return UPDATES / (perf_counter() - start)
+
+
+if __name__ == "__main__":
+    for lot in LOTS:
+        for seed in range(5):
+            check_equivalence(seed, lot)
+
+    for resting in RESTING_ORDERS:
+        scan: float = run_benchmark(ScanPositionHolding, resting)
+        incremental: float = run_benchmark(PositionHolding, resting)
+
+        print(
+            f"resting orders: {resting:>8,}    "
+            f"scan: {scan:>10,.0f}/sec    "
+            f"incremental: {incremental:>10,.0f}/sec"
+        )
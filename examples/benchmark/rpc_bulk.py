@@ -0,0 +1,83 @@
+"""
+Benchmark of RPC replies with large numpy payload, which are sent as
+zero-copy multipart frames, compared with copying memory locally.
+"""
+
+from time import perf_counter
+
+import numpy as np
+
+from vnpy.rpc import RpcClient, RpcServer
+
+
+REQ_ADDRESS = "tcp://127.0.0.1:2014"
+PUB_ADDRESS = "tcp://127.0.0.1:4102"
+
+COUNT = 20
+
+
+class BenchmarkServer(RpcServer):
+    """"""
+
+    def __init__(self, size: int) -> None:
+        """"""
+        super().__init__()
+
+        # One day of 1-second bars: datetime, open, high, low, close, volume
+        self.bars: dict[str, np.ndarray] = {
+            "datetime": np.arange(size).astype("datetime64[s]"),
+            "open": np.random.random(size),
+            "high": np.random.random(size),
+            "low": np.random.random(size),
+            "close": np.random.random(size),
+            "volume": np.random.random(size),
+        }
+
+        self.register(self.query_bars)
+
+    def query_bars(self) -> dict[str, np.ndarray]:
+        """"""
+        return self.bars
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def callback(self, topic: str, data: object) -> None:
+        """"""
+        pass
+
+
+if __name__ == "__main__":
+    size: int = 86_400
+
+    server: BenchmarkServer = BenchmarkServer(size)
+    server.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    client: BenchmarkClient = BenchmarkClient()
+    client.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    bars: dict[str, np.ndarray] = client.query_bars()
+    for name, array in server.bars.items():
+        assert np.array_equal(array, bars[name])
+
+    nbytes: int = sum(array.nbytes for array in server.bars.values())
+
+    start: float = perf_counter()
+    for _ in range(COUNT):
+        client.query_bars()
+    rpc_cost: float = (perf_counter() - start) / COUNT
+
+    start = perf_counter()
+    for _ in range(COUNT):
+        {name: array.copy() for name, array in server.bars.items()}
+    copy_cost: float = (perf_counter() - start) / COUNT
+
+    print(f"payload: {nbytes / 1024 / 1024:.1f} MB")
+    print(f"rpc reply: {rpc_cost * 1000:.2f} ms")
+    print(f"local copy: {copy_cost * 1000:.2f} ms")
+
+    client.stop()
+    server.stop()
+    client.join()
+    server.join()
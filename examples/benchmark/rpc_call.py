@@ -0,0 +1,87 @@
+"""
+Benchmark of RpcClient call throughput, comparing blocking calls one
+by one, blocking calls from multiple threads and pipelined async calls
+sharing one connection.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+
+from vnpy.rpc import RpcClient, RpcServer
+
+
+REQ_ADDRESS = "tcp://127.0.0.1:2014"
+PUB_ADDRESS = "tcp://127.0.0.1:4102"
+
+COUNT = 20_000
+THREADS = 8
+
+
+class BenchmarkServer(RpcServer):
+    """"""
+
+    def __init__(self, workers: int) -> None:
+        """"""
+        super().__init__(workers=workers)
+
+        self.register(self.send_order)
+
+    def send_order(self, symbol: str, price: float, volume: float) -> str:
+        """"""
+        return f"{symbol}_{price}_{volume}"
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def callback(self, topic: str, data: object) -> None:
+        """"""
+        pass
+
+
+def run_sync(client: BenchmarkClient) -> None:
+    """"""
+    for i in range(COUNT):
+        client.send_order("rb2510", i, 1)
+
+
+def run_threads(client: BenchmarkClient) -> None:
+    """"""
+    with ThreadPoolExecutor(THREADS) as executor:
+        for i in range(COUNT):
+            executor.submit(client.send_order, "rb2510", i, 1)
+
+
+def run_async(client: BenchmarkClient) -> None:
+    """"""
+    futures: list[Future] = [
+        client.call_async("send_order", "rb2510", i, 1) for i in range(COUNT)
+    ]
+
+    for future in futures:
+        future.result()
+
+
+if __name__ == "__main__":
+    for workers in [0, 4]:
+        server: BenchmarkServer = BenchmarkServer(workers)
+        server.start(REQ_ADDRESS, PUB_ADDRESS)
+
+        client: BenchmarkClient = BenchmarkClient()
+        client.start(REQ_ADDRESS, PUB_ADDRESS)
+
+        for name, func in [
+            ("sync", run_sync),
+            (f"{THREADS} threads", run_threads),
+            ("async", run_async),
+        ]:
+            start: float = perf_counter()
+            func(client)
+            cost: float = perf_counter() - start
+
+            print(f"workers: {workers}    {name:<12}calls/sec: {COUNT / cost:>10,.0f}")
+
+        client.stop()
+        server.stop()
+        client.join()
+        server.join()
@@ -0,0 +1,107 @@
+"""
+Benchmark of RPC message codecs, comparing messages/sec and
+bytes/message of pickle and the schema-aware trader codec.
+"""
+
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import Any
+from zoneinfo import ZoneInfo
+
+from vnpy.event import Event
+from vnpy.rpc.codec import BaseCodec, PickleCodec, TraderCodec
+from vnpy.trader.constant import Direction, Exchange, Interval, Offset, Status
+from vnpy.trader.event import EVENT_TICK, EVENT_ORDER
+from vnpy.trader.object import BarData, OrderData, TickData
+
+
+CHINA_TZ = ZoneInfo("Asia/Shanghai")
+
+
+def create_messages() -> dict[str, tuple[Any, int]]:
+    """
+    Return dict of message name: (message, repeat count).
+    """
+    now: datetime = datetime.now(CHINA_TZ)
+
+    tick: TickData = TickData(
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        datetime=now,
+        name="螺纹钢2510",
+        last_price=3100,
+        volume=123456,
+        bid_price_1=3099,
+        ask_price_1=3101,
+        bid_volume_1=10,
+        ask_volume_1=20,
+        gateway_name="CTP"
+    )
+
+    order: OrderData = OrderData(
+        symbol="rb2510",
+        exchange=Exchange.SHFE,
+        orderid="1_-123456_1",
+        direction=Direction.LONG,
+        offset=Offset.OPEN,
+        price=3100,
+        volume=1,
+        status=Status.NOTTRADED,
+        datetime=now,
+        reference="CtaStrategy_atr_rsi",
+        gateway_name="CTP"
+    )
+
+    bars: list[BarData] = [
+        BarData(
+            symbol="rb2510",
+            exchange=Exchange.SHFE,
+            datetime=now + timedelta(minutes=i),
+            interval=Interval.MINUTE,
+            open_price=3100,
+            high_price=3105,
+            low_price=3095,
+            close_price=3101,
+            volume=1000,
+            gateway_name="DB"
+        )
+        for i in range(10_000)
+    ]
+
+    return {
+        "tick publish": (["", Event(EVENT_TICK, tick, tick.vt_symbol)], 50_000),
+        "order publish": (["", Event(EVENT_ORDER, order, order.vt_orderid)], 50_000),
+        "bar list reply": ([True, bars], 10),
+    }
+
+
+def run_benchmark(name: str, codec: BaseCodec, msg: Any, count: int) -> None:
+    """"""
+    data: bytes = codec.dumps(msg)
+    assert codec.loads(data) == msg
+
+    start: float = perf_counter()
+    for _ in range(count):
+        data = codec.dumps(msg)
+    dumps_cost: float = perf_counter() - start
+
+    start = perf_counter()
+    for _ in range(count):
+        codec.loads(data)
+    loads_cost: float = perf_counter() - start
+
+    print(
+        f"{name:<16}{codec.__class__.__name__:<14}"
+        f"dumps/sec: {count / dumps_cost:>10,.0f}    "
+        f"loads/sec: {count / loads_cost:>10,.0f}    "
+        f"bytes/msg: {len(data):>10,}"
+    )
+
+
+if __name__ == "__main__":
+    # Event has no __eq__, so compare its attributes for checking result
+    Event.__eq__ = lambda self, other: vars(self) == vars(other)     # type: ignore
+
+    for name, (msg, count) in create_messages().items():
+        for codec in [PickleCodec(), TraderCodec()]:
+            run_benchmark(name, codec, msg, count)
@@ -0,0 +1,93 @@
+"""
+Benchmark of RpcServer publishing tick events of many symbols, when
+client subscribes all of them or only a few. Data of topic without
+subscriber is not serialized, so publishing cost scales with what is
+consumed rather than what is produced.
+"""
+
+from datetime import datetime
+from time import perf_counter, process_time, sleep
+
+import zmq
+
+from vnpy.event import Event
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.event import EVENT_TICK
+from vnpy.trader.object import TickData
+
+
+REQ_ADDRESS = "tcp://127.0.0.1:2014"
+PUB_ADDRESS = "tcp://127.0.0.1:4102"
+
+SYMBOLS = 500
+COUNT = 100_000
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.count: int = 0
+
+    def callback(self, topic: str, data: object) -> None:
+        """"""
+        self.count += 1
+
+
+def run_benchmark(name: str, subscribed: int) -> None:
+    """"""
+    server: RpcServer = RpcServer()
+    server._socket_pub.setsockopt(zmq.SNDHWM, 0)
+    server.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    events: list[Event] = []
+    for i in range(COUNT):
+        tick: TickData = TickData(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(),
+            last_price=3100 + i % 10,
+            volume=123456 + i,
+            gateway_name="CTP"
+        )
+        events.append(Event(EVENT_TICK, tick, tick.vt_symbol))
+
+    vt_symbols: set[str] = {event.key for event in events[:subscribed]}
+
+    client: BenchmarkClient = BenchmarkClient()
+    client.subscribe_symbols(EVENT_TICK, vt_symbols)
+    client.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    sleep(1)
+
+    start: float = perf_counter()
+    cpu_start: float = process_time()
+
+    for event in events:
+        server.publish_event(event)
+
+    cost: float = perf_counter() - start
+    cpu_cost: float = process_time() - cpu_start
+
+    sleep(3)
+
+    print(
+        f"{name:<16}published: {COUNT / cost:>10,.0f}/sec    "
+        f"cpu: {cpu_cost:>6.2f}s    "
+        f"received: {client.count:>8,}"
+    )
+
+    client.stop()
+    server.stop()
+    client.join()
+    server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark(f"all {SYMBOLS}", SYMBOLS)
+    run_benchmark("50 symbols", 50)
+    run_benchmark("5 symbols", 5)
@@ -0,0 +1,47 @@
+"""
+Benchmark of round-trip time between RpcClient and RpcServer by the
+built-in ping function, and metrics collected on both sides.
+"""
+
+from vnpy.rpc import RpcClient, RpcServer
+
+
+# Different ports for each server to avoid waiting for port release
+REQ_ADDRESS = "tcp://127.0.0.1:{}"
+PUB_ADDRESS = "tcp://127.0.0.1:{}"
+
+COUNT = 10_000
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def callback(self, topic: str, data: object) -> None:
+        """"""
+        pass
+
+
+if __name__ == "__main__":
+    for workers in [0, 4]:
+        server: RpcServer = RpcServer(workers=workers)
+        server.start(REQ_ADDRESS.format(2014 + workers), PUB_ADDRESS.format(4102 + workers))
+
+        client: BenchmarkClient = BenchmarkClient()
+        client.start(REQ_ADDRESS.format(2014 + workers), PUB_ADDRESS.format(4102 + workers))
+
+        result: dict[str, float] = client.run_ping(COUNT)
+        text: str = "    ".join(f"{k}: {v:>7.1f}" for k, v in result.items())
+        print(f"workers: {workers}    RTT(us)    {text}")
+
+        server_data: dict = server.get_metrics()["ping"]
+        client_data: dict = client.get_metrics()["ping"]
+        print(
+            f"{'':<16}server mean(us): {server_data['mean'] * 1_000_000:.1f}    "
+            f"client mean(us): {client_data['mean'] * 1_000_000:.1f}    "
+            f"count: {client_data['count']}"
+        )
+
+        client.stop()
+        server.stop()
+        client.join()
+        server.join()
@@ -0,0 +1,106 @@
+"""
+Benchmark of RpcServer publishing ticks with and without batching,
+comparing messages/sec received by client and bytes sent on wire.
+"""
+
+from datetime import datetime
+from threading import Event as Signal
+from time import perf_counter, sleep
+
+import zmq
+
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+
+
+REQ_ADDRESS = "tcp://127.0.0.1:2014"
+PUB_ADDRESS = "tcp://127.0.0.1:4102"
+
+COUNT = 50_000
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.count: int = 0
+        self.finished: Signal = Signal()
+
+    def callback(self, topic: str, data: object) -> None:
+        """"""
+        self.count += 1
+
+        if self.count == COUNT:
+            self.finished.set()
+
+
+def run_benchmark(name: str, size: int = 0, compression: str = "") -> None:
+    """"""
+    # No high water mark so that all data is delivered for counting
+    server: RpcServer = RpcServer()
+    server._socket_pub.setsockopt(zmq.SNDHWM, 0)
+    if size:
+        server.enable_batch(size, 1000, compression)
+    server.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    client: BenchmarkClient = BenchmarkClient()
+    client.subscribe_topic("")
+    client.start(REQ_ADDRESS, PUB_ADDRESS)
+
+    # Raw socket for counting bytes received
+    context: zmq.Context = zmq.Context()
+    socket: zmq.Socket = context.socket(zmq.SUB)
+    socket.setsockopt(zmq.RCVHWM, 0)
+    socket.setsockopt_string(zmq.SUBSCRIBE, "")
+    socket.connect(PUB_ADDRESS)
+
+    sleep(1)
+
+    ticks: list[TickData] = [
+        TickData(
+            symbol="rb2510",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(),
+            last_price=3100 + i % 10,
+            volume=123456 + i,
+            gateway_name="CTP"
+        )
+        for i in range(COUNT)
+    ]
+
+    start: float = perf_counter()
+
+    for tick in ticks:
+        server.publish("tick", tick)
+
+    client.finished.wait(30)
+    cost: float = perf_counter() - start
+
+    sleep(1)
+
+    size_count: int = 0
+    while socket.poll(0):
+        size_count += sum(len(frame) for frame in socket.recv_multipart())
+
+    print(
+        f"{name:<16}received: {client.count:>8,}    "
+        f"msgs/sec: {client.count / cost:>10,.0f}    "
+        f"bytes/msg: {size_count / COUNT:>8,.1f}"
+    )
+
+    socket.close()
+    client.stop()
+    server.stop()
+    client.join()
+    server.join()
+
+
+if __name__ == "__main__":
+    run_benchmark("no batch")
+    run_benchmark("batch 100", 100)
+    run_benchmark("batch 100 lz4", 100, "lz4")
+    run_benchmark("batch 100 zstd", 100, "zstd")
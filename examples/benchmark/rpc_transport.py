@@ -0,0 +1,126 @@
+"""
+Benchmark of tick fan-out from RpcServer to many RpcClient processes
+on the same host, comparing tcp loopback, ipc and shared memory.
+"""
+
+from datetime import datetime
+from multiprocessing import Process, Queue
+from time import sleep, time
+
+import zmq
+
+from vnpy.rpc import RpcClient, RpcServer
+from vnpy.trader.constant import Exchange
+from vnpy.trader.object import TickData
+
+
+CLIENTS = 12
+COUNT = 20_000
+
+TRANSPORTS: list[tuple[str, str, str]] = [
+    ("tcp", "tcp://127.0.0.1:2014", "tcp://127.0.0.1:4102"),
+    ("ipc", "ipc:///tmp/vnpy_benchmark_rep", "ipc:///tmp/vnpy_benchmark_pub"),
+    ("shm", "ipc:///tmp/vnpy_benchmark_rep", "shm://vnpy_benchmark_pub"),
+]
+
+
+class BenchmarkClient(RpcClient):
+    """"""
+
+    def __init__(self) -> None:
+        """"""
+        super().__init__()
+
+        self.count: int = 0
+        self.latency: float = 0
+        self.finished_time: float = 0
+
+    def callback(self, topic: str, data: TickData) -> None:
+        """"""
+        self.count += 1
+        self.latency += time() - data.localtime.timestamp()     # type: ignore
+
+        if self.count == COUNT:
+            self.finished_time = time()
+
+
+def run_client(req_address: str, sub_address: str, queue: Queue) -> None:
+    """
+    Run client in another process and put result into queue.
+    """
+    client: BenchmarkClient = BenchmarkClient()
+    client.subscribe_topic("tick")
+    client.start(req_address, sub_address)
+
+    queue.put("ready")
+
+    # Wait until no more data is received
+    last_count: int = -1
+    while client.count != last_count:
+        last_count = client.count
+        sleep(3)
+
+    client.stop()
+    client.join()
+
+    queue.put((client.count, client.latency / max(client.count, 1), client.finished_time))
+
+
+def run_benchmark(name: str, req_address: str, sub_address: str) -> None:
+    """"""
+    # No high water mark so that all data is delivered for counting
+    server: RpcServer = RpcServer()
+    server._socket_pub.setsockopt(zmq.SNDHWM, 0)
+    server.start(req_address, sub_address)
+
+    queue: Queue = Queue()
+    processes: list[Process] = [
+        Process(target=run_client, args=(req_address, sub_address, queue))
+        for _ in range(CLIENTS)
+    ]
+    for process in processes:
+        process.start()
+
+    for _ in processes:
+        queue.get()
+    sleep(1)
+
+    start: float = time()
+
+    for i in range(COUNT):
+        tick: TickData = TickData(
+            symbol="rb2510",
+            exchange=Exchange.SHFE,
+            datetime=datetime.now(),
+            last_price=3100 + i % 10,
+            volume=123456 + i,
+            gateway_name="CTP",
+            localtime=datetime.now()
+        )
+        server.publish("tick", tick)
+
+    publish_cost: float = time() - start
+
+    results: list[tuple[int, float, float]] = [queue.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    received: int = sum(result[0] for result in results)
+    latency: float = sum(result[1] for result in results) / CLIENTS
+    finished: float = max(result[2] for result in results) or time()
+
+    print(
+        f"{name:<6}clients: {CLIENTS}    "
+        f"publish: {COUNT / publish_cost:>8,.0f}/sec    "
+        f"fan-out: {received / (finished - start):>10,.0f} msgs/sec    "
+        f"received: {received / (COUNT * CLIENTS):>6.1%}    "
+        f"latency: {latency * 1000:>8.2f} ms"
+    )
+
+    server.stop()
+    server.join()
+
+
+if __name__ == "__main__":
+    for name, req_address, sub_address in TRANSPORTS:
+        run_benchmark(name, req_address, sub_address)
@@ -0,0 +1,110 @@
+"""
+Benchmark of trader data objects, comparing construction cost and
+memory per object between dataclass and slotted variants.
+"""
+
+import tracemalloc
+from collections.abc import Callable
+from datetime import datetime
+from time import perf_counter
+
+from vnpy.trader.constant import Direction, Exchange, Interval
+from vnpy.trader.object import (
+    BarData,
+    OrderData,
+    TickData,
+    SlottedBarData,
+    SlottedOrderData,
+    SlottedTickData
+)
+
+
+COUNT = 200_000
+SYMBOLS = 100
+
+
+def create_ticks(data_class: type, now: datetime) -> list:
+    """"""
+    return [
+        data_class(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            datetime=now,
+            last_price=3100 + i % 10,
+            volume=i,
+            bid_price_1=3099,
+            ask_price_1=3101,
+            bid_volume_1=10,
+            ask_volume_1=20,
+            gateway_name="CTP"
+        )
+        for i in range(COUNT)
+    ]
+
+
+def create_bars(data_class: type, now: datetime) -> list:
+    """"""
+    return [
+        data_class(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            datetime=now,
+            interval=Interval.MINUTE,
+            open_price=3100,
+            high_price=3110,
+            low_price=3090,
+            close_price=3105,
+            volume=i,
+            gateway_name="DB"
+        )
+        for i in range(COUNT)
+    ]
+
+
+def create_orders(data_class: type, now: datetime) -> list:
+    """"""
+    return [
+        data_class(
+            symbol=f"rb{i % SYMBOLS}",
+            exchange=Exchange.SHFE,
+            orderid=str(i),
+            direction=Direction.LONG,
+            price=3100,
+            volume=1,
+            datetime=now,
+            gateway_name="CTP"
+        )
+        for i in range(COUNT)
+    ]
+
+
+def run_benchmark(name: str, create: Callable, data_class: type) -> None:
+    """"""
+    now: datetime = datetime.now()
+
+    start: float = perf_counter()
+    create(data_class, now)
+    cost: float = perf_counter() - start
+
+    tracemalloc.start()
+    data_list: list = create(data_class, now)
+    memory: int = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    # Strings created for symbol and orderid are included
+    print(
+        f"{name:<20}ns/object: {cost / COUNT * 1e9:>8,.0f}    "
+        f"bytes/object: {memory / len(data_list):>8,.1f}"
+    )
+
+
+if __name__ == "__main__":
+    for name, create, data_class in [
+        ("TickData", create_ticks, TickData),
+        ("SlottedTickData", create_ticks, SlottedTickData),
+        ("BarData", create_bars, BarData),
+        ("SlottedBarData", create_bars, SlottedBarData),
+        ("OrderData", create_orders, OrderData),
+        ("SlottedOrderData", create_orders, SlottedOrderData),
+    ]:
+        run_benchmark(name, create, data_class)
@@ -1,8 +1,20 @@
-from .engine import Event, EventEngine, EVENT_TIMER
+from .engine import (
+    Event,
+    EventEngine,
+    Overflow,
+    EVENT_TIMER,
+    EVENT_ENGINE_STATS,
+    EVENT_ENGINE_OVERLOAD
+)
+from .async_engine import AsyncEventEngine
 
 
 __all__ = [
     "Event",
     "EventEngine",
+    "AsyncEventEngine",
+    "Overflow",
     "EVENT_TIMER",
+    "EVENT_ENGINE_STATS",
+    "EVENT_ENGINE_OVERLOAD",
 ]
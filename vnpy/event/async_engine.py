@@ -0,0 +1,218 @@
+"""
+Asyncio based event engine of VeighNa framework.
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from inspect import isawaitable
+from threading import Lock, get_ident
+
+from loguru import logger
+
+from .engine import Event, EVENT_TIMER
+
+
+# Defines handler function to be used in async event engine, both
+# plain function and coroutine function are supported.
+AsyncHandlerType = Callable[[Event], None] | Callable[[Event], Awaitable[None]]
+
+
+class AsyncEventEngine:
+    """
+    Event engine running in asyncio event loop, which provides the
+    same API as EventEngine.
+
+    Coroutine handlers are awaited in order, so events are processed
+    one by one just like the threaded engine. Events can be put from
+    other threads safely, which makes it work with existing threaded
+    gateways.
+    """
+
+    def __init__(self, interval: int = 1) -> None:
+        """
+        Timer event is generated every 1 second by default, if
+        interval not specified.
+        """
+        self._interval: int = interval
+        self._active: bool = False
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._loop_thread: int = 0
+        # Created here so that events put before start are kept
+        self._queue: asyncio.Queue = asyncio.Queue()
+        # Guards the queue until loop is set by start
+        self._start_lock: Lock = Lock()
+        self._task: asyncio.Task | None = None
+        self._timer: asyncio.Task | None = None
+
+        self._handlers: defaultdict = defaultdict(list)
+        self._general_handlers: list = []
+        self._topics: defaultdict = defaultdict(dict)
+
+    async def _run(self) -> None:
+        """
+        Get event from queue and then process it.
+        """
+        queue: asyncio.Queue = self._queue
+
+        while self._active:
+            event: Event = await queue.get()
+            await self._process(event)
+
+    async def _process(self, event: Event) -> None:
+        """
+        First distribute event to those handlers registered listening
+        to this type.
+
+        Then distribute event to those general handlers which listens
+        to all types.
+
+        Exception raised by handler is logged, so that it will not stop
+        the engine from processing following events.
+        """
+        handler_lists: list[list] = []
+
+        if event.type in self._handlers:
+            handler_lists.append(self._handlers[event.type])
+
+        if event.key:
+            topic: dict | None = self._topics.get(event.type, None)
+            if topic and event.key in topic:
+                handler_lists.append(topic[event.key])
+
+        if self._general_handlers:
+            handler_lists.append(self._general_handlers)
+
+        for handler_list in handler_lists:
+            for handler in handler_list:
+                try:
+                    result = handler(event)
+                    if result is not None and isawaitable(result):
+                        await result
+                except Exception:
+                    logger.exception(f"Failed to process event {event.type} by {handler}")
+
+    async def _run_timer(self) -> None:
+        """
+        Sleep by interval second(s) and then generate a timer event.
+        """
+        while self._active:
+            await asyncio.sleep(self._interval)
+            event: Event = Event(EVENT_TIMER)
+            self.put(event)
+
+    def start(self) -> None:
+        """
+        Start event engine in the running event loop, so this function
+        must be called from a coroutine or loop callback.
+        """
+        if self._active:
+            return
+
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+
+        # Move pending events into a new queue bound to the running loop.
+        # Loop is set after queue swapped, so that events put from other
+        # threads since then are scheduled into the new queue.
+        with self._start_lock:
+            queue: asyncio.Queue = asyncio.Queue()
+            while not self._queue.empty():
+                queue.put_nowait(self._queue.get_nowait())
+            self._queue = queue
+
+            self._loop_thread = get_ident()
+            self._loop = loop
+
+        self._active = True
+        self._task = loop.create_task(self._run())
+        self._timer = loop.create_task(self._run_timer())
+
+    def stop(self) -> None:
+        """
+        Stop event engine.
+        """
+        if not self._active:
+            return
+
+        self._active = False
+
+        if self._loop and get_ident() != self._loop_thread:
+            self._loop.call_soon_threadsafe(self._cancel_tasks)
+        else:
+            self._cancel_tasks()
+
+    def _cancel_tasks(self) -> None:
+        """
+        Cancel worker tasks of engine.
+        """
+        for task in [self._task, self._timer]:
+            if task:
+                task.cancel()
+
+    def put(self, event: Event) -> None:
+        """
+        Put an event object into event queue. It is safe to be called
+        from threads other than the one running event loop.
+
+        Events put before start are kept and processed after start.
+        """
+        if not self._loop:
+            with self._start_lock:
+                if not self._loop:
+                    self._queue.put_nowait(event)
+                    return
+
+        if get_ident() == self._loop_thread:
+            self._queue.put_nowait(event)
+        else:
+            # Queue is resolved in loop thread rather than at calling time
+            self._loop.call_soon_threadsafe(lambda: self._queue.put_nowait(event))
+
+    def register(self, type: str, handler: AsyncHandlerType) -> None:
+        """
+        Register a new handler function for a specific event type. Every
+        function can only be registered once for each event type.
+        """
+        handler_list: list = self._handlers[type]
+        if handler not in handler_list:
+            handler_list.append(handler)
+
+        root, sep, key = type.partition(".")
+        if key:
+            self._topics[root + sep][key] = handler_list
+
+    def unregister(self, type: str, handler: AsyncHandlerType) -> None:
+        """
+        Unregister an existing handler function from event engine.
+        """
+        handler_list: list = self._handlers[type]
+
+        if handler in handler_list:
+            handler_list.remove(handler)
+
+        if not handler_list:
+            self._handlers.pop(type)
+
+            root, sep, key = type.partition(".")
+            if key and root + sep in self._topics:
+                topic: dict = self._topics[root + sep]
+                topic.pop(key, None)
+
+                if not topic:
+                    self._topics.pop(root + sep)
+
+    def register_general(self, handler: AsyncHandlerType) -> None:
+        """
+        Register a new handler function for all event types. Every
+        function can only be registered once for each event type.
+        """
+        if handler not in self._general_handlers:
+            self._general_handlers.append(handler)
+
+    def unregister_general(self, handler: AsyncHandlerType) -> None:
+        """
+        Unregister an existing general handler function.
+        """
+        if handler in self._general_handlers:
+            self._general_handlers.remove(handler)
@@ -2,15 +2,30 @@
 Event-driven framework of VeighNa framework.
 """
 
-from collections import defaultdict
+from bisect import bisect_left
+from collections import Counter, defaultdict, deque
 from collections.abc import Callable
+from enum import Enum
+from functools import partial
+from itertools import count
+from math import ceil
 from queue import Empty, Queue
-from threading import Thread
-from time import sleep
+from threading import Thread, Lock, Event as Signal, get_ident
+from time import monotonic, perf_counter
 from typing import Any
 
 
 EVENT_TIMER = "eTimer"
+EVENT_ENGINE_STATS = "eEngineStats"
+EVENT_ENGINE_OVERLOAD = "eEngineOverload"
+
+
+# Upper bounds (in seconds) of latency histogram buckets.
+LATENCY_BUCKETS: list[float] = [
+    0.00001, 0.00005, 0.0001, 0.0005,
+    0.001, 0.005, 0.01, 0.05,
+    0.1, 0.5, 1,
+]
 
 
 class Event:
@@ -18,17 +33,494 @@ class Event:
     Event object consists of a type string which is used
     by event engine for distributing event, and a data
     object which contains the real data.
+
+    An optional key (e.g. vt_symbol) makes the event also
+    distributed to handlers registered for type + key, so
+    there is no need to put the same data twice.
     """
 
-    def __init__(self, type: str, data: Any = None) -> None:
+    # Default for events restored without calling __init__ (e.g. unpickled)
+    key: str = ""
+
+    # Time of putting into queue, only set when statistics enabled
+    put_time: float = 0
+
+    def __init__(self, type: str, data: Any = None, key: str = "") -> None:
         """"""
         self.type: str = type
         self.data: Any = data
+        self.key: str = key
+
+
+class TopicEvent(Event):
+    """
+    Copy of keyed event which is only distributed to handlers of
+    type + key. It is used when type + key is routed to another lane
+    than type, so that handlers of type still run in a single lane.
+    """
+
+    def __init__(self, event: Event) -> None:
+        """"""
+        super().__init__(event.type, event.data, event.key)
 
 
 # Defines handler function to be used in event engine.
 HandlerType = Callable[[Event], None]
 
+# Defines handler function to be called by timer.
+TimerHandlerType = Callable[[], None]
+
+
+class Overflow(Enum):
+    """
+    Policy of bounded queue when it is full.
+    """
+    BLOCK = "block"                 # Wait until there is space
+    DROP_OLDEST = "drop_oldest"     # Discard the oldest pending event
+    DROP_NEWEST = "drop_newest"     # Discard the event being put
+    CONFLATE = "conflate"           # Conflate chosen types, block others
+
+
+class BatchQueue:
+    """
+    Lock-light event queue used by batch mode of event engine.
+
+    Events are appended into a deque without any lock, and the
+    consumer is waken up by a single signal to drain all pending
+    events in one go.
+
+    If maxsize is specified, the queue is bounded and the overflow
+    policy is applied when it is full. Callback on_high_water is
+    called once the depth crosses high_water, and armed again after
+    the queue is drained (at most once per second).
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 0,
+        overflow: Overflow = Overflow.BLOCK,
+        high_water: int = 0,
+        on_high_water: Callable[[int], None] | None = None
+    ) -> None:
+        """"""
+        self._deque: deque = deque()
+        self._signal: Signal = Signal()
+
+        self._maxsize: int = maxsize
+        self._overflow: Overflow = overflow
+        self._space: Signal = Signal()
+        self._consumer: int = 0
+
+        self._high_water: int = high_water
+        self._on_high_water: Callable[[int], None] | None = on_high_water
+        self._warned: bool = False
+        self._warned_at: float = 0
+
+        self.dropped: int = 0
+
+    def put(self, event: Event, force: bool = False) -> None:
+        """
+        Put an event object into queue. Overflow policy is not
+        applied if force is True.
+        """
+        if self._maxsize and not force and not self._reserve():
+            return
+
+        self._deque.append(event)
+        self._notify()
+
+    def _notify(self) -> None:
+        """
+        Wake up consumer and check high water mark.
+        """
+        # Only touch the signal lock when consumer may be sleeping
+        if not self._signal.is_set():
+            self._signal.set()
+
+        if self._high_water and not self._warned:
+            depth: int = len(self._deque)
+            if depth >= self._high_water:
+                self._warned = True
+
+                now: float = monotonic()
+                if now - self._warned_at < 1:
+                    return
+                self._warned_at = now
+
+                if self._on_high_water:
+                    self._on_high_water(depth)
+
+    def _reserve(self) -> bool:
+        """
+        Apply overflow policy if queue is full. Return False if
+        the new event should be dropped.
+        """
+        if len(self._deque) < self._maxsize:
+            return True
+
+        if self._overflow == Overflow.DROP_NEWEST:
+            self.dropped += 1
+            return False
+        elif self._overflow == Overflow.DROP_OLDEST:
+            try:
+                self._discard(self._deque.popleft())
+                self.dropped += 1
+            except IndexError:
+                pass
+            return True
+
+        # Never block the consumer thread itself, which would never wake up
+        if get_ident() == self._consumer:
+            return True
+
+        while len(self._deque) >= self._maxsize:
+            self._space.clear()
+            if len(self._deque) < self._maxsize:
+                break
+            self._space.wait(0.1)
+
+        return True
+
+    def _discard(self, item: Any) -> None:
+        """
+        Callback when pending item is dropped by overflow policy.
+        """
+        pass
+
+    def get_all(self, timeout: float) -> list[Event]:
+        """
+        Wait until any event is pending (or timeout reached), then
+        drain all pending events from queue.
+        """
+        self._consumer = get_ident()
+
+        if not self._deque:
+            self._signal.wait(timeout)
+
+        # Clear signal before draining, so that no wakeup is lost
+        self._signal.clear()
+
+        events: list[Event] = []
+        popleft: Callable = self._deque.popleft
+        while self._deque:
+            events.append(popleft())
+
+        if self._maxsize:
+            self._space.set()
+
+        self._warned = False
+        return events
+
+    def qsize(self) -> int:
+        """
+        Get number of pending events.
+        """
+        return len(self._deque)
+
+    def empty(self) -> bool:
+        """
+        Check if there is no pending event.
+        """
+        return not self._deque
+
+
+class ConflateQueue(BatchQueue):
+    """
+    Batch queue which conflates high frequency events.
+
+    Conflate is a dict mapping event type (or prefix of event type) to
+    the name of data attribute used as key, e.g. {EVENT_TICK: "vt_symbol"}.
+    A new event replaces the pending one with same type and key in place,
+    so only the latest event of each key is kept before dispatched.
+    """
+
+    def __init__(
+        self,
+        conflate: dict[str, str],
+        maxsize: int = 0,
+        overflow: Overflow = Overflow.CONFLATE,
+        high_water: int = 0,
+        on_high_water: Callable[[int], None] | None = None
+    ) -> None:
+        """"""
+        super().__init__(maxsize, overflow, high_water, on_high_water)
+
+        self._conflate: dict[str, str] = conflate
+        self._attrs: dict[str, str] = {}
+        self._latest: dict[tuple, Event] = {}
+        self._lock: Lock = Lock()
+
+    def _get_attr(self, type: str) -> str:
+        """
+        Get name of key attribute for the event type, empty string
+        is returned if the event type is not conflated.
+        """
+        attr: str = ""
+        matched: str = ""
+
+        for prefix, name in self._conflate.items():
+            if type.startswith(prefix) and len(prefix) > len(matched):
+                matched = prefix
+                attr = name
+
+        self._attrs[type] = attr
+        return attr
+
+    def _replace(self, key: tuple, event: Event) -> bool:
+        """
+        Replace the stale event which is not dispatched yet.
+        """
+        if key in self._latest:
+            self._latest[key] = event
+            return True
+        return False
+
+    def put(self, event: Event, force: bool = False) -> None:
+        """
+        Put an event object into queue, pending event with the
+        same key is replaced.
+        """
+        attr: str | None = self._attrs.get(event.type, None)
+        if attr is None:
+            attr = self._get_attr(event.type)
+
+        if not attr:
+            super().put(event, force)
+            return
+
+        key: tuple = (event.type, getattr(event.data, attr, None))
+
+        with self._lock:
+            if self._replace(key, event):
+                return
+
+        # Wait for space (or drop) without holding the lock
+        if self._maxsize and not force and not self._reserve():
+            return
+
+        with self._lock:
+            if self._replace(key, event):
+                return
+
+            self._latest[key] = event
+            self._deque.append(key)
+
+        self._notify()
+
+    def _discard(self, item: Any) -> None:
+        """
+        Remove event of conflated key dropped by overflow policy.
+        """
+        if item.__class__ is tuple:
+            with self._lock:
+                self._latest.pop(item, None)
+
+    def get_all(self, timeout: float) -> list[Event]:
+        """
+        Drain all pending events, with conflated keys replaced by
+        the latest event.
+        """
+        items: list = super().get_all(timeout)
+
+        with self._lock:
+            pop: Callable = self._latest.pop
+            return [pop(item) if item.__class__ is tuple else item for item in items]
+
+
+class EventStats:
+    """
+    Runtime statistics of event engine, including handler cost,
+    queue depth and enqueue-to-dispatch latency.
+
+    Counters are updated without lock to keep overhead low, so
+    the numbers are approximate when multiple lanes are running.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.handlers: dict[Callable, list] = {}       # handler: [count, total, max]
+        self.latencies: dict[str, list[int]] = {}      # type: bucket counts
+        self.high_water: int = 0
+
+    def record_handler(self, handler: Callable, cost: float) -> None:
+        """"""
+        data: list | None = self.handlers.get(handler, None)
+
+        if data:
+            data[0] += 1
+            data[1] += cost
+            if cost > data[2]:
+                data[2] = cost
+        else:
+            self.handlers[handler] = [1, cost, cost]
+
+    def record_latency(self, type: str, latency: float) -> None:
+        """"""
+        buckets: list[int] | None = self.latencies.get(type, None)
+        if not buckets:
+            buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+            self.latencies[type] = buckets
+
+        buckets[bisect_left(LATENCY_BUCKETS, latency)] += 1
+
+    def record_depth(self, depth: int) -> None:
+        """"""
+        if depth > self.high_water:
+            self.high_water = depth
+
+    def get_data(self) -> dict:
+        """
+        Get statistics data in plain dict.
+        """
+        items: list[tuple[Callable, list]] = list(self.handlers.items())
+
+        # Handlers of the same name (e.g. lambdas, or the same method of
+        # different objects) are distinguished by id of their owner
+        names: list[str] = [getattr(handler, "__qualname__", "") or repr(handler) for handler, _ in items]
+        counts: Counter[str] = Counter(names)
+
+        handlers: dict[str, dict] = {}
+        for name, (handler, (calls, total, max_cost)) in zip(names, items, strict=True):
+            if counts[name] > 1:
+                owner: Any = getattr(handler, "__self__", handler)
+                name = f"{name}@{id(owner):#x}"
+
+            handlers[name] = {
+                "count": calls,
+                "total": total,
+                "max": max_cost,
+            }
+
+        bounds: list[str] = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        latencies: dict[str, dict] = {}
+        for type, buckets in list(self.latencies.items()):
+            latencies[type] = dict(zip(bounds, buckets, strict=True))
+
+        return {
+            "handlers": handlers,
+            "latencies": latencies,
+            "high_water": self.high_water,
+        }
+
+
+class TimerWheel:
+    """
+    Hashed timer wheel with fixed tick resolution.
+
+    Each timer is saved in the slot of its deadline tick, so both
+    scheduling and expiring cost O(1) for each timer. The wheel is
+    advanced by the dispatch thread of event engine.
+    """
+
+    def __init__(self, resolution: float = 0.05, size: int = 512) -> None:
+        """"""
+        self._resolution: float = resolution
+        self._size: int = size
+        self._slots: list[list[list]] = [[] for _ in range(size)]
+
+        self._start: float = monotonic()
+        self._tick: int = 0                     # Last tick processed
+        self._next_time: float = self._start + resolution
+
+        self._timers: dict[int, list] = {}
+        self._count: count = count(1)
+        self._lock: Lock = Lock()
+
+    def schedule(self, delay: float, handler: TimerHandlerType, period: float = 0) -> int:
+        """
+        Add a timer to call handler after delay seconds, and then
+        every period seconds if period is not zero.
+
+        Return id of the timer, which can be used for cancelling.
+        """
+        delay_ticks: int = max(1, ceil(delay / self._resolution))
+        period_ticks: int = max(1, ceil(period / self._resolution)) if period else 0
+
+        with self._lock:
+            timer_id: int = next(self._count)
+            deadline: int = self._tick + delay_ticks
+
+            # Timer entry: [timer_id, deadline, handler, period]
+            entry: list = [timer_id, deadline, handler, period_ticks]
+            self._slots[deadline % self._size].append(entry)
+            self._timers[timer_id] = entry
+
+        return timer_id
+
+    def start(self) -> None:
+        """
+        Rebase wheel time to now, so that time passed before starting
+        (or while stopped) is not counted as missed ticks.
+        """
+        with self._lock:
+            self._start = monotonic() - self._tick * self._resolution
+            self._next_time = self._start + (self._tick + 1) * self._resolution
+
+    def cancel(self, timer_id: int) -> None:
+        """
+        Cancel an existing timer.
+        """
+        with self._lock:
+            entry: list | None = self._timers.pop(timer_id, None)
+
+            # Entry is removed lazily when its slot is visited
+            if entry:
+                entry[2] = None
+
+    def get_timeout(self, now: float) -> float:
+        """
+        Get seconds left before next tick of wheel.
+        """
+        return max(0, self._next_time - now)
+
+    def advance(self, now: float) -> list[TimerHandlerType]:
+        """
+        Move wheel forward to current time, and return handlers
+        of all expired timers.
+        """
+        if now < self._next_time:
+            return []
+
+        target: int = int((now - self._start) / self._resolution)
+        handlers: list[TimerHandlerType] = []
+
+        with self._lock:
+            while self._tick < target:
+                self._tick += 1
+
+                ix: int = self._tick % self._size
+                slot: list[list] = self._slots[ix]
+                if not slot:
+                    continue
+
+                self._slots[ix] = []
+
+                for entry in slot:
+                    timer_id, deadline, handler, period = entry
+
+                    # Cancelled timer
+                    if not handler:
+                        continue
+                    # Not expired yet (deadline is in later rounds)
+                    elif deadline > self._tick:
+                        self._slots[ix].append(entry)
+                        continue
+
+                    handlers.append(handler)
+
+                    # Periodic timer is put back, skipping missed periods
+                    # to avoid firing repeatedly when catching up
+                    if period:
+                        deadline = max(deadline + period, target + 1)
+                        entry[1] = deadline
+                        self._slots[deadline % self._size].append(entry)
+                    else:
+                        self._timers.pop(timer_id, None)
+
+            self._next_time = self._start + (target + 1) * self._resolution
+
+        return handlers
+
 
 class EventEngine:
     """
@@ -36,87 +528,449 @@ class EventEngine:
     to those handlers registered.
 
     It also generates timer event by every interval seconds,
-    which can be used for timing purpose.
+    which can be used for timing purpose. For other cadences,
+    timers can be scheduled into the timer wheel which is driven
+    by the dispatch thread.
     """
 
-    def __init__(self, interval: int = 1) -> None:
+    def __init__(
+        self,
+        interval: int = 1,
+        batch: bool = False,
+        lanes: dict[str, str] | None = None,
+        conflate: dict[str, str] | None = None,
+        maxsize: int = 0,
+        overflow: Overflow = Overflow.BLOCK,
+        high_water: int = 0
+    ) -> None:
         """
         Timer event is generated every 1 second by default, if
         interval not specified.
+
+        With batch mode enabled, all pending events are drained from
+        queue by one wakeup and then processed together, which avoids
+        lock contention of Queue under high event rate.
+
+        Lanes is a dict mapping event type (or prefix of event type,
+        e.g. EVENT_TICK + vt_symbol) to lane name. Events routed to the
+        same lane are processed in order by a dedicated worker thread,
+        other events are processed by the default thread. Handlers of
+        type (and general handlers) always run in the lane of type,
+        while handlers of type + key run in the lane of type + key.
+
+        Conflate is a dict mapping event type (or prefix of event type)
+        to the data attribute used as key, e.g. {EVENT_TICK: "vt_symbol"}.
+        Pending events with the same type and key are replaced by the
+        latest one. Conflation works on top of batch mode, so batch mode
+        is always enabled if conflate specified.
+
+        If maxsize is specified, each queue is bounded and the overflow
+        policy is applied when it is full, which also enables batch mode.
+        EVENT_ENGINE_OVERLOAD event is put once the queue depth crosses
+        high_water (80% of maxsize by default).
         """
         self._interval: int = interval
-        self._queue: Queue = Queue()
+        self._conflate: dict[str, str] = dict(conflate) if conflate else {}
+        self._batch: bool = batch or bool(self._conflate) or bool(maxsize)
         self._active: bool = False
-        self._thread: Thread = Thread(target=self._run)
-        self._timer: Thread = Thread(target=self._run_timer)
+
+        # Bounded queue related
+        self._maxsize: int = maxsize
+        self._overflow: Overflow = overflow
+        self._high_water: int = high_water or int(maxsize * 0.8)
+
+        self._queue: Queue | BatchQueue = self._new_queue("")
+        self._thread: Thread = self._new_worker(self._queue, True)
+
+        self._wheel: TimerWheel = TimerWheel()
+        self._timer_id: int = 0
+
+        self._stats: EventStats | None = None
+        self._stats_timer_id: int = 0
+
         self._handlers: defaultdict = defaultdict(list)
         self._general_handlers: list = []
 
-    def _run(self) -> None:
+        # Topic tree: root type -> sub key -> handler list, e.g. handlers
+        # registered for EVENT_TICK + vt_symbol are saved under EVENT_TICK
+        self._topics: defaultdict = defaultdict(dict)
+
+        # Worker lanes related
+        self._lanes: dict[str, str] = dict(lanes) if lanes else {}
+        self._lane_queues: dict[str, Queue | BatchQueue] = {}
+        self._lane_threads: list[Thread] = []
+        self._routes: dict[str, Queue | BatchQueue] = {}
+
+        for lane_name in sorted(set(self._lanes.values())):
+            lane_queue: Queue | BatchQueue = self._new_queue(lane_name)
+            self._lane_queues[lane_name] = lane_queue
+            self._lane_threads.append(self._new_worker(lane_queue))
+
+    def _new_queue(self, lane_name: str) -> Queue | BatchQueue:
+        """
+        Create event queue of lane according to dispatch mode.
+        """
+        on_high_water: Callable[[int], None] = partial(self._put_overload, lane_name)
+
+        if self._conflate:
+            return ConflateQueue(
+                self._conflate,
+                self._maxsize,
+                self._overflow,
+                self._high_water,
+                on_high_water
+            )
+        elif self._batch:
+            return BatchQueue(
+                self._maxsize,
+                self._overflow,
+                self._high_water,
+                on_high_water
+            )
+        else:
+            return Queue()
+
+    def _new_worker(self, queue: Queue | BatchQueue, timer: bool = False) -> Thread:
+        """
+        Create worker thread for processing events from queue. Timer
+        wheel is only driven by the default worker thread.
+        """
+        if self._batch:
+            return Thread(target=self._run_batch, args=(queue, timer))
+        else:
+            return Thread(target=self._run, args=(queue, timer))
+
+    def _run(self, queue: Queue, timer: bool) -> None:
         """
         Get event from queue and then process it.
         """
+        timeout: float = 1
+
         while self._active:
+            if timer:
+                timeout = self._wheel.get_timeout(monotonic())
+
             try:
-                event: Event = self._queue.get(block=True, timeout=1)
-                self._process(event)
+                event: Event = queue.get(block=True, timeout=timeout)
+                self._process(event, queue)
             except Empty:
                 pass
 
-    def _process(self, event: Event) -> None:
+            if timer:
+                self._run_wheel()
+
+    def _run_batch(self, queue: BatchQueue, timer: bool) -> None:
+        """
+        Drain all pending events from queue and then process them.
+        """
+        timeout: float = 1
+
+        while self._active:
+            if timer:
+                timeout = self._wheel.get_timeout(monotonic())
+
+            for event in queue.get_all(timeout):
+                self._process(event, queue)
+
+            if timer:
+                self._run_wheel()
+
+    def _run_wheel(self) -> None:
+        """
+        Advance timer wheel and call handlers of expired timers.
+        """
+        for handler in self._wheel.advance(monotonic()):
+            handler()
+
+    def _route(self, type: str) -> Queue | BatchQueue:
+        """
+        Find the queue of lane which the event type belongs to.
+
+        The longest matched prefix in lane map is used, and the result
+        is cached for following events of the same type.
+        """
+        queue: Queue | BatchQueue = self._queue
+        matched: str = ""
+
+        for prefix, lane_name in self._lanes.items():
+            if type.startswith(prefix) and len(prefix) > len(matched):
+                matched = prefix
+                queue = self._lane_queues[lane_name]
+
+        self._routes[type] = queue
+        return queue
+
+    def _process(self, event: Event, queue: Queue | BatchQueue) -> None:
         """
         First distribute event to those handlers registered listening
-        to this type.
+        to this type, and those listening to type + key if the topic
+        is routed to the same queue.
 
         Then distribute event to those general handlers which listens
         to all types.
         """
-        if event.type in self._handlers:
+        if self._stats:
+            self._process_stats(event, queue, self._stats)
+            return
+
+        topic_only: bool = isinstance(event, TopicEvent)
+
+        if not topic_only and event.type in self._handlers:
             [handler(event) for handler in self._handlers[event.type]]
 
-        if self._general_handlers:
+        if event.key:
+            topic: dict | None = self._topics.get(event.type, None)
+            if (
+                topic
+                and event.key in topic
+                and (topic_only or self._get_route(event.type + event.key) is queue)
+            ):
+                [handler(event) for handler in topic[event.key]]
+
+        if not topic_only and self._general_handlers:
             [handler(event) for handler in self._general_handlers]
 
-    def _run_timer(self) -> None:
+    def _process_stats(self, event: Event, queue: Queue | BatchQueue, stats: EventStats) -> None:
         """
-        Sleep by interval second(s) and then generate a timer event.
+        Distribute event with handler cost and latency recorded.
         """
-        while self._active:
-            sleep(self._interval)
-            event: Event = Event(EVENT_TIMER)
+        start: float = perf_counter()
+
+        put_time: float = event.put_time
+        if put_time:
+            stats.record_latency(event.type, start - put_time)
+
+        topic_only: bool = isinstance(event, TopicEvent)
+        handler_lists: list[list] = []
+
+        if not topic_only and event.type in self._handlers:
+            handler_lists.append(self._handlers[event.type])
+
+        if event.key:
+            topic: dict | None = self._topics.get(event.type, None)
+            if (
+                topic
+                and event.key in topic
+                and (topic_only or self._get_route(event.type + event.key) is queue)
+            ):
+                handler_lists.append(topic[event.key])
+
+        if not topic_only and self._general_handlers:
+            handler_lists.append(self._general_handlers)
+
+        for handler_list in handler_lists:
+            for handler in handler_list:
+                handler(event)
+
+                end: float = perf_counter()
+                stats.record_handler(handler, end - start)
+                start = end
+
+    def _put_stats(self) -> None:
+        """
+        Generate a statistics event.
+        """
+        if self._stats:
+            event: Event = Event(EVENT_ENGINE_STATS, self._stats.get_data())
             self.put(event)
 
+    def _put_overload(self, lane_name: str, depth: int) -> None:
+        """
+        Generate an overload warning event of lane.
+        """
+        data: dict = {
+            "lane": lane_name,
+            "depth": depth,
+            "dropped": self.get_dropped().get(lane_name, 0)
+        }
+        event: Event = Event(EVENT_ENGINE_OVERLOAD, data)
+
+        # Warning should never be blocked or dropped by overflow policy
+        queue: Queue | BatchQueue = self._get_queue(event)
+        if isinstance(queue, BatchQueue):
+            queue.put(event, force=True)
+        else:
+            queue.put(event)
+
+    def _put_timer(self) -> None:
+        """
+        Generate a timer event.
+        """
+        event: Event = Event(EVENT_TIMER)
+        self.put(event)
+
     def start(self) -> None:
         """
         Start event engine to process events and generate timer events.
         """
+        self._timer_id = self._wheel.schedule(self._interval, self._put_timer, self._interval)
+        self._wheel.start()
+
         self._active = True
         self._thread.start()
-        self._timer.start()
+
+        for thread in self._lane_threads:
+            thread.start()
 
     def stop(self) -> None:
         """
         Stop event engine.
         """
         self._active = False
-        self._timer.join()
         self._thread.join()
 
+        self._wheel.cancel(self._timer_id)
+
+        for thread in self._lane_threads:
+            thread.join()
+
     def put(self, event: Event) -> None:
         """
         Put an event object into event queue.
         """
-        self._queue.put(event)
+        if self._stats:
+            self._put_stats_event(event, self._stats)
+            return
+
+        if not self._lanes:
+            self._queue.put(event)
+            return
+
+        self._put_lanes(event)
+
+    def _put_stats_event(self, event: Event, stats: EventStats) -> None:
+        """
+        Put an event object with enqueue time and queue depth recorded.
+        """
+        event.put_time = perf_counter()
+
+        queue: Queue | BatchQueue = self._put_lanes(event)
+
+        stats.record_depth(queue.qsize())
+
+    def _put_lanes(self, event: Event) -> Queue | BatchQueue:
+        """
+        Put event into the lane of its type. If type + key is routed to
+        another lane, a topic copy is also put into that lane.
+
+        Return the queue of event type.
+        """
+        queue: Queue | BatchQueue = self._get_queue(event)
+        queue.put(event)
+
+        if event.key and self._lanes:
+            topic_queue: Queue | BatchQueue = self._get_route(event.type + event.key)
+            if topic_queue is not queue:
+                topic_queue.put(TopicEvent(event))
+
+        return queue
+
+    def _get_queue(self, event: Event) -> Queue | BatchQueue:
+        """
+        Get the queue which event should be put into by its type.
+        """
+        if not self._lanes:
+            return self._queue
+
+        return self._get_route(event.type)
+
+    def _get_route(self, topic: str) -> Queue | BatchQueue:
+        """
+        Get the queue of lane which the topic is routed to.
+        """
+        if not self._lanes:
+            return self._queue
+
+        queue: Queue | BatchQueue | None = self._routes.get(topic, None)
+        if queue is None:
+            queue = self._route(topic)
+        return queue
+
+    def get_dropped(self) -> dict[str, int]:
+        """
+        Get count of events dropped by overflow policy of each lane,
+        the default lane is named as empty string.
+        """
+        queues: dict[str, Queue | BatchQueue] = {"": self._queue}
+        queues.update(self._lane_queues)
+
+        return {
+            lane_name: queue.dropped
+            for lane_name, queue in queues.items()
+            if isinstance(queue, BatchQueue)
+        }
+
+    def enable_stats(self, interval: float = 5) -> None:
+        """
+        Start recording runtime statistics, which are also put as
+        EVENT_ENGINE_STATS event every interval seconds (0 for no push).
+        """
+        if self._stats:
+            return
+
+        self._stats = EventStats()
+
+        if interval:
+            self._stats_timer_id = self._wheel.schedule(interval, self._put_stats, interval)
+
+    def disable_stats(self) -> None:
+        """
+        Stop recording runtime statistics.
+        """
+        if self._stats_timer_id:
+            self._wheel.cancel(self._stats_timer_id)
+            self._stats_timer_id = 0
+
+        self._stats = None
+
+    def get_stats(self) -> dict:
+        """
+        Get runtime statistics data, empty dict is returned if
+        statistics not enabled.
+        """
+        if not self._stats:
+            return {}
+        return self._stats.get_data()
+
+    def schedule(self, delay: float, handler: TimerHandlerType) -> int:
+        """
+        Call handler once after delay seconds in the dispatch thread.
+
+        Return timer id which can be used for cancelling.
+        """
+        return self._wheel.schedule(delay, handler)
+
+    def schedule_periodic(self, period: float, handler: TimerHandlerType) -> int:
+        """
+        Call handler every period seconds in the dispatch thread.
+
+        Return timer id which can be used for cancelling.
+        """
+        return self._wheel.schedule(period, handler, period)
+
+    def cancel(self, timer_id: int) -> None:
+        """
+        Cancel a timer scheduled before.
+        """
+        self._wheel.cancel(timer_id)
 
     def register(self, type: str, handler: HandlerType) -> None:
         """
         Register a new handler function for a specific event type. Every
         function can only be registered once for each event type.
+
+        For type with sub key (e.g. EVENT_TICK + vt_symbol), handler list
+        is also saved into topic tree, so that it can receive events put
+        with the root type and key.
         """
         handler_list: list = self._handlers[type]
         if handler not in handler_list:
             handler_list.append(handler)
 
+        root, sep, key = type.partition(".")
+        if key:
+            self._topics[root + sep][key] = handler_list
+
     def unregister(self, type: str, handler: HandlerType) -> None:
         """
         Unregister an existing handler function from event engine.
@@ -129,6 +983,14 @@ class EventEngine:
         if not handler_list:
             self._handlers.pop(type)
 
+            root, sep, key = type.partition(".")
+            if key and root + sep in self._topics:
+                topic: dict = self._topics[root + sep]
+                topic.pop(key, None)
+
+                if not topic:
+                    self._topics.pop(root + sep)
+
     def register_general(self, handler: HandlerType) -> None:
         """
         Register a new handler function for all event types. Every
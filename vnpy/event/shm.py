@@ -0,0 +1,277 @@
+"""
+Shared memory transport of event engine, which distributes events
+to other processes on the same host through a ring buffer.
+"""
+
+from collections.abc import Callable
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from struct import Struct
+from threading import Thread
+from time import sleep
+from typing import Any, Protocol
+
+from .engine import Event, EventEngine
+
+
+# Buffer header: write sequence, record size, capacity
+HEADER: Struct = Struct("<QII")
+
+# Slot header: sequence of record saved in slot
+SLOT: Struct = Struct("<Q")
+
+
+class RecordCodec(Protocol):
+    """
+    Codec converting data object to and from fixed size record.
+    """
+
+    size: int
+
+    def pack_into(self, buffer: Any, offset: int, data: Any) -> None:
+        """"""
+        ...
+
+    def unpack_from(self, buffer: Any, offset: int = 0) -> Any:
+        """"""
+        ...
+
+
+class RingBuffer:
+    """
+    Single writer, multiple readers ring buffer of fixed size records
+    in shared memory.
+
+    Every slot is tagged with sequence of the record, which is cleared
+    before writing and set after writing, so readers can detect slots
+    being overwritten by the writer and skip them.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        record_size: int = 0,
+        capacity: int = 65536,
+        create: bool = False
+    ) -> None:
+        """
+        Create shared memory if create is True (by writer), otherwise
+        attach to an existing one (by readers). Record size saved by
+        writer is used if reader gives zero record size.
+        """
+        self.owner: bool = create
+
+        if create:
+            size: int = HEADER.size + (SLOT.size + record_size) * capacity
+            self.shm: SharedMemory = SharedMemory(name, create=True, size=size)
+        else:
+            # Reader should not unlink shared memory owned by writer
+            try:
+                self.shm = SharedMemory(name, track=False)     # type: ignore
+            except TypeError:
+                self.shm = SharedMemory(name)
+                resource_tracker.unregister(self.shm._name, "shared_memory")    # type: ignore
+
+        # Buffer is only None after shared memory closed
+        buf: memoryview | None = self.shm.buf
+        if buf is None:
+            raise ValueError(f"Shared memory {name} is closed")
+        self.buf: memoryview = buf
+
+        if create:
+            HEADER.pack_into(self.buf, 0, 0, record_size, capacity)
+        else:
+            _, size, capacity = HEADER.unpack_from(self.buf, 0)
+            if record_size and size != record_size:
+                raise ValueError(f"Record size mismatch: {size} != {record_size}")
+            record_size = size
+
+        self.capacity: int = capacity
+        self.record_size: int = record_size
+        self.slot_size: int = SLOT.size + record_size
+        self.write_seq: int = self.get_write_seq()
+
+    def get_write_seq(self) -> int:
+        """
+        Get sequence of the last record written.
+        """
+        seq: int = HEADER.unpack_from(self.buf, 0)[0]
+        return seq
+
+    def write(self, pack_into: Callable, data: Any) -> int:
+        """
+        Write a record into ring buffer and return its sequence.
+        """
+        self.write_seq += 1
+        seq: int = self.write_seq
+        offset: int = HEADER.size + ((seq - 1) % self.capacity) * self.slot_size
+
+        SLOT.pack_into(self.buf, offset, 0)
+        pack_into(self.buf, offset + SLOT.size, data)
+        SLOT.pack_into(self.buf, offset, seq)
+
+        HEADER.pack_into(self.buf, 0, seq, self.record_size, self.capacity)
+        return seq
+
+    def read(self, unpack_from: Callable, seq: int) -> tuple[list, int, int]:
+        """
+        Read all records after sequence.
+
+        Return records, sequence of the last record read and count of
+        records lost due to being overwritten.
+        """
+        records: list = []
+        lost: int = 0
+        write_seq: int = self.get_write_seq()
+
+        # Reader is too slow, records overwritten are skipped
+        if write_seq - seq > self.capacity:
+            lost += write_seq - seq - self.capacity
+            seq = write_seq - self.capacity
+
+        while seq < write_seq:
+            seq += 1
+            offset: int = HEADER.size + ((seq - 1) % self.capacity) * self.slot_size
+
+            if SLOT.unpack_from(self.buf, offset)[0] != seq:
+                lost += 1
+                continue
+
+            # Check again in case the slot was overwritten while reading
+            try:
+                data: Any = unpack_from(self.buf, offset + SLOT.size)
+            except Exception:
+                if SLOT.unpack_from(self.buf, offset)[0] != seq:
+                    lost += 1
+                    continue
+                raise
+
+            if SLOT.unpack_from(self.buf, offset)[0] != seq:
+                lost += 1
+                continue
+
+            records.append(data)
+
+        return records, seq, lost
+
+    def close(self) -> None:
+        """
+        Close shared memory, which is also unlinked by owner.
+        """
+        self.shm.close()
+
+        if self.owner:
+            self.shm.unlink()
+
+
+class ShmEventPublisher:
+    """
+    Write data of specific event type into shared memory ring buffer.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        name: str,
+        type: str,
+        codec: RecordCodec,
+        capacity: int = 65536
+    ) -> None:
+        """"""
+        self.event_engine: EventEngine = event_engine
+        self.type: str = type
+        self.codec: RecordCodec = codec
+
+        self.ring: RingBuffer = RingBuffer(name, codec.size, capacity, create=True)
+        self.skipped: int = 0
+
+        self.event_engine.register(type, self.process_event)
+
+    def process_event(self, event: Event) -> None:
+        """
+        Data which can not fit into record layout is skipped.
+        """
+        try:
+            self.ring.write(self.codec.pack_into, event.data)
+        except ValueError:
+            self.skipped += 1
+
+    def close(self) -> None:
+        """"""
+        self.event_engine.unregister(self.type, self.process_event)
+        self.ring.close()
+
+
+class ShmEventSubscriber:
+    """
+    Read data from shared memory ring buffer and put it as event
+    into local event engine.
+
+    Key attribute of data (e.g. vt_symbol) is used as event key, so
+    that handlers of type + key can also receive the event.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        name: str,
+        type: str,
+        codec: RecordCodec,
+        key: str = "vt_symbol",
+        interval: float = 0.0005
+    ) -> None:
+        """
+        Ring buffer is polled every interval seconds when idle.
+        """
+        self.event_engine: EventEngine = event_engine
+        self.type: str = type
+        self.codec: RecordCodec = codec
+        self.key: str = key
+        self.interval: float = interval
+
+        self.ring: RingBuffer = RingBuffer(name, codec.size)
+        self.lost: int = 0
+
+        self.active: bool = False
+        self.thread: Thread | None = None
+
+    def start(self) -> None:
+        """
+        Start reading from the latest record.
+        """
+        if self.active:
+            return
+
+        self.active = True
+        self.thread = Thread(target=self.run)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """"""
+        if not self.active:
+            return
+
+        self.active = False
+
+        if self.thread:
+            self.thread.join()
+            self.thread = None
+
+        self.ring.close()
+
+    def run(self) -> None:
+        """"""
+        unpack_from: Callable = self.codec.unpack_from
+        put: Callable = self.event_engine.put
+        seq: int = self.ring.get_write_seq()
+
+        while self.active:
+            records, seq, lost = self.ring.read(unpack_from, seq)
+            self.lost += lost
+
+            if not records:
+                sleep(self.interval)
+                continue
+
+            for data in records:
+                put(Event(self.type, data, getattr(data, self.key, "")))
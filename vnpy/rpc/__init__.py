@@ -1,8 +1,12 @@
 from .client import RpcClient
 from .server import RpcServer
+from .codec import BaseCodec, PickleCodec, TraderCodec
 
 
 __all__ = [
     "RpcClient",
     "RpcServer",
+    "BaseCodec",
+    "PickleCodec",
+    "TraderCodec",
 ]
@@ -1,11 +1,18 @@
+import asyncio
 import threading
-from time import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, TimeoutError
+from itertools import count
+from time import perf_counter, time
 from functools import lru_cache
 from typing import Any
 
 import zmq
 
-from .common import HEARTBEAT_TOPIC, HEARTBEAT_TOLERANCE
+from .codec import COMPRESSIONS, BaseCodec, PickleCodec, get_compressor
+from .common import HEARTBEAT_TOPIC, HEARTBEAT_TOLERANCE, PUBLISH_HEADER
+from .metrics import RpcMetrics, get_percentiles
+from .shm import POLL_INTERVAL, ShmSubscriber, get_shm_name
 
 
 class RemoteException(Exception):
@@ -26,25 +33,118 @@ class RemoteException(Exception):
         return str(self._value)
 
 
-class RpcClient:
-    """"""
+class RpcEndpoint:
+    """
+    Sockets and status of connection to one RpcServer.
+    """
 
-    def __init__(self) -> None:
-        """Constructor"""
-        # zmq port related
-        self._context: zmq.Context = zmq.Context()
+    def __init__(self, context: zmq.Context, req_address: str, sub_address: str) -> None:
+        """"""
+        self.req_address: str = req_address
+        self.sub_address: str = sub_address
 
-        # Request socket (Request–reply pattern)
-        self._socket_req: zmq.Socket = self._context.socket(zmq.REQ)
+        # Request socket (Request–reply pattern), DEALER socket is used
+        # so that many requests can be in flight at the same time
+        self.socket_req: zmq.Socket = context.socket(zmq.DEALER)
 
         # Subscribe socket (Publish–subscribe pattern)
-        self._socket_sub: zmq.Socket = self._context.socket(zmq.SUB)
+        self.socket_sub: zmq.Socket = context.socket(zmq.SUB)
 
         # Set socket option to keepalive
-        for socket in [self._socket_req, self._socket_sub]:
+        for socket in [self.socket_req, self.socket_sub]:
             socket.setsockopt(zmq.TCP_KEEPALIVE, 1)
             socket.setsockopt(zmq.TCP_KEEPALIVE_IDLE, 60)
 
+        # No high water mark for requests and replies, otherwise they
+        # may be blocked or dropped when many calls are in flight
+        self.socket_req.setsockopt(zmq.SNDHWM, 0)
+        self.socket_req.setsockopt(zmq.RCVHWM, 0)
+
+        self.socket_req.connect(req_address)
+
+        # Data is read from shared memory if address of shm scheme given
+        self.shm: ShmSubscriber | None = None
+
+        shm_name: str = get_shm_name(sub_address)
+        if shm_name:
+            self.shm = ShmSubscriber(shm_name)
+        else:
+            self.socket_sub.connect(sub_address)
+
+        # Server is healthy if any message (at least heartbeat) is
+        # received within tolerance
+        self.last_received: float = time()
+        self.healthy: bool = True
+
+    def subscribe(self, topic: str) -> None:
+        """"""
+        if self.shm:
+            self.shm.subscribe(topic)
+        else:
+            self.socket_sub.setsockopt_string(zmq.SUBSCRIBE, topic)
+
+    def unsubscribe(self, topic: str) -> None:
+        """"""
+        if self.shm:
+            self.shm.unsubscribe(topic)
+        else:
+            self.socket_sub.setsockopt_string(zmq.UNSUBSCRIBE, topic)
+
+    def close(self) -> None:
+        """"""
+        self.socket_req.close()
+        self.socket_sub.close()
+
+        if self.shm:
+            self.shm.close()
+
+
+class RpcClient:
+    """
+    Client of RpcServer, which can also connect to multiple servers
+    providing the same service for load balancing and failover.
+    """
+
+    def __init__(self, codec: BaseCodec | None = None) -> None:
+        """
+        Constructor, pickle is used for serializing messages if
+        codec not specified.
+        """
+        # Codec for serializing request, reply and subscribed data
+        self._codec: BaseCodec = codec or PickleCodec()
+
+        # zmq port related
+        self._context: zmq.Context = zmq.Context()
+
+        # Connections to servers, all published data is received from
+        # the primary one and only heartbeat from others
+        self._endpoints: list[RpcEndpoint] = []
+        self._primary: int = 0
+        self._topics: list[str] = []
+
+        # Read only functions are called on healthy servers by turns
+        self._read_only: set[str] = set()
+        self._turn: count[int] = count()
+
+        # Requests from caller threads are passed to client thread by
+        # inproc sockets, since zmq socket is not thread safe
+        address: str = f"inproc://rpc_request_{id(self)}"
+
+        self._socket_pull: zmq.Socket = self._context.socket(zmq.PULL)
+        self._socket_pull.bind(address)
+
+        self._socket_push: zmq.Socket = self._context.socket(zmq.PUSH)
+        self._socket_push.connect(address)
+
+        for socket in [self._socket_pull, self._socket_push]:
+            socket.setsockopt(zmq.SNDHWM, 0)
+            socket.setsockopt(zmq.RCVHWM, 0)
+
+        # Requests waiting for reply: request id: (future, name, send time, endpoint index)
+        self._futures: dict[bytes, tuple[Future, str, float, int]] = {}
+        self._metrics: RpcMetrics = RpcMetrics()
+        self._request_count: count = count(1)
+
         # Worker thread relate, used to process data pushed from server
         self._active: bool = False                 # RpcClient status
         self._thread: threading.Thread | None = None      # RpcClient thread
@@ -52,6 +152,15 @@ class RpcClient:
 
         self._last_received_ping: float = time()
 
+        # Decompress functions of published message, key is compression id
+        self._decompressors: dict[int, Callable] = {}
+
+        # Snapshot sync related
+        self._sync_lock: threading.Lock = threading.Lock()
+        self._syncing: bool = False
+        self._pending: list[tuple[str, Any, int]] = []
+        self._snapshot_seq: int = 0
+
     @lru_cache(100)  # noqa
     def __getattr__(self, name: str) -> Any:
         """
@@ -62,43 +171,134 @@ class RpcClient:
             # Get timeout value from kwargs, default value is 30 seconds
             timeout: int = kwargs.pop("timeout", 30000)
 
-            # Generate request
-            req: list = [name, args, kwargs]
-
             # Send request and wait for response
-            with self._lock:
-                self._socket_req.send_pyobj(req)
+            future: Future = self.call_async(name, *args, **kwargs)
+            wait: float = timeout / 1000
 
-                # Timeout reached without any data
-                n: int = self._socket_req.poll(timeout)
-                if not n:
-                    msg: str = f"Timeout of {timeout}ms reached for {req}"
-                    raise RemoteException(msg)
+            # Called in callback, reply must be received by this thread
+            if threading.current_thread() is self._thread:
+                self.wait_reply(future, wait)
+                wait = 0
 
-                rep = self._socket_req.recv_pyobj()
+            try:
+                return future.result(wait)
+            except TimeoutError:
+                future.cancel()
+                self._metrics.record_timeout(name)
 
-            # Return response if successed; Trigger exception if failed
-            if rep[0]:
-                return rep[1]
-            else:
-                raise RemoteException(rep[1])
+                req: list = [name, args, kwargs]
+                msg: str = f"Timeout of {timeout}ms reached for {req}"
+                raise RemoteException(msg) from None
 
         return dorpc
 
+    def call_async(self, name: str, *args: Any, **kwargs: Any) -> Future:
+        """
+        Send request without waiting for response, and return future
+        of the result. RemoteException is set into the future if the
+        remote call failed.
+        """
+        future: Future = Future()
+
+        if not self._active:
+            future.set_exception(RemoteException("RpcClient is not started"))
+            return future
+
+        # Generate request
+        req: list = [name, args, kwargs]
+        frames: list = self._codec.dumps_frames(req)
+
+        # Request id is sent before delimiter, so that it is kept in
+        # routing envelope and returned together with reply. The first
+        # frame is index of endpoint for client thread to send to.
+        with self._lock:
+            ix: int = self.select_endpoint(name)
+            req_id: bytes = next(self._request_count).to_bytes(8, "little")
+            self._futures[req_id] = (future, name, perf_counter(), ix)
+            self._socket_push.send_multipart([ix.to_bytes(2, "little"), req_id, b"", *frames], copy=False)
+
+        # Stop waiting for reply if cancelled (e.g. timeout)
+        future.add_done_callback(lambda _: self._futures.pop(req_id, None))
+
+        return future
+
+    def select_endpoint(self, name: str) -> int:
+        """
+        Get index of endpoint for calling function.
+        """
+        if name in self._read_only:
+            healthy: list[int] = [ix for ix, endpoint in enumerate(self._endpoints) if endpoint.healthy]
+            if healthy:
+                selected: int = healthy[next(self._turn) % len(healthy)]
+                return selected
+
+        return self._primary
+
+    def set_read_only(self, names: Iterable[str]) -> None:
+        """
+        Set names of functions without side effect (e.g. queries), which
+        are spread across all healthy servers. Other functions are
+        always called on the primary server.
+        """
+        self._read_only = set(names)
+
+    def get_metrics(self) -> dict[str, dict]:
+        """
+        Get round-trip metrics of every function called.
+        """
+        return self._metrics.get_data()
+
+    def run_ping(self, count: int = 1000, timeout: int = 30000) -> dict[str, float]:
+        """
+        Call built-in ping function of server one by one, and return
+        percentiles of round-trip time in microseconds.
+        """
+        rtts: list[float] = []
+
+        for _ in range(count):
+            start: float = perf_counter()
+            self.call_async("ping").result(timeout / 1000)
+            rtts.append((perf_counter() - start) * 1_000_000)
+
+        result: dict[str, float] = get_percentiles(rtts, [50, 90, 99, 99.9])
+        result["mean"] = sum(rtts) / count
+        result["max"] = max(rtts)
+        return result
+
+    async def call_coroutine(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        """
+        Awaitable remote call for asyncio.
+        """
+        return await asyncio.wrap_future(self.call_async(name, *args, **kwargs))
+
     def start(
         self,
-        req_address: str,
-        sub_address: str
+        req_address: str | list[str],
+        sub_address: str | list[str]
     ) -> None:
         """
         Start RpcClient
+
+        Lists of addresses can be given for connecting to multiple
+        servers, and the first one is used as primary server.
         """
         if self._active:
             return
 
+        if isinstance(req_address, str):
+            req_address = [req_address]
+        if isinstance(sub_address, str):
+            sub_address = [sub_address]
+
         # Connect zmq port
-        self._socket_req.connect(req_address)
-        self._socket_sub.connect(sub_address)
+        self._endpoints = [
+            RpcEndpoint(self._context, req, sub)
+            for req, sub in zip(req_address, sub_address, strict=True)
+        ]
+        self._primary = 0
+
+        for ix in range(len(self._endpoints)):
+            self.subscribe_endpoint(ix)
 
         # Start RpcClient status
         self._active = True
@@ -109,6 +309,19 @@ class RpcClient:
 
         self._last_received_ping = time()
 
+    def subscribe_endpoint(self, ix: int) -> None:
+        """
+        Subscribe topics on primary endpoint. Heartbeat is subscribed
+        on every endpoint for checking health.
+        """
+        endpoint: RpcEndpoint = self._endpoints[ix]
+
+        if ix == self._primary:
+            for topic in self._topics:
+                endpoint.subscribe(topic)
+
+        endpoint.subscribe(HEARTBEAT_TOPIC + "\0")
+
     def stop(self) -> None:
         """
         Stop RpcClient
@@ -129,25 +342,316 @@ class RpcClient:
         """
         Run RpcClient function
         """
-        pull_tolerance: int = HEARTBEAT_TOLERANCE * 1000
+        poller: zmq.Poller = zmq.Poller()
+        poller.register(self._socket_pull, zmq.POLLIN)
+
+        sockets: dict[zmq.Socket, tuple[int, bool]] = {}    # socket: (endpoint index, is sub socket)
+
+        for ix, rpc_endpoint in enumerate(self._endpoints):
+            poller.register(rpc_endpoint.socket_req, zmq.POLLIN)
+            poller.register(rpc_endpoint.socket_sub, zmq.POLLIN)
+
+            sockets[rpc_endpoint.socket_req] = (ix, False)
+            sockets[rpc_endpoint.socket_sub] = (ix, True)
+
+        # Shared memory can not be polled, so it is read every interval
+        # when idle and without waiting when data keeps coming
+        shm_endpoints: list[tuple[int, RpcEndpoint]] = [
+            (ix, endpoint) for ix, endpoint in enumerate(self._endpoints) if endpoint.shm
+        ]
+        timeout: int = POLL_INTERVAL if shm_endpoints else 1000
+        received: bool = False
 
         while self._active:
-            if not self._socket_sub.poll(pull_tolerance):
-                self.on_disconnected()
+            events: dict = dict(poller.poll(0 if received else timeout))
+
+            if shm_endpoints:
+                received = self.read_shm(shm_endpoints)
+
+            for socket in events:
+                # Forward requests from caller threads to server
+                if socket is self._socket_pull:
+                    self.forward_requests()
+                    continue
+
+                ix, is_sub = sockets[socket]
+                endpoint: RpcEndpoint = self._endpoints[ix]
+
+                # Set result of request future when reply received
+                if not is_sub:
+                    self.receive_replies(socket)
+                    continue
+
+                # Receive data from subscribe socket
+                endpoint.last_received = time()
+                if not endpoint.healthy:
+                    endpoint.healthy = True
+
+                msg: bytes = socket.recv(flags=zmq.NOBLOCK)
+
+                # Data of servers other than primary one is ignored,
+                # which may be left in socket after failover
+                if ix == self._primary:
+                    self.process_message(msg)
+
+            self.check_endpoints()
+
+        # Fail requests still waiting for reply
+        self.fail_requests("RpcClient is stopped")
+
+        # Close socket
+        for endpoint in self._endpoints:
+            endpoint.close()
+
+        self._socket_pull.close()
+        self._socket_push.close()
+
+    def read_shm(self, shm_endpoints: list[tuple[int, RpcEndpoint]]) -> bool:
+        """
+        Read data from shared memory of endpoints, and return whether
+        any data is received.
+        """
+        received: bool = False
+
+        for ix, endpoint in shm_endpoints:
+            msgs: list[bytes] = endpoint.shm.recv()     # type: ignore
+            if not msgs:
+                continue
+
+            received = True
+            endpoint.last_received = time()
+            endpoint.healthy = True
+
+            if ix == self._primary:
+                for msg in msgs:
+                    self.process_message(msg)
+
+        return received
+
+    def receive_replies(self, socket: zmq.Socket) -> None:
+        """
+        Receive all replies available in request socket.
+        """
+        while True:
+            try:
+                frames: list = socket.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+            self.on_reply(frames[0].bytes, [frame.buffer for frame in frames[2:]])
+
+    def wait_reply(self, future: Future, timeout: float) -> None:
+        """
+        Forward requests and receive replies in client thread until
+        future is done or timeout, which is used by blocking remote
+        call made in callbacks. Published data is left in sockets and
+        processed after returning to run loop.
+        """
+        poller: zmq.Poller = zmq.Poller()
+        poller.register(self._socket_pull, zmq.POLLIN)
+
+        for endpoint in self._endpoints:
+            poller.register(endpoint.socket_req, zmq.POLLIN)
+
+        end: float = perf_counter() + timeout
+
+        while not future.done():
+            left: float = end - perf_counter()
+            if left <= 0:
+                return
+
+            for socket in dict(poller.poll(int(left * 1000) + 1)):
+                if socket is self._socket_pull:
+                    self.forward_requests()
+                else:
+                    self.receive_replies(socket)
+
+    def forward_requests(self) -> None:
+        """
+        Send requests from caller threads to server of endpoint index.
+        """
+        while True:
+            try:
+                frames: list = self._socket_pull.recv_multipart(flags=zmq.NOBLOCK, copy=False)
+            except zmq.Again:
+                break
+
+            ix: int = int.from_bytes(frames[0].bytes, "little")
+            self._endpoints[ix].socket_req.send_multipart(frames[1:], copy=False)
+
+    def check_endpoints(self) -> None:
+        """
+        Check health of endpoints by time of the last message received,
+        and fail over to another healthy server if primary is lost.
+        """
+        now: float = time()
+
+        for ix, endpoint in enumerate(self._endpoints):
+            if now - endpoint.last_received < HEARTBEAT_TOLERANCE:
                 continue
 
-            # Receive data from subscribe socket
-            topic, data = self._socket_sub.recv_pyobj(flags=zmq.NOBLOCK)
+            # Reset time to check again after another tolerance period
+            endpoint.last_received = now
+
+            # Shared memory of restarted server is a new segment
+            if endpoint.shm:
+                endpoint.shm.reset()
+
+            if endpoint.healthy:
+                endpoint.healthy = False
+                self.fail_requests(f"RpcServer {endpoint.req_address} is lost", ix)
 
-            if topic == HEARTBEAT_TOPIC:
-                self._last_received_ping = data
+            if ix != self._primary:
+                continue
+
+            healthy: list[int] = [n for n, e in enumerate(self._endpoints) if e.healthy]
+            if healthy:
+                self.switch_primary(healthy[0])
             else:
-                # Process data by callable function
+                self.on_disconnected()
+
+    def switch_primary(self, ix: int) -> None:
+        """
+        Switch primary endpoint and resubscribe topics on it.
+        """
+        old: RpcEndpoint = self._endpoints[self._primary]
+        new: RpcEndpoint = self._endpoints[ix]
+
+        for topic in self._topics:
+            old.unsubscribe(topic)
+
+        for topic in self._topics:
+            new.subscribe(topic)
+
+        with self._lock:
+            self._primary = ix
+
+        # Sequence of data is numbered by each server separately
+        with self._sync_lock:
+            self._snapshot_seq = 0
+
+        self.on_failover(old.req_address, new.req_address)
+
+    def fail_requests(self, msg: str, ix: int = -1) -> None:
+        """
+        Fail requests waiting for reply from endpoint, or all requests
+        if index is -1.
+        """
+        with self._lock:
+            req_ids: list[bytes] = [
+                req_id for req_id, request in self._futures.items()
+                if ix < 0 or request[3] == ix
+            ]
+            futures: list[Future] = [self._futures.pop(req_id)[0] for req_id in req_ids]
+
+        for future in futures:
+            if future.set_running_or_notify_cancel():
+                future.set_exception(RemoteException(msg))
+
+    def process_data(self, topic: str, data: Any, seq: int) -> None:
+        """"""
+        if topic == HEARTBEAT_TOPIC:
+            self._last_received_ping = data
+            return
+
+        with self._sync_lock:
+            # Data already included in snapshot
+            if seq <= self._snapshot_seq:
+                return
+
+            # Data received while syncing is applied after snapshot
+            if self._syncing:
+                self._pending.append((topic, data, seq))
+                return
+
+            # Process data by callable function
+            self.callback(topic, data)
+
+    def process_message(self, msg: bytes) -> None:
+        """
+        Split message published by server into data of topic.
+        """
+        ix: int = msg.index(b"\0")
+        topic: str = msg[:ix].decode()
+        first_seq, compression_id = PUBLISH_HEADER.unpack_from(msg, ix + 1)
+
+        decompress: Callable | None = self._decompressors.get(compression_id, None)
+        if not decompress:
+            decompress = get_compressor(COMPRESSIONS[compression_id])[1]
+            self._decompressors[compression_id] = decompress
+
+        payload: memoryview = memoryview(msg)[ix + 1 + PUBLISH_HEADER.size:]
+        data_list: list = self._codec.loads(decompress(payload))
+
+        for i, data in enumerate(data_list):
+            self.process_data(topic, data, first_seq + i)
+
+    def sync(self, name: str, *args: Any, **kwargs: Any) -> None:
+        """
+        Sync state with server by calling snapshot function registered
+        with register_snapshot, then on_snapshot is called with the
+        snapshot before callback of any data published later.
+
+        Data received while waiting for snapshot is buffered and only
+        those with sequence larger than snapshot are applied. Should
+        not be called in callback.
+        """
+        with self._sync_lock:
+            self._syncing = True
+            self._pending = []
+
+        try:
+            seq, snapshot = getattr(self, name)(*args, **kwargs)
+        except Exception:
+            with self._sync_lock:
+                self.finish_sync()
+            raise
+
+        with self._sync_lock:
+            self._snapshot_seq = seq
+            self.on_snapshot(snapshot)
+            self.finish_sync()
+
+    def finish_sync(self) -> None:
+        """
+        Apply data buffered while syncing, sync lock should be acquired
+        before calling.
+        """
+        for topic, data, seq in self._pending:
+            if seq > self._snapshot_seq:
                 self.callback(topic, data)
 
-        # Close socket
-        self._socket_req.close()
-        self._socket_sub.close()
+        self._pending = []
+        self._syncing = False
+
+    def on_reply(self, req_id: bytes, frames: list) -> None:
+        """
+        Set result of request future, reply of request timed out is
+        ignored.
+        """
+        with self._lock:
+            request: tuple[Future, str, float, int] | None = self._futures.pop(req_id, None)
+
+        if not request:
+            return
+
+        future, name, start, _ = request
+        if not future.set_running_or_notify_cancel():
+            return
+
+        try:
+            rep: list = self._codec.loads_frames(frames)
+        except Exception as e:
+            future.set_exception(e)
+            return
+
+        # Round-trip time including serialization on both sides
+        self._metrics.record(name, perf_counter() - start, not rep[0])
+
+        # Return response if successed; Trigger exception if failed
+        if rep[0]:
+            future.set_result(rep[1])
+        else:
+            future.set_exception(RemoteException(rep[1]))
 
     def callback(self, topic: str, data: Any) -> None:
         """
@@ -155,11 +659,40 @@ class RpcClient:
         """
         raise NotImplementedError
 
+    def on_snapshot(self, snapshot: Any) -> None:
+        """
+        Callback of snapshot returned by sync.
+        """
+        raise NotImplementedError
+
     def subscribe_topic(self, topic: str) -> None:
         """
-        Subscribe data
+        Subscribe data, which is resubscribed automatically on failover.
         """
-        self._socket_sub.setsockopt_string(zmq.SUBSCRIBE, topic)
+        self._topics.append(topic)
+
+        if self._endpoints:
+            self._endpoints[self._primary].subscribe(topic)
+
+    def unsubscribe_topic(self, topic: str) -> None:
+        """
+        Unsubscribe data, server stops publishing topic if no other
+        client subscribed it.
+        """
+        if topic not in self._topics:
+            return
+        self._topics.remove(topic)
+
+        if self._endpoints:
+            self._endpoints[self._primary].unsubscribe(topic)
+
+    def subscribe_symbols(self, type: str, vt_symbols: set[str]) -> None:
+        """
+        Subscribe events of type for vt_symbols only, which are
+        published by server with publish_event.
+        """
+        for vt_symbol in vt_symbols:
+            self.subscribe_topic(type + vt_symbol + "\0")
 
     def on_disconnected(self) -> None:
         """
@@ -167,3 +700,12 @@ class RpcClient:
         """
         msg: str = f"RpcServer has no response over {HEARTBEAT_TOLERANCE} seconds, please check you connection."
         print(msg)
+
+    def on_failover(self, old_address: str, new_address: str) -> None:
+        """
+        Callback when primary server is switched because heartbeat is
+        lost. Sequence of data is reset, so state should be synced
+        again (in another thread) if sync is used.
+        """
+        msg: str = f"RpcServer {old_address} has no response, fail over to {new_address}."
+        print(msg)
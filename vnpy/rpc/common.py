@@ -1,4 +1,5 @@
 import signal
+from struct import Struct
 
 
 # Achieve Ctrl-c interrupt recv
@@ -8,3 +9,8 @@ signal.signal(signal.SIGINT, signal.SIG_DFL)
 HEARTBEAT_TOPIC = "heartbeat"
 HEARTBEAT_INTERVAL = 10
 HEARTBEAT_TOLERANCE = 30
+
+METRICS_TOPIC = "rpc_metrics"
+
+# Header of published message after topic: sequence of the first data, compression id
+PUBLISH_HEADER = Struct("<QB")
@@ -0,0 +1,91 @@
+"""
+Metrics of RPC calls for both server and client.
+"""
+
+from bisect import bisect_left
+from threading import Lock
+
+from vnpy.event.engine import LATENCY_BUCKETS
+
+
+class RpcMetrics:
+    """
+    Per-function statistics of RPC calls: count, errors, timeouts,
+    total/max time and histogram of time by latency buckets.
+
+    Server records execution time of functions, and client records
+    round-trip time observed from sending request to receiving reply.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.functions: dict[str, list] = {}     # name: [count, errors, timeouts, total, max, buckets]
+        self.lock: Lock = Lock()
+
+    def get_function(self, name: str) -> list:
+        """"""
+        data: list | None = self.functions.get(name, None)
+
+        if not data:
+            data = [0, 0, 0, 0.0, 0.0, [0] * (len(LATENCY_BUCKETS) + 1)]
+            self.functions[name] = data
+
+        return data
+
+    def record(self, name: str, cost: float, error: bool = False) -> None:
+        """
+        Record a finished call and its cost in seconds.
+        """
+        with self.lock:
+            data: list = self.get_function(name)
+            data[0] += 1
+            data[3] += cost
+
+            if error:
+                data[1] += 1
+            if cost > data[4]:
+                data[4] = cost
+
+            data[5][bisect_left(LATENCY_BUCKETS, cost)] += 1
+
+    def record_timeout(self, name: str) -> None:
+        """
+        Record a call without reply before timeout.
+        """
+        with self.lock:
+            self.get_function(name)[2] += 1
+
+    def get_data(self) -> dict[str, dict]:
+        """
+        Get statistics data of every function in plain dict.
+        """
+        bounds: list[str] = [f"<={bound}" for bound in LATENCY_BUCKETS] + [f">{LATENCY_BUCKETS[-1]}"]
+        result: dict[str, dict] = {}
+
+        with self.lock:
+            for name, (count, errors, timeouts, total, max_cost, buckets) in self.functions.items():
+                result[name] = {
+                    "count": count,
+                    "errors": errors,
+                    "timeouts": timeouts,
+                    "total": total,
+                    "mean": total / count if count else 0,
+                    "max": max_cost,
+                    "latencies": dict(zip(bounds, buckets, strict=True)),
+                }
+
+        return result
+
+
+def get_percentiles(values: list[float], percents: list[float]) -> dict[str, float]:
+    """
+    Get percentiles (by nearest rank) of values.
+    """
+    values = sorted(values)
+    result: dict[str, float] = {}
+
+    for percent in percents:
+        ix: int = min(len(values) - 1, max(0, round(percent / 100 * len(values)) - 1))
+        result[f"p{percent:g}"] = values[ix]
+
+    return result
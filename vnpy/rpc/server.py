@@ -1,31 +1,91 @@
 import threading
 import traceback
-from time import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from time import perf_counter, time
 from collections.abc import Callable
+from typing import Any
 
 import zmq
 
-from .common import HEARTBEAT_TOPIC, HEARTBEAT_INTERVAL
+from vnpy.event import Event
+
+from .codec import COMPRESSIONS, BaseCodec, PickleCodec, get_compressor, no_compression
+from .common import HEARTBEAT_TOPIC, HEARTBEAT_INTERVAL, METRICS_TOPIC, PUBLISH_HEADER
+from .metrics import RpcMetrics
+from .shm import CAPACITY, RECORD_SIZE, ShmPublisher, get_shm_name
+
+
+def get_delimiter_index(frames: list) -> int:
+    """
+    Get index of the empty delimiter frame between routing envelope
+    and message body.
+    """
+    for ix, frame in enumerate(frames):
+        if not len(frame):
+            return ix
+
+    raise ValueError("Delimiter frame not found in request")
 
 
 class RpcServer:
     """"""
 
-    def __init__(self) -> None:
+    def __init__(self, codec: BaseCodec | None = None, workers: int = 0) -> None:
         """
-        Constructor
+        Constructor, pickle is used for serializing messages if
+        codec not specified.
+
+        If workers is 0, requests are executed one by one in server
+        thread. Otherwise requests are dispatched to a pool of worker
+        threads, so that a slow function does not block others.
         """
+        # Codec for serializing request, reply and published data
+        self._codec: BaseCodec = codec or PickleCodec()
+
         # Save functions dict: key is function name, value is function object
         self._functions: dict[str, Callable] = {}
+        self._functions["ping"] = self.ping
 
         # Zmq port related
         self._context: zmq.Context = zmq.Context()
 
-        # Reply socket (Request–reply pattern)
-        self._socket_rep: zmq.Socket = self._context.socket(zmq.REP)
+        # Reply socket (Request–reply pattern), ROUTER socket is used in
+        # worker pool mode to reply requests out of order
+        self._workers: int = workers
+
+        if workers:
+            # No high water mark, otherwise replies may be dropped when
+            # many requests are in flight
+            self._socket_rep: zmq.Socket = self._context.socket(zmq.ROUTER)
+            self._socket_rep.setsockopt(zmq.SNDHWM, 0)
+            self._socket_rep.setsockopt(zmq.RCVHWM, 0)
+        else:
+            self._socket_rep = self._context.socket(zmq.REP)
+
+        # Worker pool related
+        self._executor: ThreadPoolExecutor | None = None
+        self._serial_executors: dict[str, ThreadPoolExecutor] = {}
+
+        # Replies are sent back from workers to server thread by inproc sockets
+        self._reply_address: str = f"inproc://rpc_reply_{id(self)}"
+        self._socket_reply: zmq.Socket | None = None
+        self._local: threading.local = threading.local()
+        self._worker_sockets: list[zmq.Socket] = []
 
-        # Publish socket (Publish–subscribe pattern)
-        self._socket_pub: zmq.Socket = self._context.socket(zmq.PUB)
+        # Publish socket (Publish–subscribe pattern), XPUB socket is used
+        # to receive subscriptions of clients, so that data of topic
+        # without subscriber is not serialized at all
+        self._socket_pub: zmq.Socket = self._context.socket(zmq.XPUB)
+
+        self._subscriptions: frozenset[bytes] = frozenset()
+        self._topic_subscribed: dict[str, bool] = {}
+
+        # Shared memory publisher used instead of publish socket if
+        # address of shm scheme is given
+        self._shm: ShmPublisher | None = None
+        self._shm_record_size: int = RECORD_SIZE
+        self._shm_capacity: int = CAPACITY
 
         # Worker thread related
         self._active: bool = False                          # RpcServer status
@@ -35,6 +95,26 @@ class RpcServer:
         # Heartbeat related
         self._heartbeat_at: float | None = None
 
+        # Metrics of function calls, published periodically if enabled
+        self._metrics: RpcMetrics = RpcMetrics()
+        self._metrics_interval: int = 0
+        self._metrics_at: float = 0
+
+        # Sequence of the last published data
+        self._sequence: int = 0
+
+        # Batch publish related, data is buffered by topic
+        self._batch_size: int = 0
+        self._batch_interval: float = 0
+        self._compression_id: int = 0
+        self._compress: Callable = no_compression
+
+        self._batch: dict[str, list] = {}
+        self._batch_count: int = 0
+        self._batch_time: float = 0
+        self._batch_condition: threading.Condition = threading.Condition()
+        self._batch_thread: threading.Thread | None = None
+
     def is_active(self) -> bool:
         """"""
         return self._active
@@ -46,13 +126,30 @@ class RpcServer:
     ) -> None:
         """
         Start RpcServer
+
+        Addresses of ipc:// scheme can be used for clients on the same
+        host, and pub_address of shm://name for publishing data through
+        shared memory instead of socket.
         """
         if self._active:
             return
 
         # Bind socket address
         self._socket_rep.bind(rep_address)
-        self._socket_pub.bind(pub_address)
+
+        shm_name: str = get_shm_name(pub_address)
+        if shm_name:
+            self._shm = ShmPublisher(shm_name, self._shm_record_size, self._shm_capacity)
+        else:
+            self._socket_pub.bind(pub_address)
+
+        # Start worker pool
+        if self._workers:
+            self._socket_reply = self._context.socket(zmq.PULL)
+            self._socket_reply.setsockopt(zmq.RCVHWM, 0)
+            self._socket_reply.bind(self._reply_address)
+
+            self._executor = ThreadPoolExecutor(self._workers, thread_name_prefix="RpcWorker")
 
         # Start RpcServer status
         self._active = True
@@ -61,6 +158,10 @@ class RpcServer:
         self._thread = threading.Thread(target=self.run)
         self._thread.start()
 
+        if self._batch_size:
+            self._batch_thread = threading.Thread(target=self.run_batch)
+            self._batch_thread.start()
+
         # Init heartbeat publish timestamp
         self._heartbeat_at = time() + HEARTBEAT_INTERVAL
 
@@ -74,6 +175,9 @@ class RpcServer:
         # Stop RpcServer status
         self._active = False
 
+        with self._batch_condition:
+            self._batch_condition.notify()
+
     def join(self) -> None:
         # Wait for RpcServer thread to exit
         if self._thread and self._thread.is_alive():
@@ -84,47 +188,385 @@ class RpcServer:
         """
         Run RpcServer functions
         """
+        if self._workers:
+            self.run_pool()
+        else:
+            self.run_serial()
+
+        # Publish data left in batch before closing socket
+        if self._batch_thread:
+            self._batch_thread.join()
+            self._batch_thread = None
+
+            with self._batch_condition:
+                self.flush_batch()
+
+        # Unbind socket address
+        self._socket_pub.close()
+        self._socket_rep.close()
+
+        if self._shm:
+            self._shm.close()
+
+    def run_serial(self) -> None:
+        """
+        Execute requests one by one in server thread.
+        """
         while self._active:
-            # Poll response socket for 1 second
-            n: int = self._socket_rep.poll(1000)
+            # Poll response socket for 0.1 second
+            n: int = self._socket_rep.poll(100)
+            self.check_subscriptions()
             self.check_heartbeat()
+            self.check_metrics()
 
             if not n:
                 continue
 
             # Receive request data from Reply socket
-            req = self._socket_rep.recv_pyobj()
+            frames: list = self._socket_rep.recv_multipart(copy=False)
+            req = self._codec.loads_frames([frame.buffer for frame in frames])
 
-            # Get function name and parameters
-            name, args, kwargs = req
+            rep: list = self.execute(req)
 
-            # Try to get and execute callable function object; capture exception information if it fails
-            try:
-                func: Callable = self._functions[name]
-                r: object = func(*args, **kwargs)
-                rep: list = [True, r]
-            except Exception as e:  # noqa
-                rep = [False, traceback.format_exc()]
+            # send callable response by Reply socket, large buffers are
+            # sent as separate frames without copying
+            self._socket_rep.send_multipart(self.encode_reply(rep), copy=False)
 
-            # send callable response by Reply socket
-            self._socket_rep.send_pyobj(rep)
+    def run_pool(self) -> None:
+        """
+        Dispatch requests to worker pool and route replies back to
+        the callers.
+        """
+        # Both are created in start when workers specified
+        if not self._executor or not self._socket_reply:
+            return
 
-        # Unbind socket address
-        self._socket_pub.close()
-        self._socket_rep.close()
+        pool_executor: ThreadPoolExecutor = self._executor
+        socket_reply: zmq.Socket = self._socket_reply
+
+        poller: zmq.Poller = zmq.Poller()
+        poller.register(self._socket_rep, zmq.POLLIN)
+        poller.register(socket_reply, zmq.POLLIN)
+
+        while self._active:
+            events: dict = dict(poller.poll(100))
+            self.check_subscriptions()
+            self.check_heartbeat()
+            self.check_metrics()
+
+            # Routing frames (caller identity and delimiter) are kept
+            # together with the request and sent back with the reply
+            if self._socket_rep in events:
+                frames: list = self._socket_rep.recv_multipart(copy=False)
+
+                ix: int = get_delimiter_index(frames)
+                envelope: list = frames[:ix + 1]
+                req = self._codec.loads_frames([frame.buffer for frame in frames[ix + 1:]])
+
+                executor: ThreadPoolExecutor = self._serial_executors.get(req[0], pool_executor)
+                executor.submit(self.process_request, envelope, req)
+
+            if socket_reply in events:
+                frames = socket_reply.recv_multipart(copy=False)
+                self._socket_rep.send_multipart(frames, copy=False)
+
+        # Wait for running requests before closing sockets
+        for executor in [pool_executor, *self._serial_executors.values()]:
+            executor.shutdown()
+
+        for socket in self._worker_sockets:
+            socket.close()
+        self._worker_sockets.clear()
+
+        socket_reply.close()
+
+    def process_request(self, envelope: list, req: list) -> None:
+        """
+        Execute request in worker thread and send reply to server thread.
+        """
+        rep: list = self.execute(req)
+        msg_frames: list = self.encode_reply(rep)
+
+        # Zmq socket is not thread safe, so every worker has its own one
+        socket: zmq.Socket | None = getattr(self._local, "socket", None)
+        if not socket:
+            socket = self._context.socket(zmq.PUSH)
+            socket.setsockopt(zmq.SNDHWM, 0)
+            socket.connect(self._reply_address)
+            self._local.socket = socket
+
+            with self._lock:
+                self._worker_sockets.append(socket)
+
+        socket.send_multipart(envelope + msg_frames, copy=False)
+
+    def execute(self, req: list) -> list:
+        """
+        Execute function of request and return reply.
+        """
+        # Get function name and parameters
+        name, args, kwargs = req
+
+        start: float = perf_counter()
+
+        # Try to get and execute callable function object; capture exception information if it fails
+        try:
+            func: Callable = self._functions[name]
+            r: Any = func(*args, **kwargs)
+            rep: list = [True, r]
+        except Exception as e:  # noqa
+            rep = [False, traceback.format_exc()]
+
+        self._metrics.record(name, perf_counter() - start, not rep[0])
+
+        return rep
+
+    def encode_reply(self, rep: list) -> list:
+        """
+        Encode reply into message frames. Failure is returned to client
+        if result cannot be encoded, instead of leaving it until timeout.
+        """
+        try:
+            return self._codec.dumps_frames(rep)
+        except Exception:  # noqa
+            return self._codec.dumps_frames([False, traceback.format_exc()])
+
+    def ping(self) -> float:
+        """
+        Built-in function for measuring round-trip time by client.
+        """
+        return time()
+
+    def get_metrics(self) -> dict[str, dict]:
+        """
+        Get execution metrics of every function called.
+        """
+        return self._metrics.get_data()
+
+    def enable_metrics(self, interval: int = 10) -> None:
+        """
+        Publish metrics with METRICS_TOPIC every interval seconds.
+        """
+        self._metrics_interval = interval
+        self._metrics_at = time() + interval
+
+    def disable_metrics(self) -> None:
+        """"""
+        self._metrics_interval = 0
+
+    def check_metrics(self) -> None:
+        """
+        Check whether it is required to publish metrics.
+        """
+        if not self._metrics_interval:
+            return
+
+        now: float = time()
+
+        if now >= self._metrics_at:
+            self.publish(METRICS_TOPIC, self.get_metrics())
+            self._metrics_at = now + self._metrics_interval
 
     def publish(self, topic: str, data: object) -> None:
         """
-        Publish data
+        Publish data, which is skipped if no client subscribed topic.
+        """
+        if not self.is_subscribed(topic):
+            return
+
+        if self._batch_size:
+            self.publish_batch(topic, data)
+        else:
+            self.send_data(topic, [data])
+
+    def send_data(self, topic: str, data_list: list) -> None:
+        """
+        Publish data list of topic as one message: topic, sequence of
+        the first data, compression and encoded data list.
+
+        Every published data is numbered by a sequence increasing
+        monotonically, which is used by clients for joining with
+        snapshot.
         """
+        msg: bytes = self._compress(self._codec.dumps(data_list))
+
+        with self._lock:
+            seq: int = self._sequence + 1
+            self._sequence += len(data_list)
+
+            # Topic is at the beginning of message for subscription
+            # filtering, followed by a delimiter and header
+            header: bytes = PUBLISH_HEADER.pack(seq, self._compression_id)
+            msg = b"".join([topic.encode(), b"\0", header, msg])
+
+            if self._shm:
+                self._shm.send(msg)
+            else:
+                self._socket_pub.send(msg)
+
+    def publish_event(self, event: Event) -> None:
+        """
+        Publish event with topic of event type + key (e.g. vt_symbol),
+        clients can subscribe data of specific vt_symbols by topics.
+        """
+        self.publish(event.type + event.key, event)
+
+    def is_subscribed(self, topic: str) -> bool:
+        """
+        Check whether any client subscribed topic, which is unknown
+        when publishing through shared memory.
+        """
+        if self._shm:
+            return True
+
+        subscribed: bool | None = self._topic_subscribed.get(topic, None)
+
+        if subscribed is None:
+            # Subscription is prefix of message: topic + delimiter
+            msg_topic: bytes = topic.encode() + b"\0"
+            subscribed = any(msg_topic.startswith(prefix) for prefix in self._subscriptions)
+            self._topic_subscribed[topic] = subscribed
+
+        return subscribed
+
+    def check_subscriptions(self) -> None:
+        """
+        Receive subscription changes from XPUB socket. Only the first
+        subscription and the last unsubscription of a prefix are
+        received, so set of prefixes subscribed is enough.
+        """
+        subscriptions: set[bytes] = set(self._subscriptions)
+
         with self._lock:
-            self._socket_pub.send_pyobj([topic, data])
+            while True:
+                try:
+                    msg: bytes = self._socket_pub.recv(flags=zmq.NOBLOCK)
+                except zmq.Again:
+                    break
 
-    def register(self, func: Callable) -> None:
+                if not msg:
+                    continue
+                elif msg[0]:
+                    subscriptions.add(msg[1:])
+                else:
+                    subscriptions.discard(msg[1:])
+
+        # Replaced instead of updated in place for publishing threads
+        if subscriptions != self._subscriptions:
+            self._subscriptions = frozenset(subscriptions)
+            self._topic_subscribed = {}
+
+    def set_shm_size(self, record_size: int = RECORD_SIZE, capacity: int = CAPACITY) -> None:
+        """
+        Set record size (in bytes) and capacity (count of records) of
+        shared memory ring buffer, which should be called before start.
+
+        Message larger than record size is split into multiple records.
+        """
+        self._shm_record_size = record_size
+        self._shm_capacity = capacity
+
+    def enable_batch(self, size: int = 100, interval: int = 1000, compression: str = "") -> None:
+        """
+        Enable batch publishing, which should be called before start.
+
+        Published data is buffered by topic and flushed every size
+        messages or interval microseconds, whichever comes first.
+        Compression can be lz4, zstd or zlib.
+        """
+        self._batch_size = size
+        self._batch_interval = interval / 1_000_000
+        self._compress = get_compressor(compression)[0]
+        self._compression_id = COMPRESSIONS.index(compression)
+
+    def publish_batch(self, topic: str, data: object) -> None:
+        """
+        Add data into batch buffer.
+        """
+        with self._batch_condition:
+            data_list: list | None = self._batch.get(topic, None)
+            if data_list is None:
+                data_list = []
+                self._batch[topic] = data_list
+            data_list.append(data)
+
+            # Wake up batch thread to count down interval
+            self._batch_count += 1
+            if self._batch_count == 1:
+                self._batch_time = perf_counter()
+                self._batch_condition.notify()
+
+            if self._batch_count >= self._batch_size:
+                self.flush_batch()
+
+    def run_batch(self) -> None:
+        """
+        Flush batch buffer when interval passed since the first
+        data was buffered.
+        """
+        with self._batch_condition:
+            while self._active:
+                if not self._batch_count:
+                    self._batch_condition.wait(1)
+                    continue
+
+                wait: float = self._batch_time + self._batch_interval - perf_counter()
+                if wait > 0:
+                    self._batch_condition.wait(wait)
+                else:
+                    self.flush_batch()
+
+    def flush_batch(self) -> None:
+        """
+        Publish buffered data of every topic as one message.
+
+        Batch condition should be acquired before calling.
+        """
+        if not self._batch_count:
+            return
+
+        for topic, data_list in self._batch.items():
+            self.send_data(topic, data_list)
+
+        self._batch.clear()
+        self._batch_count = 0
+
+    def register(self, func: Callable, serial: bool = False) -> None:
         """
         Register function
+
+        In worker pool mode, calls of function registered with serial
+        are executed one by one in a dedicated thread, for functions
+        which are not thread safe.
         """
-        self._functions[func.__name__] = func
+        name: str = func.__name__
+        self._functions[name] = func
+
+        if serial and name not in self._serial_executors:
+            self._serial_executors[name] = ThreadPoolExecutor(1, thread_name_prefix=f"RpcSerial_{name}")
+
+    def register_snapshot(self, func: Callable) -> None:
+        """
+        Register function returning snapshot of server state, which is
+        called by client with sync for joining late.
+
+        Reply of the function is (sequence, snapshot). Publishing is
+        paused while taking snapshot, so all data published up to the
+        sequence is reflected in snapshot, and data published later
+        should be applied on top of it.
+
+        Data buffered in batch has no sequence yet, so it is flushed
+        before taking snapshot.
+        """
+        @wraps(func)
+        def snapshot(*args: Any, **kwargs: Any) -> tuple[int, Any]:
+            with self._batch_condition:
+                self.flush_batch()
+
+                with self._lock:
+                    return self._sequence, func(*args, **kwargs)
+
+        self.register(snapshot)
 
     def check_heartbeat(self) -> None:
         """
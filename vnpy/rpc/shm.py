@@ -0,0 +1,205 @@
+"""
+Shared memory transport of data published by RpcServer to RpcClients
+on the same host, which is selected by address scheme shm://name.
+
+Messages are written into a ring buffer by server, and read by every
+client at its own pace, so there is no copy through kernel for each
+client. Subscription filtering is done by clients locally.
+"""
+
+from math import ceil
+from struct import Struct
+
+from loguru import logger
+
+from vnpy.event.shm import RingBuffer
+
+
+SHM_SCHEME = "shm://"
+
+# Default size of record and count of records kept in ring buffer,
+# memory is only allocated when pages are touched
+RECORD_SIZE = 65536
+CAPACITY = 4096
+
+# Interval in milliseconds for polling ring buffer when idle
+POLL_INTERVAL = 1
+
+# Chunk header: chunk size, message id, chunk index, chunk count.
+# Message larger than record is split into chunks of continuous records.
+CHUNK: Struct = Struct("<IQII")
+
+
+def get_shm_name(address: str) -> str:
+    """
+    Get name of shared memory from address, or empty string if
+    address is not of shm scheme.
+    """
+    if not address.startswith(SHM_SCHEME):
+        return ""
+    return address[len(SHM_SCHEME):]
+
+
+def pack_chunk(buffer: memoryview, offset: int, chunk: tuple) -> None:
+    """"""
+    data, msg_id, index, count = chunk
+    size: int = len(data)
+
+    CHUNK.pack_into(buffer, offset, size, msg_id, index, count)
+    offset += CHUNK.size
+    buffer[offset:offset + size] = data
+
+
+def unpack_chunk(buffer: memoryview, offset: int) -> tuple[bytes, int, int, int]:
+    """"""
+    size, msg_id, index, count = CHUNK.unpack_from(buffer, offset)
+    offset += CHUNK.size
+    return bytes(buffer[offset:offset + size]), msg_id, index, count
+
+
+class ShmPublisher:
+    """
+    Write messages into shared memory ring buffer.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        record_size: int = RECORD_SIZE,
+        capacity: int = CAPACITY
+    ) -> None:
+        """
+        Message larger than record size is written as multiple records,
+        so record size only needs to fit most messages.
+        """
+        if record_size <= CHUNK.size:
+            raise ValueError(f"Record size {record_size} is too small")
+
+        self.ring: RingBuffer = RingBuffer(name, record_size, capacity, create=True)
+        self.chunk_size: int = record_size - CHUNK.size
+        self.msg_id: int = 0
+
+        # Count of messages too large to fit into ring buffer
+        self.skipped: int = 0
+
+    def send(self, msg: bytes) -> None:
+        """
+        Send message, should be called by one thread at the same time.
+        """
+        self.msg_id += 1
+
+        size: int = len(msg)
+        if size <= self.chunk_size:
+            self.ring.write(pack_chunk, (msg, self.msg_id, 0, 1))
+            return
+
+        # Message can not be read completely if it overwrites itself
+        count: int = ceil(size / self.chunk_size)
+        if count > self.ring.capacity:
+            self.skipped += 1
+            logger.warning(
+                f"Message of {size} bytes skipped, exceeding shared memory "
+                f"ring buffer of {self.ring.capacity} x {self.ring.record_size} bytes"
+            )
+            return
+
+        view: memoryview = memoryview(msg)
+        for index in range(count):
+            start: int = index * self.chunk_size
+            chunk: memoryview = view[start:start + self.chunk_size]
+            self.ring.write(pack_chunk, (chunk, self.msg_id, index, count))
+
+    def close(self) -> None:
+        """"""
+        self.ring.close()
+
+
+class ShmSubscriber:
+    """
+    Read messages of subscribed topics from shared memory ring buffer.
+    """
+
+    def __init__(self, name: str) -> None:
+        """
+        Ring buffer is attached when first read, so that client can be
+        started before server.
+        """
+        self.name: str = name
+        self.ring: RingBuffer | None = None
+        self.seq: int = 0
+
+        # Prefixes of messages subscribed, the same prefix may be
+        # subscribed multiple times like zmq
+        self.prefixes: list[bytes] = []
+
+        # Count of records lost due to being overwritten
+        self.lost: int = 0
+
+        # Chunks received of the message being joined
+        self.chunks: list[bytes] = []
+        self.msg_id: int = 0
+
+    def subscribe(self, topic: str) -> None:
+        """"""
+        self.prefixes.append(topic.encode())
+
+    def unsubscribe(self, topic: str) -> None:
+        """"""
+        prefix: bytes = topic.encode()
+        if prefix in self.prefixes:
+            self.prefixes.remove(prefix)
+
+    def recv(self) -> list[bytes]:
+        """
+        Receive all messages of subscribed topics after the last read.
+        """
+        if not self.ring:
+            try:
+                self.ring = RingBuffer(self.name)
+            except FileNotFoundError:
+                return []
+            self.seq = self.ring.get_write_seq()
+
+        records, self.seq, lost = self.ring.read(unpack_chunk, self.seq)
+        self.lost += lost
+
+        if not records:
+            return records
+
+        msgs: list[bytes] = []
+
+        for data, msg_id, index, count in records:
+            if count == 1:
+                msgs.append(data)
+                continue
+
+            # Message with any chunk lost is dropped
+            if index == 0:
+                self.chunks = [data]
+                self.msg_id = msg_id
+            elif msg_id == self.msg_id and index == len(self.chunks):
+                self.chunks.append(data)
+            else:
+                self.chunks = []
+                continue
+
+            if len(self.chunks) == count:
+                msgs.append(b"".join(self.chunks))
+                self.chunks = []
+
+        prefixes: tuple[bytes, ...] = tuple(self.prefixes)
+        return [msg for msg in msgs if msg.startswith(prefixes)]
+
+    def reset(self) -> None:
+        """
+        Detach ring buffer so that it is attached again when next read,
+        since restarted server creates a new one with the same name.
+        """
+        self.close()
+        self.chunks = []
+
+    def close(self) -> None:
+        """"""
+        if self.ring:
+            self.ring.close()
+            self.ring = None
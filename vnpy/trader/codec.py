@@ -0,0 +1,862 @@
+"""
+Compact binary codec of trader data objects based on field schema.
+"""
+
+from collections import deque
+from collections.abc import Callable, Iterable
+from dataclasses import MISSING, fields as get_fields
+from datetime import datetime, timedelta, timezone, tzinfo
+from enum import Enum
+from functools import partial
+from itertools import repeat
+from operator import attrgetter, floordiv, sub
+from math import isnan
+from struct import Struct, error as StructError, pack
+from typing import Any
+from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
+
+import numpy as np
+
+from .constant import (
+    Direction,
+    Exchange,
+    Interval,
+    Offset,
+    OptionType,
+    OrderType,
+    Product,
+    Status
+)
+from .object import (
+    AccountData,
+    BarData,
+    CancelRequest,
+    ContractData,
+    HistoryRequest,
+    OrderData,
+    OrderRequest,
+    PositionData,
+    QuoteData,
+    QuoteRequest,
+    SubscribeRequest,
+    TickData,
+    TradeData
+)
+
+
+# Field kinds used in codec schema, enum class can also be used as kind.
+FLOAT = "d"
+OPTIONAL_FLOAT = "optional_float"       # None is saved as NaN
+INT = "q"
+BOOL = "?"
+DATETIME = "datetime"
+
+
+def STR(length: int) -> str:
+    """
+    Fixed length (in bytes of utf-8) string field kind, ValueError is
+    raised when encoding longer string. None is also supported.
+    """
+    return f"{length}s"
+
+
+EPOCH: datetime = datetime(1970, 1, 1)
+MICROSECOND: timedelta = timedelta(microseconds=1)
+
+# Special values of utc offset (in minutes) of datetime field
+OFFSET_NONE: int = -32768
+OFFSET_NAIVE: int = -32767
+
+NONE_INDEX: int = 0xFFFF
+
+# Errors raised when value of data does not match field kind, which
+# are converted into ValueError by codec
+ENCODE_ERRORS: tuple[type[Exception], ...] = (StructError, TypeError, AttributeError)
+
+# Count of distinct texts in string column saved by pack_many
+COUNT: Struct = Struct("<I")
+
+# Invalid utf-8 byte used for saving None in string field
+NONE_STR: bytes = b"\xff"
+
+# Named zones of major markets are saved as zone code starting from
+# ZONE_BASE in utc offset field, so that they are restored as ZoneInfo.
+# New names should only be appended to keep codes unchanged.
+ZONE_BASE: int = 20000
+ZONE_NAMES: list[str] = [
+    "Asia/Shanghai",
+    "Asia/Hong_Kong",
+    "Asia/Taipei",
+    "Asia/Tokyo",
+    "Asia/Seoul",
+    "Asia/Singapore",
+    "Asia/Kolkata",
+    "Europe/London",
+    "Europe/Berlin",
+    "America/New_York",
+    "America/Chicago",
+    "Australia/Sydney",
+    "UTC",
+]
+
+ZONES: dict[int, tzinfo] = {}
+ZONE_CODES: dict[tzinfo, int] = {}
+ZONE_EPOCHS: dict[int, datetime] = {}
+
+TZINFO_GETTER: Callable = attrgetter("tzinfo")
+
+
+def load_zones() -> None:
+    """
+    Load named zones available in system tz database.
+    """
+    for ix, name in enumerate(ZONE_NAMES):
+        try:
+            zone: tzinfo = ZoneInfo(name)
+        except ZoneInfoNotFoundError:
+            continue
+
+        ZONES[ZONE_BASE + ix] = zone
+        ZONE_CODES[zone] = ZONE_BASE + ix
+
+
+load_zones()
+
+
+def get_zone(offset: int) -> tzinfo:
+    """
+    Get timezone object of utc offset in minutes.
+    """
+    zone: tzinfo | None = ZONES.get(offset, None)
+    if not zone:
+        zone = timezone(timedelta(minutes=offset))
+        ZONES[offset] = zone
+    return zone
+
+
+def encode_datetime(dt: datetime | None) -> tuple[int, int]:
+    """
+    Encode datetime into wall clock microseconds and utc offset minutes
+    (or zone code for named zone).
+    """
+    if dt is None:
+        return 0, OFFSET_NONE
+
+    code: int | None = ZONE_CODES.get(dt.tzinfo, None)     # type: ignore
+    if code is not None:
+        return (dt.replace(tzinfo=None) - EPOCH) // MICROSECOND, code
+
+    delta: timedelta | None = dt.utcoffset()
+    if delta is None:
+        return (dt - EPOCH) // MICROSECOND, OFFSET_NAIVE
+
+    return (dt.replace(tzinfo=None) - EPOCH) // MICROSECOND, int(delta.total_seconds()) // 60
+
+
+def decode_datetime(us: int, offset: int) -> datetime | None:
+    """
+    Decode datetime from wall clock microseconds and utc offset minutes
+    (or zone code for named zone).
+
+    Named zone is restored as ZoneInfo, other timezone of aware datetime
+    is restored as fixed offset timezone.
+    """
+    if offset == OFFSET_NONE:
+        return None
+
+    if offset == OFFSET_NAIVE:
+        return EPOCH + timedelta(microseconds=us)
+
+    return get_epoch(offset) + timedelta(microseconds=us)
+
+
+def get_epoch(offset: int) -> datetime:
+    """
+    Get epoch datetime of utc offset minutes (or zone code).
+    """
+    epoch: datetime | None = ZONE_EPOCHS.get(offset, None)
+    if not epoch:
+        if offset == OFFSET_NAIVE:
+            epoch = EPOCH
+        else:
+            epoch = EPOCH.replace(tzinfo=get_zone(offset))
+        ZONE_EPOCHS[offset] = epoch
+    return epoch
+
+
+def get_zone_offset(zone: tzinfo | None) -> int | None:
+    """
+    Get utc offset minutes (or zone code) shared by all datetimes of
+    the timezone, None is returned if it changes with time (e.g. DST).
+    """
+    if zone is None:
+        return OFFSET_NAIVE
+
+    code: int | None = ZONE_CODES.get(zone, None)
+    if code is not None:
+        return code
+
+    if isinstance(zone, timezone):
+        seconds: float = zone.utcoffset(None).total_seconds()
+        if not seconds % 60:
+            return int(seconds) // 60
+
+    return None
+
+
+def encode_datetime_column(column: tuple) -> tuple[list[int], list[int]]:
+    """
+    Encode column of datetimes into wall clock microseconds and utc
+    offset minutes. Datetimes of the same timezone are converted by
+    subtracting epoch of the timezone, without calling python function
+    for each of them.
+    """
+    if None not in column:
+        zones: set[tzinfo | None] = set(map(TZINFO_GETTER, column))
+
+        if len(zones) == 1:
+            offset: int | None = get_zone_offset(zones.pop())
+
+            if offset is not None:
+                # Subtracting datetime of the same tzinfo gives wall clock delta
+                epoch: datetime = get_epoch(offset)
+                deltas: Iterable[timedelta] = map(sub, column, repeat(epoch))
+                us: list[int] = list(map(floordiv, deltas, repeat(MICROSECOND)))
+                return us, [offset] * len(column)
+
+    us_values, offsets = zip(*map(encode_datetime, column), strict=True)
+    return list(us_values), list(offsets)
+
+
+def decode_datetime_column(us: list[int], offsets: np.ndarray) -> list[datetime | None]:
+    """
+    Decode column of datetimes from wall clock microseconds and utc
+    offset minutes.
+    """
+    offset: int = int(offsets[0])
+
+    if offset != OFFSET_NONE and (offsets == offset).all():
+        epoch: datetime = get_epoch(offset)
+        return list(map(epoch.__add__, map(MICROSECOND.__mul__, us)))
+
+    return list(map(decode_datetime, us, offsets.tolist()))
+
+
+def encode_optional_float(value: float | None) -> float:
+    """"""
+    if value is None:
+        return float("nan")
+    return value
+
+
+def decode_optional_float(value: float) -> float | None:
+    """"""
+    if isnan(value):
+        return None
+    return value
+
+
+class DataCodec:
+    """
+    Binary codec of a data class based on schema.
+
+    Schema is a list of (field name, kind) and the kind can be
+    FLOAT/OPTIONAL_FLOAT/INT/BOOL/DATETIME/STR(n) or an enum class.
+    Fields not in schema (e.g. extra) are left as default value
+    after decoding.
+
+    Two layouts are provided:
+        * pack/unpack: compact record with variable length strings
+        * pack_into/unpack_from: fixed size record for shared buffer
+    """
+
+    def __init__(self, data_class: type, schema: list[tuple[str, Any]]) -> None:
+        """"""
+        self.data_class: type = data_class
+
+        # Only fields in __init__ can be saved, others use default value
+        init_names: set[str] = set()
+        schema_names: set[str] = {name for name, _ in schema}
+        self.defaults: dict[str, Any] = {}
+        self.factories: dict[str, Callable] = {}
+
+        for f in get_fields(data_class):
+            if f.init:
+                init_names.add(f.name)
+
+            if f.name in schema_names:
+                continue
+            elif f.default is not MISSING:
+                self.defaults[f.name] = f.default
+            elif f.default_factory is not MISSING:
+                self.factories[f.name] = f.default_factory
+
+        for name in schema_names:
+            if name not in init_names:
+                raise ValueError(f"{name} is not an init field of {data_class.__name__}")
+
+        self.post_init: Callable | None = getattr(data_class, "__post_init__", None)
+
+        # Values are arranged as non-string fields first, then strings
+        num_schema: list[tuple[str, Any]] = []
+        str_schema: list[tuple[str, int]] = []
+
+        for name, kind in schema:
+            if isinstance(kind, str) and kind.endswith("s"):
+                str_schema.append((name, int(kind[:-1])))
+            else:
+                num_schema.append((name, kind))
+
+        self.names: list[str] = [name for name, _ in num_schema] + [name for name, _ in str_schema]
+        self.getter: Callable = attrgetter(*self.names)
+        self.all_names: list[str] = self.names + list(self.defaults)
+
+        fmt: str = "<"
+        self.formats: list[str] = []                        # struct format of each non-string field
+        self.encoders: list[tuple[int, Callable]] = []      # (field index, encode function)
+        self.decoders: list[tuple[int, Callable]] = []      # (value index, decode function)
+        value_ix: int = 0
+
+        for field_ix, (_, kind) in enumerate(num_schema):
+            if isinstance(kind, type) and issubclass(kind, Enum):
+                fmt += "H"
+                self.encoders.append((field_ix, self._enum_encoder(kind)))
+                self.decoders.append((value_ix, self._enum_decoder(kind)))
+            elif kind == DATETIME:
+                fmt += "qh"
+                self.encoders.append((field_ix, encode_datetime))
+                self.decoders.append((value_ix, decode_datetime))
+                value_ix += 1
+            elif kind == OPTIONAL_FLOAT:
+                fmt += "d"
+                self.encoders.append((field_ix, encode_optional_float))
+                self.decoders.append((value_ix, decode_optional_float))
+            else:
+                fmt += kind
+
+            self.formats.append(fmt[-2:] if kind == DATETIME else fmt[-1])
+            value_ix += 1
+
+        # Kinds of non-string fields used for columns of values, enum
+        # members are mapped by id which avoids calling Enum.__hash__
+        self.kinds: list[Any] = [kind for _, kind in num_schema]
+        self.enum_ids: dict[int, dict[int, int]] = {}
+        self.column_decoders: dict[int, Callable] = {}
+
+        for (field_ix, _), (_, decode) in zip(self.encoders, self.decoders, strict=True):
+            self.column_decoders[field_ix] = decode
+
+            kind = self.kinds[field_ix]
+            if isinstance(kind, type) and issubclass(kind, Enum):
+                enum_ids: dict[int, int] = {id(member): i for i, member in enumerate(kind)}
+                enum_ids[id(None)] = NONE_INDEX
+                self.enum_ids[field_ix] = enum_ids
+        self.encoders.reverse()
+        self.decoders.reverse()
+
+        self.num_count: int = len(num_schema)
+        self.str_lengths: list[int] = [length for _, length in str_schema]
+
+        # String length is saved as one byte in compact layout
+        if any(length > 255 for length in self.str_lengths):
+            raise ValueError("String field longer than 255 bytes is not supported")
+
+        # Compact layout: non-string values, string lengths, string bytes
+        self.num_struct: Struct = Struct(fmt)
+
+        # Fixed layout: non-string values, fixed size string bytes
+        self.struct: Struct = Struct(fmt + "".join(f"{length}s" for length in self.str_lengths))
+        self.size: int = self.struct.size
+
+    @staticmethod
+    def _enum_encoder(enum_class: type[Enum]) -> Callable:
+        """"""
+        index_map: dict[Enum | None, int] = {member: i for i, member in enumerate(enum_class)}
+        index_map[None] = NONE_INDEX
+        return index_map.__getitem__
+
+    @staticmethod
+    def _enum_decoder(enum_class: type[Enum]) -> Callable:
+        """"""
+        member_map: dict[int, Enum | None] = dict(enumerate(enum_class))
+        member_map[NONE_INDEX] = None
+        return member_map.__getitem__
+
+    def _encode(self, data: Any) -> tuple[list, list[bytes]]:
+        """
+        Convert data object into non-string values and string bytes.
+        """
+        values: tuple = self.getter(data)
+        nums: list = list(values[:self.num_count])
+        strs: list[bytes] = []
+
+        # Datetime field is flattened into two values, so convert
+        # from the last field to keep indexes of previous ones
+        for ix, encode in self.encoders:
+            value: Any = encode(nums[ix])
+            if value.__class__ is tuple:
+                nums[ix:ix + 1] = value
+            else:
+                nums[ix] = value
+
+        for text, length in zip(values[self.num_count:], self.str_lengths, strict=True):
+            if text is None:
+                strs.append(NONE_STR)
+                continue
+
+            data_bytes: bytes = text.encode("utf-8")
+            if len(data_bytes) > length:
+                raise ValueError(f"String longer than {length} bytes: {text}")
+            strs.append(data_bytes)
+
+        return nums, strs
+
+    def _decode(self, nums: list, strs: list[bytes]) -> Any:
+        """
+        Create data object from non-string values and string bytes.
+        """
+        for ix, decode in self.decoders:
+            if decode is decode_datetime:
+                nums[ix:ix + 2] = [decode(nums[ix], nums[ix + 1])]
+            else:
+                nums[ix] = decode(nums[ix])
+
+        for data_bytes in strs:
+            if data_bytes == NONE_STR:
+                nums.append(None)
+            else:
+                nums.append(data_bytes.decode("utf-8"))
+
+        return self._create(nums)
+
+    def _create(self, values: Iterable) -> Any:
+        """
+        Create data object from decoded field values.
+        """
+        # Set attributes directly which is faster than calling __init__
+        obj: Any = object.__new__(self.data_class)
+        obj.__dict__.update(zip(self.names, values, strict=True))
+        obj.__dict__.update(self.defaults)
+
+        for name, factory in self.factories.items():
+            setattr(obj, name, factory())
+
+        if self.post_init:
+            self.post_init(obj)
+
+        return obj
+
+    def _create_many(self, rows: Iterable, count: int) -> list:
+        """
+        Create data objects from rows of decoded field values followed
+        by default values, with attribute dicts built and set without
+        python loop.
+        """
+        states: Iterable[dict] = map(dict, map(partial(zip, self.all_names), rows))
+
+        objs: list = list(map(object.__new__, repeat(self.data_class, count)))
+        deque(map(setattr, objs, repeat("__dict__"), states), maxlen=0)
+
+        for name, factory in self.factories.items():
+            for obj in objs:
+                setattr(obj, name, factory())
+
+        if self.post_init:
+            deque(map(self.post_init, objs), maxlen=0)
+
+        return objs
+
+    def pack(self, data: Any) -> bytes:
+        """
+        Encode data object into compact record bytes.
+        """
+        try:
+            nums, strs = self._encode(data)
+            return self.num_struct.pack(*nums) + bytes(map(len, strs)) + b"".join(strs)
+        except ENCODE_ERRORS as e:
+            raise ValueError(f"Data not fit into schema: {e}") from e
+
+    def unpack(self, buffer: Any, offset: int = 0) -> Any:
+        """
+        Decode data object from compact record in buffer at offset.
+        """
+        return self._unpack_compact(buffer, offset)[0]
+
+    def _unpack_compact(self, buffer: Any, offset: int) -> tuple[Any, int]:
+        """
+        Decode data object from compact record, and return it together
+        with the offset of next record.
+        """
+        nums: list = list(self.num_struct.unpack_from(buffer, offset))
+        offset += self.num_struct.size
+
+        lengths: bytes = bytes(buffer[offset:offset + len(self.str_lengths)])
+        offset += len(lengths)
+
+        strs: list[bytes] = []
+        for length in lengths:
+            strs.append(bytes(buffer[offset:offset + length]))
+            offset += length
+
+        return self._decode(nums, strs), offset
+
+    def pack_many(self, data_list: list) -> bytes:
+        """
+        Encode list of data objects into columns of values, which is
+        much faster than packing records one by one. Numeric columns
+        are converted by numpy as a whole.
+        """
+        try:
+            return self._pack_many(data_list)
+        except ENCODE_ERRORS as e:
+            raise ValueError(f"Data not fit into schema: {e}") from e
+
+    def _pack_many(self, data_list: list) -> bytes:
+        """"""
+        count: int = len(data_list)
+        if not count:
+            return b""
+
+        columns: list[tuple] = list(zip(*map(self.getter, data_list), strict=True))
+        blocks: list[bytes] = []
+
+        for ix, (kind, fmt) in enumerate(zip(self.kinds, self.formats, strict=True)):
+            column: Any = columns[ix]
+
+            if kind == DATETIME:
+                us, offsets = encode_datetime_column(column)
+                blocks.append(np.array(us, dtype="<i8").tobytes())
+                blocks.append(np.array(offsets, dtype="<i2").tobytes())
+            elif ix in self.enum_ids:
+                indexes: list[int] = list(map(self.enum_ids[ix].__getitem__, map(id, column)))
+                blocks.append(np.array(indexes, dtype="<u2").tobytes())
+            elif kind in {FLOAT, OPTIONAL_FLOAT}:
+                # None is converted into NaN by numpy, which is only
+                # allowed for optional float
+                if kind == FLOAT and None in column:
+                    raise ValueError("None in float field")
+                blocks.append(np.array(column, dtype="<f8").tobytes())
+            else:
+                # Struct is used for checking type of integer and bool
+                blocks.append(pack(f"<{count}{fmt}", *column))
+
+        # String column is saved as distinct texts and their indexes,
+        # since texts like symbol are mostly the same in a column
+        for column, length in zip(columns[self.num_count:], self.str_lengths, strict=True):
+            index_map: dict[str | None, int] = {text: i for i, text in enumerate(set(column))}
+            strs: list[bytes] = [
+                NONE_STR if text is None else text.encode("utf-8") for text in index_map
+            ]
+
+            lengths: bytes = bytes(map(len, strs))
+            if max(lengths) > length:
+                raise ValueError(f"String longer than {length} bytes")
+
+            blocks.append(COUNT.pack(len(strs)))
+            blocks.append(lengths)
+            blocks.extend(strs)
+
+            indexes = list(map(index_map.__getitem__, column))
+            blocks.append(np.array(indexes, dtype="<u4").tobytes())
+
+        return b"".join(blocks)
+
+    def unpack_many(self, buffer: Any, count: int) -> list:
+        """
+        Decode list of data objects from columns saved by pack_many.
+        """
+        if not count:
+            return []
+
+        columns: list[Any] = []
+        offset: int = 0
+
+        for ix, (kind, fmt) in enumerate(zip(self.kinds, self.formats, strict=True)):
+            if kind == DATETIME:
+                us: list[int] = np.frombuffer(buffer, "<i8", count, offset).tolist()
+                offset += 8 * count
+                offsets: np.ndarray = np.frombuffer(buffer, "<i2", count, offset)
+                offset += 2 * count
+                columns.append(decode_datetime_column(us, offsets))
+                continue
+
+            array: np.ndarray = np.frombuffer(buffer, "<" + fmt, count, offset)
+            offset += array.nbytes
+
+            column: Any = array.tolist()
+
+            decode: Callable | None = self.column_decoders.get(ix, None)
+            if kind == OPTIONAL_FLOAT:
+                if np.isnan(array).any():
+                    column = list(map(decode_optional_float, column))
+            elif decode:
+                column = list(map(decode, column))
+
+            columns.append(column)
+
+        for _ in self.str_lengths:
+            text_count: int = COUNT.unpack_from(buffer, offset)[0]
+            offset += COUNT.size
+
+            lengths: bytes = bytes(buffer[offset:offset + text_count])
+            offset += text_count
+
+            texts: list[str | None] = []
+            for length in lengths:
+                data_bytes: bytes = bytes(buffer[offset:offset + length])
+                offset += length
+
+                if data_bytes == NONE_STR:
+                    texts.append(None)
+                else:
+                    texts.append(data_bytes.decode("utf-8"))
+
+            indexes: np.ndarray = np.frombuffer(buffer, "<u4", count, offset)
+            offset += indexes.nbytes
+
+            columns.append(list(map(texts.__getitem__, indexes.tolist())))
+
+        # Default values are added as columns so that each attribute
+        # dict is built at once
+        for value in self.defaults.values():
+            columns.append([value] * count)
+
+        return self._create_many(zip(*columns, strict=True), count)
+
+    def pack_into(self, buffer: Any, offset: int, data: Any) -> None:
+        """
+        Encode data object into writable buffer at offset with fixed
+        record layout.
+        """
+        try:
+            nums, strs = self._encode(data)
+            self.struct.pack_into(buffer, offset, *nums, *strs)
+        except ENCODE_ERRORS as e:
+            raise ValueError(f"Data not fit into schema: {e}") from e
+
+    def unpack_from(self, buffer: Any, offset: int = 0) -> Any:
+        """
+        Decode data object from fixed layout record in buffer at offset,
+        no intermediate copy of record bytes is made.
+        """
+        values: tuple = self.struct.unpack_from(buffer, offset)
+        nums: list = list(values[:-len(self.str_lengths)] if self.str_lengths else values)
+        strs: list[bytes] = [
+            data_bytes.rstrip(b"\0") for data_bytes in values[len(values) - len(self.str_lengths):]
+        ]
+        return self._decode(nums, strs)
+
+
+TICK_CODEC: DataCodec = DataCodec(TickData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("datetime", DATETIME),
+    ("name", STR(64)),
+    ("volume", FLOAT),
+    ("turnover", FLOAT),
+    ("open_interest", FLOAT),
+    ("last_price", FLOAT),
+    ("last_volume", FLOAT),
+    ("limit_up", FLOAT),
+    ("limit_down", FLOAT),
+    ("open_price", FLOAT),
+    ("high_price", FLOAT),
+    ("low_price", FLOAT),
+    ("pre_close", FLOAT),
+    ("bid_price_1", FLOAT),
+    ("bid_price_2", FLOAT),
+    ("bid_price_3", FLOAT),
+    ("bid_price_4", FLOAT),
+    ("bid_price_5", FLOAT),
+    ("ask_price_1", FLOAT),
+    ("ask_price_2", FLOAT),
+    ("ask_price_3", FLOAT),
+    ("ask_price_4", FLOAT),
+    ("ask_price_5", FLOAT),
+    ("bid_volume_1", FLOAT),
+    ("bid_volume_2", FLOAT),
+    ("bid_volume_3", FLOAT),
+    ("bid_volume_4", FLOAT),
+    ("bid_volume_5", FLOAT),
+    ("ask_volume_1", FLOAT),
+    ("ask_volume_2", FLOAT),
+    ("ask_volume_3", FLOAT),
+    ("ask_volume_4", FLOAT),
+    ("ask_volume_5", FLOAT),
+    ("localtime", DATETIME),
+])
+
+
+ORDER_CODEC: DataCodec = DataCodec(OrderData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("orderid", STR(64)),
+    ("type", OrderType),
+    ("direction", Direction),
+    ("offset", Offset),
+    ("price", FLOAT),
+    ("volume", FLOAT),
+    ("traded", FLOAT),
+    ("status", Status),
+    ("datetime", DATETIME),
+    ("reference", STR(64)),
+])
+
+
+TRADE_CODEC: DataCodec = DataCodec(TradeData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("orderid", STR(64)),
+    ("tradeid", STR(64)),
+    ("direction", Direction),
+    ("offset", Offset),
+    ("price", FLOAT),
+    ("volume", FLOAT),
+    ("datetime", DATETIME),
+])
+
+
+BAR_CODEC: DataCodec = DataCodec(BarData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("datetime", DATETIME),
+    ("interval", Interval),
+    ("volume", FLOAT),
+    ("turnover", FLOAT),
+    ("open_interest", FLOAT),
+    ("open_price", FLOAT),
+    ("high_price", FLOAT),
+    ("low_price", FLOAT),
+    ("close_price", FLOAT),
+])
+
+
+POSITION_CODEC: DataCodec = DataCodec(PositionData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("direction", Direction),
+    ("volume", FLOAT),
+    ("frozen", FLOAT),
+    ("price", FLOAT),
+    ("pnl", FLOAT),
+    ("yd_volume", FLOAT),
+])
+
+
+ACCOUNT_CODEC: DataCodec = DataCodec(AccountData, [
+    ("gateway_name", STR(32)),
+    ("accountid", STR(64)),
+    ("balance", FLOAT),
+    ("frozen", FLOAT),
+])
+
+
+CONTRACT_CODEC: DataCodec = DataCodec(ContractData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("name", STR(64)),
+    ("product", Product),
+    ("size", FLOAT),
+    ("pricetick", FLOAT),
+    ("min_volume", FLOAT),
+    ("max_volume", OPTIONAL_FLOAT),
+    ("stop_supported", BOOL),
+    ("net_position", BOOL),
+    ("history_data", BOOL),
+    ("option_strike", OPTIONAL_FLOAT),
+    ("option_underlying", STR(32)),
+    ("option_type", OptionType),
+    ("option_listed", DATETIME),
+    ("option_expiry", DATETIME),
+    ("option_portfolio", STR(32)),
+    ("option_index", STR(32)),
+])
+
+
+QUOTE_CODEC: DataCodec = DataCodec(QuoteData, [
+    ("gateway_name", STR(32)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("quoteid", STR(64)),
+    ("bid_price", FLOAT),
+    ("bid_volume", INT),
+    ("ask_price", FLOAT),
+    ("ask_volume", INT),
+    ("bid_offset", Offset),
+    ("ask_offset", Offset),
+    ("status", Status),
+    ("datetime", DATETIME),
+    ("reference", STR(64)),
+])
+
+
+SUBSCRIBE_REQUEST_CODEC: DataCodec = DataCodec(SubscribeRequest, [
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+])
+
+
+ORDER_REQUEST_CODEC: DataCodec = DataCodec(OrderRequest, [
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("direction", Direction),
+    ("type", OrderType),
+    ("volume", FLOAT),
+    ("price", FLOAT),
+    ("offset", Offset),
+    ("reference", STR(64)),
+])
+
+
+CANCEL_REQUEST_CODEC: DataCodec = DataCodec(CancelRequest, [
+    ("orderid", STR(64)),
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+])
+
+
+HISTORY_REQUEST_CODEC: DataCodec = DataCodec(HistoryRequest, [
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("start", DATETIME),
+    ("end", DATETIME),
+    ("interval", Interval),
+])
+
+
+QUOTE_REQUEST_CODEC: DataCodec = DataCodec(QuoteRequest, [
+    ("symbol", STR(32)),
+    ("exchange", Exchange),
+    ("bid_price", FLOAT),
+    ("bid_volume", INT),
+    ("ask_price", FLOAT),
+    ("ask_volume", INT),
+    ("bid_offset", Offset),
+    ("ask_offset", Offset),
+    ("reference", STR(64)),
+])
+
+
+# All codecs of trader data objects, index in list is used as type id
+# in serialized data, so new codec should only be appended at the end.
+DATA_CODECS: list[DataCodec] = [
+    TICK_CODEC,
+    BAR_CODEC,
+    ORDER_CODEC,
+    TRADE_CODEC,
+    POSITION_CODEC,
+    ACCOUNT_CODEC,
+    CONTRACT_CODEC,
+    QUOTE_CODEC,
+    SUBSCRIBE_REQUEST_CODEC,
+    ORDER_REQUEST_CODEC,
+    CANCEL_REQUEST_CODEC,
+    HISTORY_REQUEST_CODEC,
+    QUOTE_REQUEST_CODEC,
+]
@@ -1,4 +1,5 @@
 from copy import copy
+from itertools import count
 from typing import TYPE_CHECKING
 
 from .object import (
@@ -14,6 +15,135 @@ if TYPE_CHECKING:
     from .engine import OmsEngine
 
 
+class FrozenVolume:
+    """
+    Frozen volume of one position direction by active close orders,
+    which is updated by change of each order instead of summing all
+    active orders again.
+
+    Close orders freeze today position first, and volume exceeding
+    today position is moved to yesterday at each close order, so close
+    today orders after the last close order (in order of becoming
+    active) are tracked separately to get the same result as summing
+    orders one by one.
+    """
+
+    def __init__(self) -> None:
+        """"""
+        self.today: float = 0           # CLOSETODAY orders
+        self.yesterday: float = 0       # CLOSEYESTERDAY orders
+        self.close: float = 0           # CLOSE orders
+
+        self.yesterday_count: int = 0                           # number of CLOSEYESTERDAY orders
+        self.close_seqs: dict[str, int] = {}                    # vt_orderid: seq
+        self.today_orders: dict[str, tuple[int, float]] = {}    # vt_orderid: (seq, frozen)
+
+        # Frozen of CLOSETODAY orders after the last CLOSE order
+        self.today_tail: float = 0
+
+    def get_last_close_seq(self) -> int:
+        """"""
+        if not self.close_seqs:
+            return 0
+        return self.close_seqs[next(reversed(self.close_seqs))]
+
+    def add(self, order: OrderData, seq: int) -> None:
+        """
+        Add order becoming active, seq should be larger than all others.
+        """
+        frozen: float = order.volume - order.traded
+
+        if order.offset == Offset.CLOSETODAY:
+            self.today += frozen
+            self.today_orders[order.vt_orderid] = (seq, frozen)
+            self.today_tail += frozen
+        elif order.offset == Offset.CLOSEYESTERDAY:
+            self.yesterday += frozen
+            self.yesterday_count += 1
+        elif order.offset == Offset.CLOSE:
+            self.close += frozen
+            self.close_seqs[order.vt_orderid] = seq
+            self.today_tail = 0
+
+    def change(self, old: OrderData, new: OrderData) -> None:
+        """
+        Apply change of frozen volume of active order.
+        """
+        delta: float = (new.volume - new.traded) - (old.volume - old.traded)
+        if not delta:
+            return
+
+        if new.offset == Offset.CLOSETODAY:
+            self.today += delta
+
+            seq, frozen = self.today_orders[new.vt_orderid]
+            self.today_orders[new.vt_orderid] = (seq, frozen + delta)
+
+            if seq > self.get_last_close_seq():
+                self.today_tail += delta
+        elif new.offset == Offset.CLOSEYESTERDAY:
+            self.yesterday += delta
+        elif new.offset == Offset.CLOSE:
+            self.close += delta
+
+    def remove(self, order: OrderData) -> None:
+        """
+        Remove order becoming inactive.
+
+        Sums are reset when no order of the offset left, so that residue
+        of float arithmetic is not accumulated with non-integer volume.
+        """
+        frozen: float = order.volume - order.traded
+
+        if order.offset == Offset.CLOSETODAY:
+            self.today -= frozen
+
+            seq, _ = self.today_orders.pop(order.vt_orderid)
+            if seq > self.get_last_close_seq():
+                self.today_tail -= frozen
+
+            if not self.today_orders:
+                self.today = 0
+                self.today_tail = 0
+        elif order.offset == Offset.CLOSEYESTERDAY:
+            self.yesterday -= frozen
+            self.yesterday_count -= 1
+
+            if not self.yesterday_count:
+                self.yesterday = 0
+        elif order.offset == Offset.CLOSE:
+            self.close -= frozen
+
+            seq = self.close_seqs.pop(order.vt_orderid)
+            if not self.close_seqs:
+                self.close = 0
+
+            # Tail is summed again only if the last close order removed
+            last_seq: int = self.get_last_close_seq()
+
+            if seq > last_seq:
+                self.today_tail = 0
+                for today_seq, today_frozen in reversed(self.today_orders.values()):
+                    if today_seq < last_seq:
+                        break
+                    self.today_tail += today_frozen
+
+    def get_frozen(self, td: float) -> tuple[float, float]:
+        """
+        Get frozen volume of today and yesterday position.
+        """
+        td_frozen: float = self.today + self.close
+        yd_frozen: float = self.yesterday
+
+        if self.close_seqs:
+            exceeded: float = td_frozen - self.today_tail - td
+            if exceeded > 0:
+                td_frozen -= exceeded
+                yd_frozen += exceeded
+
+        return td_frozen, yd_frozen
+
+
 class PositionHolding:
     """"""
 
@@ -24,6 +154,12 @@ class PositionHolding:
 
         self.active_orders: dict[str, OrderData] = {}
 
+        # Frozen volume of long position by short close orders, and
+        # short position by long close orders
+        self.long_frozen: FrozenVolume = FrozenVolume()
+        self.short_frozen: FrozenVolume = FrozenVolume()
+        self.order_count: count = count(1)
+
         self.long_pos: float = 0
         self.long_yd: float = 0
         self.long_td: float = 0
@@ -53,12 +189,25 @@ class PositionHolding:
 
     def update_order(self, order: OrderData) -> None:
         """"""
+        old: OrderData | None = self.active_orders.get(order.vt_orderid, None)
+
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
         else:
             if order.vt_orderid in self.active_orders:
                 self.active_orders.pop(order.vt_orderid)
 
+        # Only change of the order is applied to frozen volume
+        if old is None:
+            if order.is_active():
+                self.get_frozen_volume(order).add(order, next(self.order_count))
+        elif not order.is_active():
+            self.get_frozen_volume(old).remove(old)
+        elif old.direction == order.direction and old.offset == order.offset:
+            self.get_frozen_volume(order).change(old, order)
+        else:
+            self.rebuild_frozen()
+
         self.calculate_frozen()
 
     def update_order_request(self, req: OrderRequest, vt_orderid: str) -> None:
@@ -109,47 +258,32 @@ class PositionHolding:
         # Update frozen volume to ensure no more than total volume
         self.sum_pos_frozen()
 
-    def calculate_frozen(self) -> None:
-        """"""
-        self.long_pos_frozen = 0
-        self.long_yd_frozen = 0
-        self.long_td_frozen = 0
+    def get_frozen_volume(self, order: OrderData) -> FrozenVolume:
+        """
+        Get frozen volume of position closed by order. Orders of other
+        direction or offset are added into a dummy one and ignored.
+        """
+        if order.direction == Direction.LONG:
+            return self.short_frozen
+        elif order.direction == Direction.SHORT:
+            return self.long_frozen
+        else:
+            return FrozenVolume()
 
-        self.short_pos_frozen = 0
-        self.short_yd_frozen = 0
-        self.short_td_frozen = 0
+    def rebuild_frozen(self) -> None:
+        """
+        Rebuild frozen volume from all active orders.
+        """
+        self.long_frozen = FrozenVolume()
+        self.short_frozen = FrozenVolume()
 
         for order in self.active_orders.values():
-            # Ignore position open orders
-            if order.offset == Offset.OPEN:
-                continue
-
-            frozen: float = order.volume - order.traded
-
-            if order.direction == Direction.LONG:
-                if order.offset == Offset.CLOSETODAY:
-                    self.short_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.short_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.short_td_frozen += frozen
-
-                    if self.short_td_frozen > self.short_td:
-                        self.short_yd_frozen += (self.short_td_frozen
-                                                 - self.short_td)
-                        self.short_td_frozen = self.short_td
-            elif order.direction == Direction.SHORT:
-                if order.offset == Offset.CLOSETODAY:
-                    self.long_td_frozen += frozen
-                elif order.offset == Offset.CLOSEYESTERDAY:
-                    self.long_yd_frozen += frozen
-                elif order.offset == Offset.CLOSE:
-                    self.long_td_frozen += frozen
-
-                    if self.long_td_frozen > self.long_td:
-                        self.long_yd_frozen += (self.long_td_frozen
-                                                - self.long_td)
-                        self.long_td_frozen = self.long_td
+            self.get_frozen_volume(order).add(order, next(self.order_count))
+
+    def calculate_frozen(self) -> None:
+        """"""
+        self.long_td_frozen, self.long_yd_frozen = self.long_frozen.get_frozen(self.long_td)
+        self.short_td_frozen, self.short_yd_frozen = self.short_frozen.get_frozen(self.short_td)
 
         self.sum_pos_frozen()
 
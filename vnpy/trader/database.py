@@ -5,7 +5,7 @@ from dataclasses import dataclass
 from importlib import import_module
 
 from .constant import Interval, Exchange
-from .object import BarData, TickData
+from .object import BarData, TickData, BarBatch, TickBatch
 from .setting import SETTINGS
 from .utility import ZoneInfo
 from .locale import _
@@ -95,6 +95,47 @@ class BaseDatabase(ABC):
         """
         pass
 
+    def load_bar_batch(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        interval: Interval,
+        start: datetime,
+        end: datetime
+    ) -> BarBatch:
+        """
+        Load bar data from database as columnar batch, which can be
+        overridden to fill columns directly without creating objects.
+        """
+        bars: list[BarData] = self.load_bar_data(symbol, exchange, interval, start, end)
+        return BarBatch.from_data(
+            bars,
+            symbol=symbol,
+            exchange=exchange,
+            interval=interval,
+            gateway_name="DB"
+        )
+
+    def load_tick_batch(
+        self,
+        symbol: str,
+        exchange: Exchange,
+        start: datetime,
+        end: datetime
+    ) -> TickBatch:
+        """
+        Load tick data from database as columnar batch, which can be
+        overridden to fill columns directly without creating objects.
+        """
+        ticks: list[TickData] = self.load_tick_data(symbol, exchange, start, end)
+        return TickBatch.from_data(
+            ticks,
+            symbol=symbol,
+            exchange=exchange,
+            name=ticks[0].name if ticks else "",
+            gateway_name="DB"
+        )
+
     @abstractmethod
     def delete_bar_data(
         self,
@@ -2,13 +2,15 @@ import smtplib
 import os
 import traceback
 from abc import ABC, abstractmethod
+from collections import deque
 from email.message import EmailMessage
 from queue import Empty, Queue
 from threading import Thread
-from typing import TypeVar
+from time import time
+from typing import Any, TypeVar
 from collections.abc import Callable
 
-from vnpy.event import Event, EventEngine
+from vnpy.event import Event, EventEngine, EVENT_TIMER
 from .app import BaseApp
 from .event import (
     EVENT_TICK,
@@ -36,10 +38,12 @@ from .object import (
     PositionData,
     AccountData,
     ContractData,
-    Exchange
+    Exchange,
+    Direction
 )
 from .setting import SETTINGS
-from .utility import TRADER_DIR
+from .utility import TRADER_DIR, get_file_path
+from .journal import DataArchive
 from .converter import OffsetConverter
 from .logger import logger, DEBUG, INFO, WARNING, ERROR, CRITICAL
 from .locale import _
@@ -80,7 +84,7 @@ class MainEngine:
         if event_engine:
             self.event_engine: EventEngine = event_engine
         else:
-            self.event_engine = EventEngine()
+            self.event_engine = EventEngine(lanes=SETTINGS["event.lanes"])
         self.event_engine.start()
 
         self.gateways: dict[str, BaseGateway] = {}
@@ -142,14 +146,17 @@ class MainEngine:
         self.get_contract: Callable[[str], ContractData | None] = oms_engine.get_contract
         self.get_quote: Callable[[str], QuoteData | None] = oms_engine.get_quote
         self.get_all_ticks: Callable[[], list[TickData]] = oms_engine.get_all_ticks
-        self.get_all_orders: Callable[[], list[OrderData]] = oms_engine.get_all_orders
-        self.get_all_trades: Callable[[], list[TradeData]] = oms_engine.get_all_trades
-        self.get_all_positions: Callable[[], list[PositionData]] = oms_engine.get_all_positions
+        self.get_all_orders: Callable[..., list[OrderData]] = oms_engine.get_all_orders
+        self.get_all_trades: Callable[..., list[TradeData]] = oms_engine.get_all_trades
+        self.get_all_positions: Callable[..., list[PositionData]] = oms_engine.get_all_positions
         self.get_all_accounts: Callable[[], list[AccountData]] = oms_engine.get_all_accounts
         self.get_all_contracts: Callable[[], list[ContractData]] = oms_engine.get_all_contracts
         self.get_all_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_quotes
-        self.get_all_active_orders: Callable[[], list[OrderData]] = oms_engine.get_all_active_orders
+        self.get_all_active_orders: Callable[..., list[OrderData]] = oms_engine.get_all_active_orders
         self.get_all_active_quotes: Callable[[], list[QuoteData]] = oms_engine.get_all_active_quotes
+        self.get_snapshot: Callable[[], dict[str, list]] = oms_engine.get_snapshot
+        self.query_archived_orders: Callable[..., list[OrderData]] = oms_engine.query_archived_orders
+        self.query_archived_trades: Callable[..., list[TradeData]] = oms_engine.query_archived_trades
         self.update_order_request: Callable[[OrderRequest, str, str], None] = oms_engine.update_order_request
         self.convert_order_request: Callable[[OrderRequest, str, bool, bool], list[OrderRequest]] = oms_engine.convert_order_request
         self.get_converter: Callable[[str], OffsetConverter | None] = oms_engine.get_converter
@@ -322,6 +329,105 @@ class LogEngine(BaseEngine):
         self.event_engine.register(event_type, self.process_log_event)
 
 
+class DataIndex:
+    """
+    Secondary indexes of data objects by attributes (e.g. vt_symbol,
+    gateway_name, direction), which are updated incrementally when
+    data is added or removed, so that queries do not scan all data.
+    """
+
+    def __init__(self, attributes: list[str]) -> None:
+        """"""
+        self.attributes: list[str] = attributes
+
+        # attribute: {value: {vt id: data}}
+        self.groups: dict[str, dict[Any, dict[str, Any]]] = {name: {} for name in attributes}
+
+        # vt id: values of attributes when data was added
+        self.values: dict[str, tuple] = {}
+
+    def add(self, vt_id: str, data: Any) -> None:
+        """
+        Add data or update data already in index.
+        """
+        values: tuple = tuple(getattr(data, name) for name in self.attributes)
+
+        old_values: tuple | None = self.values.get(vt_id, None)
+        if old_values is not None and old_values != values:
+            self.remove(vt_id)
+
+        self.values[vt_id] = values
+
+        for name, value in zip(self.attributes, values, strict=True):
+            group: dict[str, Any] | None = self.groups[name].get(value, None)
+            if group is None:
+                group = {}
+                self.groups[name][value] = group
+            group[vt_id] = data
+
+    def remove(self, vt_id: str) -> None:
+        """
+        Remove data from index.
+        """
+        values: tuple | None = self.values.pop(vt_id, None)
+        if values is None:
+            return
+
+        for name, value in zip(self.attributes, values, strict=True):
+            groups: dict[Any, dict[str, Any]] = self.groups[name]
+            group: dict[str, Any] = groups[value]
+            group.pop(vt_id, None)
+
+            # Empty group is removed to keep memory flat
+            if not group:
+                groups.pop(value)
+
+    def query(self, conditions: dict[str, Any]) -> list:
+        """
+        Query data matching all conditions of attribute values. The
+        smallest group is used and filtered by other conditions.
+        """
+        groups: list[tuple[str, dict[str, Any]]] = []
+
+        for name, value in conditions.items():
+            group: dict[str, Any] | None = self.groups[name].get(value, None)
+            if not group:
+                return []
+            groups.append((name, group))
+
+        name, group = min(groups, key=lambda item: len(item[1]))
+        result: list = list(group.values())
+
+        for n, v in conditions.items():
+            if n != name:
+                result = [data for data in result if getattr(data, n) == v]
+
+        return result
+
+
+def get_conditions(
+    vt_symbol: str = "",
+    gateway_name: str = "",
+    direction: Direction | None = None
+) -> dict[str, Any]:
+    """
+    Get query conditions of arguments given.
+    """
+    conditions: dict[str, Any] = {}
+
+    if vt_symbol:
+        conditions["vt_symbol"] = vt_symbol
+    if gateway_name:
+        conditions["gateway_name"] = gateway_name
+    if direction:
+        conditions["direction"] = direction
+
+    return conditions
+
+
+INDEX_ATTRIBUTES: list[str] = ["vt_symbol", "gateway_name", "direction"]
+
+
 class OmsEngine(BaseEngine):
     """
     Provides order management system function.
@@ -342,10 +448,56 @@ class OmsEngine(BaseEngine):
         self.active_orders: dict[str, OrderData] = {}
         self.active_quotes: dict[str, QuoteData] = {}
 
+        # Indexes for querying by vt_symbol, gateway_name and direction
+        self.order_index: DataIndex = DataIndex(INDEX_ATTRIBUTES)
+        self.active_order_index: DataIndex = DataIndex(INDEX_ATTRIBUTES)
+        self.trade_index: DataIndex = DataIndex(INDEX_ATTRIBUTES)
+        self.position_index: DataIndex = DataIndex(INDEX_ATTRIBUTES)
+
+        # Retention of finished orders and trades, which are evicted
+        # from memory (and saved into archive if enabled) by count or
+        # time since finished
+        self.retention_count: int = 0
+        self.retention_seconds: float = 0
+        self.archive: DataArchive | None = None
+
+        self.finished_times: dict[str, float] = {}              # vt_orderid: finished time
+        self.finished_queue: deque[tuple[str, float]] = deque()
+        self.trade_times: dict[str, float] = {}                 # vt_tradeid: received time
+        self.trade_queue: deque[tuple[str, float]] = deque()
+
         self.offset_converters: dict[str, OffsetConverter] = {}
 
         self.register_event()
 
+        self.set_retention(
+            SETTINGS["oms.retention_count"],
+            SETTINGS["oms.retention_seconds"],
+            SETTINGS["oms.archive"]
+        )
+
+    def set_retention(self, count: int = 0, seconds: float = 0, archive: str = "") -> None:
+        """
+        Keep only the last count or the last seconds (0 for no limit)
+        of finished orders and trades in memory. Evicted data is saved
+        into archive file in temp dir if archive name given.
+        """
+        self.retention_count = count
+        self.retention_seconds = seconds
+
+        if self.archive:
+            self.archive.close()
+            self.archive = None
+
+        if archive:
+            self.archive = DataArchive(get_file_path(archive))
+
+    def close(self) -> None:
+        """"""
+        if self.archive:
+            self.archive.close()
+            self.archive = None
+
     def register_event(self) -> None:
         """"""
         self.event_engine.register(EVENT_TICK, self.process_tick_event)
@@ -355,6 +507,7 @@ class OmsEngine(BaseEngine):
         self.event_engine.register(EVENT_ACCOUNT, self.process_account_event)
         self.event_engine.register(EVENT_CONTRACT, self.process_contract_event)
         self.event_engine.register(EVENT_QUOTE, self.process_quote_event)
+        self.event_engine.register(EVENT_TIMER, self.process_timer_event)
 
     def process_tick_event(self, event: Event) -> None:
         """"""
@@ -365,13 +518,21 @@ class OmsEngine(BaseEngine):
         """"""
         order: OrderData = event.data
         self.orders[order.vt_orderid] = order
+        self.order_index.add(order.vt_orderid, order)
 
         # If order is active, then update data in dict.
         if order.is_active():
             self.active_orders[order.vt_orderid] = order
+            self.active_order_index.add(order.vt_orderid, order)
         # Otherwise, pop inactive order from in dict
         elif order.vt_orderid in self.active_orders:
             self.active_orders.pop(order.vt_orderid)
+            self.active_order_index.remove(order.vt_orderid)
+
+        # Record time when order is finished for retention
+        if not order.is_active() and (self.retention_count or self.retention_seconds):
+            self.record_time(order.vt_orderid, self.finished_times, self.finished_queue)
+            self.evict_data(self.finished_times, self.finished_queue, self.orders, self.order_index, EVENT_ORDER)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(order.gateway_name, None)
@@ -382,6 +543,11 @@ class OmsEngine(BaseEngine):
         """"""
         trade: TradeData = event.data
         self.trades[trade.vt_tradeid] = trade
+        self.trade_index.add(trade.vt_tradeid, trade)
+
+        if self.retention_count or self.retention_seconds:
+            self.record_time(trade.vt_tradeid, self.trade_times, self.trade_queue)
+            self.evict_data(self.trade_times, self.trade_queue, self.trades, self.trade_index, EVENT_TRADE)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(trade.gateway_name, None)
@@ -392,6 +558,7 @@ class OmsEngine(BaseEngine):
         """"""
         position: PositionData = event.data
         self.positions[position.vt_positionid] = position
+        self.position_index.add(position.vt_positionid, position)
 
         # Update to offset converter
         converter: OffsetConverter | None = self.offset_converters.get(position.gateway_name, None)
@@ -424,6 +591,58 @@ class OmsEngine(BaseEngine):
         elif quote.vt_quoteid in self.active_quotes:
             self.active_quotes.pop(quote.vt_quoteid)
 
+    def process_timer_event(self, event: Event) -> None:
+        """
+        Evict data by time even if no new data received.
+        """
+        if not self.retention_seconds:
+            return
+
+        self.evict_data(self.finished_times, self.finished_queue, self.orders, self.order_index, EVENT_ORDER)
+        self.evict_data(self.trade_times, self.trade_queue, self.trades, self.trade_index, EVENT_TRADE)
+
+    def record_time(self, vt_id: str, times: dict[str, float], queue: deque) -> None:
+        """
+        Record time of data for retention, data recorded again is moved
+        to the end of queue.
+        """
+        now: float = time()
+        times[vt_id] = now
+        queue.append((vt_id, now))
+
+    def evict_data(
+        self,
+        times: dict[str, float],
+        queue: deque,
+        data_dict: dict,
+        index: DataIndex,
+        type: str
+    ) -> None:
+        """
+        Evict the oldest data exceeding retention count or seconds.
+        """
+        deadline: float = time() - self.retention_seconds if self.retention_seconds else 0
+
+        while queue:
+            vt_id, timestamp = queue[0]
+
+            # Skip stale entry of data recorded again later
+            if times.get(vt_id, None) != timestamp:
+                queue.popleft()
+                continue
+
+            exceeded: bool = bool(self.retention_count) and len(times) > self.retention_count
+            if not exceeded and timestamp >= deadline:
+                break
+
+            queue.popleft()
+            times.pop(vt_id)
+            index.remove(vt_id)
+            data: Any = data_dict.pop(vt_id, None)
+
+            if data is not None and self.archive:
+                self.archive.append(type, vt_id, data)
+
     def get_tick(self, vt_symbol: str) -> TickData | None:
         """
         Get latest market tick data by vt_symbol.
@@ -472,22 +691,52 @@ class OmsEngine(BaseEngine):
         """
         return list(self.ticks.values())
 
-    def get_all_orders(self) -> list[OrderData]:
+    def get_all_orders(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[OrderData]:
         """
-        Get all order data.
+        Get all order data, or only those of vt_symbol, gateway_name
+        and direction if given.
         """
+        conditions: dict[str, Any] = get_conditions(vt_symbol, gateway_name, direction)
+        if conditions:
+            return self.order_index.query(conditions)
+
         return list(self.orders.values())
 
-    def get_all_trades(self) -> list[TradeData]:
+    def get_all_trades(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[TradeData]:
         """
-        Get all trade data.
+        Get all trade data, or only those of vt_symbol, gateway_name
+        and direction if given.
         """
+        conditions: dict[str, Any] = get_conditions(vt_symbol, gateway_name, direction)
+        if conditions:
+            return self.trade_index.query(conditions)
+
         return list(self.trades.values())
 
-    def get_all_positions(self) -> list[PositionData]:
+    def get_all_positions(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[PositionData]:
         """
-        Get all position data.
+        Get all position data, or only those of vt_symbol, gateway_name
+        and direction if given.
         """
+        conditions: dict[str, Any] = get_conditions(vt_symbol, gateway_name, direction)
+        if conditions:
+            return self.position_index.query(conditions)
+
         return list(self.positions.values())
 
     def get_all_accounts(self) -> list[AccountData]:
@@ -508,10 +757,20 @@ class OmsEngine(BaseEngine):
         """
         return list(self.quotes.values())
 
-    def get_all_active_orders(self) -> list[OrderData]:
+    def get_all_active_orders(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[OrderData]:
         """
-        Get all active orders.
+        Get all active orders, or only those of vt_symbol, gateway_name
+        and direction if given.
         """
+        conditions: dict[str, Any] = get_conditions(vt_symbol, gateway_name, direction)
+        if conditions:
+            return self.active_order_index.query(conditions)
+
         return list(self.active_orders.values())
 
     def get_all_active_quotes(self) -> list[QuoteData]:
@@ -520,6 +779,51 @@ class OmsEngine(BaseEngine):
         """
         return list(self.active_quotes.values())
 
+    def get_snapshot(self) -> dict[str, list]:
+        """
+        Get snapshot of trading state: contracts, accounts, positions
+        and orders, used by remote clients for syncing state.
+        """
+        return {
+            "contracts": self.get_all_contracts(),
+            "accounts": self.get_all_accounts(),
+            "positions": self.get_all_positions(),
+            "orders": self.get_all_orders(),
+        }
+
+    def query_archived_orders(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[OrderData]:
+        """
+        Query orders evicted into archive, which reads the whole file.
+        """
+        return self.query_archive(EVENT_ORDER, get_conditions(vt_symbol, gateway_name, direction))
+
+    def query_archived_trades(
+        self,
+        vt_symbol: str = "",
+        gateway_name: str = "",
+        direction: Direction | None = None
+    ) -> list[TradeData]:
+        """
+        Query trades evicted into archive, which reads the whole file.
+        """
+        return self.query_archive(EVENT_TRADE, get_conditions(vt_symbol, gateway_name, direction))
+
+    def query_archive(self, type: str, conditions: dict[str, Any]) -> list:
+        """"""
+        if not self.archive:
+            return []
+
+        def check(data: Any) -> bool:
+            return all(getattr(data, name) == value for name, value in conditions.items())
+
+        result: dict[str, Any] = self.archive.query(type, check)
+        return list(result.values())
+
     def update_order_request(self, req: OrderRequest, vt_orderid: str, gateway_name: str) -> None:
         """
         Update order request to offset converter.
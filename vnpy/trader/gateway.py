@@ -83,60 +83,55 @@ class BaseGateway(ABC):
         self.event_engine: EventEngine = event_engine
         self.gateway_name: str = gateway_name
 
-    def on_event(self, type: str, data: object = None) -> None:
+    def on_event(self, type: str, data: object = None, key: str = "") -> None:
         """
         General event push.
+        Event with key is also distributed to handlers of type + key.
         """
-        event: Event = Event(type, data)
+        event: Event = Event(type, data, key)
         self.event_engine.put(event)
 
     def on_tick(self, tick: TickData) -> None:
         """
         Tick event push.
-        Tick event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol also receive it by event key.
         """
-        self.on_event(EVENT_TICK, tick)
-        self.on_event(EVENT_TICK + tick.vt_symbol, tick)
+        self.on_event(EVENT_TICK, tick, tick.vt_symbol)
 
     def on_trade(self, trade: TradeData) -> None:
         """
         Trade event push.
-        Trade event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol also receive it by event key.
         """
-        self.on_event(EVENT_TRADE, trade)
-        self.on_event(EVENT_TRADE + trade.vt_symbol, trade)
+        self.on_event(EVENT_TRADE, trade, trade.vt_symbol)
 
     def on_order(self, order: OrderData) -> None:
         """
         Order event push.
-        Order event of a specific vt_orderid is also pushed.
+        Handlers of a specific vt_orderid also receive it by event key.
         """
-        self.on_event(EVENT_ORDER, order)
-        self.on_event(EVENT_ORDER + order.vt_orderid, order)
+        self.on_event(EVENT_ORDER, order, order.vt_orderid)
 
     def on_position(self, position: PositionData) -> None:
         """
         Position event push.
-        Position event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol also receive it by event key.
         """
-        self.on_event(EVENT_POSITION, position)
-        self.on_event(EVENT_POSITION + position.vt_symbol, position)
+        self.on_event(EVENT_POSITION, position, position.vt_symbol)
 
     def on_account(self, account: AccountData) -> None:
         """
         Account event push.
-        Account event of a specific vt_accountid is also pushed.
+        Handlers of a specific vt_accountid also receive it by event key.
         """
-        self.on_event(EVENT_ACCOUNT, account)
-        self.on_event(EVENT_ACCOUNT + account.vt_accountid, account)
+        self.on_event(EVENT_ACCOUNT, account, account.vt_accountid)
 
     def on_quote(self, quote: QuoteData) -> None:
         """
         Quote event push.
-        Quote event of a specific vt_symbol is also pushed.
+        Handlers of a specific vt_symbol also receive it by event key.
         """
-        self.on_event(EVENT_QUOTE, quote)
-        self.on_event(EVENT_QUOTE + quote.vt_symbol, quote)
+        self.on_event(EVENT_QUOTE, quote, quote.vt_symbol)
 
     def on_log(self, log: LogData) -> None:
         """
@@ -0,0 +1,234 @@
+"""
+Event journal for recording event stream into binary file and
+replaying it into event engine later.
+"""
+
+import pickle
+from collections.abc import Callable, Iterator
+from pathlib import Path
+from struct import Struct
+from time import perf_counter, sleep, time
+from typing import Any, BinaryIO
+
+from vnpy.event import Event, EventEngine, EVENT_TIMER, EVENT_ENGINE_STATS
+
+from .codec import DataCodec, TICK_CODEC, ORDER_CODEC, TRADE_CODEC
+from .object import OrderData, TickData, TradeData
+
+
+MAGIC: bytes = b"VNJ1"
+
+# Record header: time, data kind, type length, key length, payload length
+HEADER: Struct = Struct("<dBHHI")
+
+# Kind of record payload, typed data uses compact binary codec
+KIND_PICKLE: int = 0
+KIND_TICK: int = 1
+KIND_ORDER: int = 2
+KIND_TRADE: int = 3
+
+KIND_CODECS: dict[int, DataCodec] = {
+    KIND_TICK: TICK_CODEC,
+    KIND_ORDER: ORDER_CODEC,
+    KIND_TRADE: TRADE_CODEC,
+}
+
+CLASS_KINDS: dict[type, int] = {
+    TickData: KIND_TICK,
+    OrderData: KIND_ORDER,
+    TradeData: KIND_TRADE,
+}
+
+
+def pack_record(timestamp: float, event: Event) -> bytes:
+    """
+    Pack event into journal record.
+    """
+    data: Any = event.data
+    kind: int = CLASS_KINDS.get(data.__class__, KIND_PICKLE)
+
+    # Extra dict is not included in codec schema
+    if kind and data.extra is not None:
+        kind = KIND_PICKLE
+
+    payload: bytes = b""
+
+    # Fall back to pickle if data can not fit into codec schema
+    if kind:
+        try:
+            payload = KIND_CODECS[kind].pack(data)
+        except ValueError:
+            kind = KIND_PICKLE
+
+    if not kind:
+        payload = pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    type_bytes: bytes = event.type.encode("utf-8")
+    key_bytes: bytes = event.key.encode("utf-8")
+
+    header: bytes = HEADER.pack(timestamp, kind, len(type_bytes), len(key_bytes), len(payload))
+    return b"".join([header, type_bytes, key_bytes, payload])
+
+
+class EventRecorder:
+    """
+    Record all events passing through event engine into journal file,
+    by registering itself as general handler.
+
+    Timer events are ignored by default, since they are generated by
+    the event engine used for replaying again.
+    """
+
+    def __init__(
+        self,
+        event_engine: EventEngine,
+        path: str | Path,
+        ignored: set[str] | None = None
+    ) -> None:
+        """"""
+        self.event_engine: EventEngine = event_engine
+
+        if ignored is None:
+            ignored = {EVENT_TIMER, EVENT_ENGINE_STATS}
+        self.ignored: set[str] = ignored
+
+        self.file: BinaryIO = open(path, "wb", buffering=1024 * 1024)
+        self.file.write(MAGIC)
+        self.count: int = 0
+
+        self.event_engine.register_general(self.process_event)
+
+    def process_event(self, event: Event) -> None:
+        """"""
+        if event.type in self.ignored:
+            return
+
+        self.file.write(pack_record(time(), event))
+        self.count += 1
+
+    def close(self) -> None:
+        """
+        Stop recording and close journal file.
+        """
+        self.event_engine.unregister_general(self.process_event)
+        self.file.close()
+
+
+def load_journal(path: str | Path) -> Iterator[tuple[float, Event]]:
+    """
+    Load (record time, event) from journal file one by one.
+    """
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"Invalid journal file: {path}")
+
+        while True:
+            header: bytes = f.read(HEADER.size)
+            if len(header) < HEADER.size:
+                break
+
+            timestamp, kind, type_len, key_len, payload_len = HEADER.unpack(header)
+
+            body: bytes = f.read(type_len + key_len + payload_len)
+            if len(body) < type_len + key_len + payload_len:
+                break       # Journal file truncated while recording
+
+            type: str = body[:type_len].decode("utf-8")
+            key: str = body[type_len:type_len + key_len].decode("utf-8")
+            payload: memoryview = memoryview(body)[type_len + key_len:]
+
+            if kind:
+                data: Any = KIND_CODECS[kind].unpack(payload)
+            else:
+                data = pickle.loads(payload)
+
+            yield timestamp, Event(type, data, key)
+
+
+class EventReplayer:
+    """
+    Replay events from journal file into event engine, either at full
+    speed or with the original timing.
+    """
+
+    def __init__(self, event_engine: EventEngine, path: str | Path) -> None:
+        """"""
+        self.event_engine: EventEngine = event_engine
+        self.path: str | Path = path
+
+    def replay(self, speed: float = 0) -> tuple[int, float]:
+        """
+        Put all events in journal into event engine.
+
+        Speed 0 means as fast as possible, 1 means original timing,
+        and 2 means twice faster than original timing.
+
+        Return count of events and seconds cost.
+        """
+        count: int = 0
+        start: float = perf_counter()
+        first_time: float = 0
+
+        for timestamp, event in load_journal(self.path):
+            if speed:
+                if not first_time:
+                    first_time = timestamp
+
+                wait: float = (timestamp - first_time) / speed - (perf_counter() - start)
+                if wait > 0:
+                    sleep(wait)
+
+            self.event_engine.put(event)
+            count += 1
+
+        return count, perf_counter() - start
+
+
+class DataArchive:
+    """
+    Append-only log of data evicted from memory (e.g. finished orders
+    and trades of OmsEngine) in journal format, which can still be
+    queried from disk.
+
+    Data is saved as event of type with key of its vt id, and the last
+    one saved of the same key is the latest.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """"""
+        self.path: Path = Path(path)
+
+        self.file: BinaryIO = open(self.path, "ab", buffering=1024 * 1024)
+        if not self.file.tell():
+            self.file.write(MAGIC)
+
+        self.count: int = 0
+
+    def append(self, type: str, key: str, data: Any) -> None:
+        """"""
+        self.file.write(pack_record(time(), Event(type, data, key)))
+        self.count += 1
+
+    def query(self, type: str, filter: Callable[[Any], bool] | None = None) -> dict[str, Any]:
+        """
+        Query latest data of type by key, which matches filter if given.
+        """
+        self.file.flush()
+
+        result: dict[str, Any] = {}
+
+        for _, event in load_journal(self.path):
+            if event.type != type:
+                continue
+
+            # Data saved again later replaces the older one
+            result.pop(event.key, None)
+
+            if filter is None or filter(event.data):
+                result[event.key] = event.data
+
+        return result
+
+    def close(self) -> None:
+        """"""
+        self.file.close()
@@ -2,11 +2,19 @@
 Basic data structure used for general trading function in the trading platform.
 """
 
-from dataclasses import dataclass, field
-from datetime import datetime as Datetime
+from collections.abc import Iterator
+from dataclasses import dataclass, field, fields, make_dataclass
+from datetime import datetime as Datetime, tzinfo
+from sys import intern
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import numpy as np
 
 from .constant import Direction, Exchange, Interval, Offset, Status, Product, OptionType, OrderType
 
+if TYPE_CHECKING:
+    import polars as pl
+
 
 INFO: int = 20
 
@@ -14,6 +22,24 @@ INFO: int = 20
 ACTIVE_STATUSES = set([Status.SUBMITTING, Status.NOTTRADED, Status.PARTTRADED])
 
 
+# Cache of vt_symbol strings, so that data objects of the same symbol
+# share one string instead of formatting a new one each time
+VT_SYMBOLS: dict[tuple[str, Exchange], str] = {}
+
+
+def get_vt_symbol(symbol: str, exchange: Exchange) -> str:
+    """
+    Get cached vt_symbol of symbol and exchange.
+    """
+    vt_symbol: str | None = VT_SYMBOLS.get((symbol, exchange), None)
+
+    if vt_symbol is None:
+        vt_symbol = intern(f"{symbol}.{exchange.value}")
+        VT_SYMBOLS[(symbol, exchange)] = vt_symbol
+
+    return vt_symbol
+
+
 @dataclass
 class BaseData:
     """
@@ -81,7 +107,7 @@ class TickData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -105,7 +131,7 @@ class BarData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -131,8 +157,8 @@ class OrderData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_orderid: str = intern(f"{self.gateway_name}.{self.orderid}")
 
     def is_active(self) -> bool:
         """
@@ -170,8 +196,8 @@ class TradeData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
-        self.vt_orderid: str = f"{self.gateway_name}.{self.orderid}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
+        self.vt_orderid: str = intern(f"{self.gateway_name}.{self.orderid}")
         self.vt_tradeid: str = f"{self.gateway_name}.{self.tradeid}"
 
 
@@ -193,7 +219,7 @@ class PositionData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_positionid: str = f"{self.gateway_name}.{self.vt_symbol}.{self.direction.value}"
 
 
@@ -258,7 +284,7 @@ class ContractData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -284,7 +310,7 @@ class QuoteData(BaseData):
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
         self.vt_quoteid: str = f"{self.gateway_name}.{self.quoteid}"
 
     def is_active(self) -> bool:
@@ -314,7 +340,7 @@ class SubscribeRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -334,7 +360,7 @@ class OrderRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_order_data(self, orderid: str, gateway_name: str) -> OrderData:
         """
@@ -367,7 +393,7 @@ class CancelRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -384,7 +410,7 @@ class HistoryRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
 
 @dataclass
@@ -405,7 +431,7 @@ class QuoteRequest:
 
     def __post_init__(self) -> None:
         """"""
-        self.vt_symbol: str = f"{self.symbol}.{self.exchange.value}"
+        self.vt_symbol: str = get_vt_symbol(self.symbol, self.exchange)
 
     def create_quote_data(self, quoteid: str, gateway_name: str) -> QuoteData:
         """
@@ -425,3 +451,268 @@ class QuoteRequest:
             gateway_name=gateway_name,
         )
         return quote
+
+
+def make_slotted(data_class: type, *attributes: str) -> type:
+    """
+    Create a slotted variant of data class with the same constructor
+    and methods, whose objects have no per-instance __dict__ and so
+    take less memory and are faster to create.
+
+    Attributes set in __post_init__ (e.g. vt_symbol) must be given,
+    which are added as fields not in init, repr or comparison.
+    """
+    # Field spec is typed as Any, since field() is typed as its default
+    data_fields: list[tuple[str, Any, Any]] = [
+        (
+            f.name,
+            f.type,
+            field(
+                default=f.default,
+                default_factory=f.default_factory,
+                init=f.init,
+                repr=f.repr,
+                compare=f.compare
+            )
+        )
+        for f in fields(data_class)
+    ]
+
+    for name in attributes:
+        data_fields.append((name, str, field(default="", init=False, repr=False, compare=False)))
+
+    # Methods defined by data class and its bases, except those
+    # generated by dataclass
+    namespace: dict = {}
+
+    for cls in reversed(data_class.__mro__[:-1]):
+        for name, value in cls.__dict__.items():
+            if callable(value) and (not name.startswith("__") or name == "__post_init__"):
+                namespace[name] = value
+
+    namespace["__doc__"] = data_class.__doc__
+
+    slotted_class: type = make_dataclass(
+        "Slotted" + data_class.__name__,
+        data_fields,
+        namespace=namespace,
+        slots=True
+    )
+    slotted_class.__module__ = __name__
+    return slotted_class
+
+
+SlottedTickData: type = make_slotted(TickData, "vt_symbol")
+SlottedBarData: type = make_slotted(BarData, "vt_symbol")
+SlottedOrderData: type = make_slotted(OrderData, "vt_symbol", "vt_orderid")
+
+
+class DataView:
+    """
+    Lazy view of one row in data batch, which has the same attributes
+    as data object but only reads them from columns when accessed.
+    """
+
+    __slots__ = ("_batch", "_ix")
+
+    def __init__(self, batch: "DataBatch", ix: int) -> None:
+        """"""
+        self._batch: DataBatch = batch
+        self._ix: int = ix
+
+    def __getattr__(self, name: str) -> Any:
+        """"""
+        return self._batch.get_value(name, self._ix)
+
+    def __repr__(self) -> str:
+        """"""
+        return f"{self._batch.data_class.__name__}View({self.to_data()})"
+
+    def to_data(self) -> Any:
+        """
+        Create data object of this row.
+        """
+        return self._batch.create_data(self._ix)
+
+
+BatchType = TypeVar("BatchType", bound="DataBatch")
+
+
+class DataBatch:
+    """
+    Columnar batch of data objects of one symbol backed by numpy
+    arrays, which is sliced without copying and iterated as lazy
+    views of data object.
+
+    Datetime column saves wall time without timezone, and timezone of
+    the batch is attached when datetime is read.
+    """
+
+    data_class: type = BaseData
+    columns: dict[str, str] = {}            # column name: numpy dtype
+    attributes: list[str] = []              # attributes shared by all data
+
+    def __init__(
+        self,
+        data: dict[str, np.ndarray],
+        tz: tzinfo | None = None,
+        **attributes: Any
+    ) -> None:
+        """
+        Columns not given in data are filled with zero.
+        """
+        size: int = len(next(iter(data.values()))) if data else 0
+
+        self.data: dict[str, np.ndarray] = {}
+        for name, dtype in self.columns.items():
+            if name in data:
+                self.data[name] = np.asarray(data[name], dtype=dtype)
+            else:
+                self.data[name] = np.zeros(size, dtype=dtype)
+
+        self.tz: tzinfo | None = tz
+        self.values: dict[str, Any] = {name: attributes[name] for name in self.attributes}
+        self.vt_symbol: str = get_vt_symbol(self.values["symbol"], self.values["exchange"])
+
+    @classmethod
+    def from_data(cls: type[BatchType], data_list: list, **attributes: Any) -> BatchType:
+        """
+        Create batch from data objects, attributes are taken from the
+        first data if not given.
+        """
+        for name in cls.attributes:
+            if name not in attributes:
+                if not data_list:
+                    raise ValueError(f"Attribute {name} must be given for empty data list")
+                attributes[name] = getattr(data_list[0], name)
+
+        tz: tzinfo | None = data_list[0].datetime.tzinfo if data_list else None
+
+        data: dict[str, np.ndarray] = {}
+        for name, dtype in cls.columns.items():
+            if name == "datetime":
+                values: list = [d.datetime.replace(tzinfo=None) for d in data_list]
+            else:
+                values = [getattr(d, name) for d in data_list]
+            data[name] = np.array(values, dtype=dtype)
+
+        return cls(data, tz, **attributes)
+
+    @classmethod
+    def from_polars(
+        cls: type[BatchType],
+        df: "pl.DataFrame",
+        tz: tzinfo | None = None,
+        **attributes: Any
+    ) -> BatchType:
+        """
+        Create batch from polars DataFrame with columns named as data
+        attributes, missing columns are filled with zero.
+        """
+        data: dict[str, np.ndarray] = {
+            name: df[name].to_numpy() for name in cls.columns if name in df.columns
+        }
+        return cls(data, tz, **attributes)
+
+    def to_polars(self) -> "pl.DataFrame":
+        """
+        Convert to polars DataFrame, which is also the way to Arrow.
+        """
+        import polars as pl
+
+        return pl.DataFrame(self.data)
+
+    def to_list(self) -> list:
+        """
+        Create data objects of all rows.
+        """
+        return [self.create_data(ix) for ix in range(len(self))]
+
+    def create_data(self, ix: int) -> Any:
+        """"""
+        kwargs: dict = {name: self.get_value(name, ix) for name in self.data}
+        kwargs.update(self.values)
+        return self.data_class(**kwargs)
+
+    def get_value(self, name: str, ix: int) -> Any:
+        """
+        Get value of attribute in row.
+        """
+        column: np.ndarray | None = self.data.get(name, None)
+
+        if column is None:
+            try:
+                return self.values[name] if name != "vt_symbol" else self.vt_symbol
+            except KeyError:
+                raise AttributeError(name) from None
+
+        value: Any = column.item(ix)
+        if name == "datetime" and self.tz:
+            value = value.replace(tzinfo=self.tz)
+        return value
+
+    def __len__(self) -> int:
+        """"""
+        return len(self.data["datetime"])
+
+    def __getitem__(self, key: Any) -> Any:
+        """
+        Get view of row by index, or batch of rows by slice (without
+        copy) or boolean mask.
+        """
+        if isinstance(key, (int, np.integer)):
+            size: int = len(self)
+            if key < 0:
+                key += size
+            if not 0 <= key < size:
+                raise IndexError("batch index out of range")
+            return DataView(self, int(key))
+
+        data: dict[str, np.ndarray] = {name: column[key] for name, column in self.data.items()}
+        return type(self)(data, self.tz, **self.values)
+
+    def __iter__(self) -> Iterator[DataView]:
+        """"""
+        for ix in range(len(self)):
+            yield DataView(self, ix)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        """
+        Get column array by attribute name.
+        """
+        data: dict | None = self.__dict__.get("data", None)
+
+        if data and name in data:
+            return data[name]   # type: ignore
+        raise AttributeError(name)
+
+
+class BarBatch(DataBatch):
+    """
+    Columnar batch of bar data of one symbol and interval.
+    """
+
+    data_class: type = BarData
+    columns: dict[str, str] = {
+        "datetime": "datetime64[us]",
+        "volume": "float64",
+        "turnover": "float64",
+        "open_interest": "float64",
+        "open_price": "float64",
+        "high_price": "float64",
+        "low_price": "float64",
+        "close_price": "float64",
+    }
+    attributes: list[str] = ["symbol", "exchange", "interval", "gateway_name"]
+
+
+class TickBatch(DataBatch):
+    """
+    Columnar batch of tick data of one symbol.
+    """
+
+    data_class: type = TickData
+    columns: dict[str, str] = {"datetime": "datetime64[us]"} | {
+        f.name: "float64" for f in fields(TickData) if f.type is float
+    }
+    attributes: list[str] = ["symbol", "exchange", "name", "gateway_name"]
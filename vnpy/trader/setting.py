@@ -34,7 +34,13 @@ SETTINGS: dict = {
     "database.host": "",
     "database.port": 0,
     "database.user": "",
-    "database.password": ""
+    "database.password": "",
+
+    "event.lanes": {},
+
+    "oms.retention_count": 0,
+    "oms.retention_seconds": 0,
+    "oms.archive": ""
 }
 
 